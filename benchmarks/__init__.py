@@ -0,0 +1,6 @@
+"""
+    linkedin-api benchmarks
+
+Micro-benchmarks for the CPU-bound parsing and pagination paths of
+``linkedin_api``. Run with ``python -m benchmarks --help``.
+"""
@@ -0,0 +1,84 @@
+"""
+Run the benchmarks.
+
+Usage::
+
+    python -m benchmarks                    # run everything, compare with baselines
+    python -m benchmarks -k experiences     # only cases whose name contains "experiences"
+    python -m benchmarks --size 10000       # override the synthetic payload size
+    python -m benchmarks --save-baseline    # record results as the new baselines
+    python -m benchmarks --check            # exit 1 on regressions past --tolerance
+"""
+
+import argparse
+import logging
+import sys
+
+from benchmarks.cases import get_cases
+from benchmarks.runner import (
+    Result,
+    compare,
+    format_row,
+    load_baselines,
+    measure,
+    save_baselines,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="keyword", help="only run matching cases")
+    parser.add_argument("--size", type=int, help="synthetic payload size")
+    parser.add_argument(
+        "--min-time", type=float, default=1.0, help="seconds to time each case"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store results as baselines"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="fail when a case regresses"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown/memory growth for --check",
+    )
+    args = parser.parse_args(argv)
+
+    # The library logs every page it fetches at DEBUG level.
+    logging.disable(logging.INFO)
+
+    baselines = load_baselines()
+    results = []
+    regressions = []
+    for case in get_cases(size=args.size):
+        if args.keyword and args.keyword not in case.name:
+            continue
+        fn = case.setup(case.size)
+        if fn is None:
+            print(f"{case.name:<48} skipped (no recorded payload)")
+            continue
+        stats = measure(fn, min_time=args.min_time)
+        result = Result(case.name, case.size, **stats)
+        results.append(result)
+
+        delta = compare(result, baselines.get(case.name))
+        print(format_row(result, delta), flush=True)
+        if delta and (
+            delta["speed"] < -args.tolerance or delta["memory"] > args.tolerance
+        ):
+            regressions.append(case.name)
+
+    if args.save_baseline:
+        save_baselines(results)
+        print(f"Saved {len(results)} baseline(s).")
+
+    if args.check and regressions:
+        print(f"Regressed: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
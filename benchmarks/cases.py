@@ -0,0 +1,170 @@
+"""
+Benchmark cases.
+
+Each case is built by a ``setup`` function that prepares its payload once and
+returns a zero-argument callable running the code under test. Network access
+is replaced by replaying the prepared payload, so only parsing is measured.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from linkedin_api import Linkedin
+from linkedin_api.utils.helpers import (
+    get_list_posts_sorted_without_promoted,
+    parse_list_raw_posts,
+    parse_list_raw_urns,
+)
+
+from benchmarks import payloads
+
+Case = namedtuple("Case", ["name", "size", "setup"])
+
+BASE_URL = "https://www.linkedin.com"
+
+
+class ReplayResponse(object):
+    """Stand-in for ``requests.Response`` serving a prepared payload."""
+
+    def __init__(self, payload=None, text="", status_code=200, headers=None):
+        self._payload = payload
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+class ReplaySession(object):
+    """Stand-in for ``requests.Session`` answering every GET with one response."""
+
+    def __init__(self, response: ReplayResponse):
+        self.response = response
+        self.headers = {"user-agent": "linkedin-api-benchmarks"}
+
+    def get(self, url, **kwargs):
+        return self.response
+
+
+class ReplayClient(object):
+    """Stand-in for ``linkedin_api.client.Client`` backed by a ``ReplaySession``."""
+
+    LINKEDIN_BASE_URL = BASE_URL
+    API_BASE_URL = f"{BASE_URL}/voyager/api"
+
+    def __init__(self, response: ReplayResponse):
+        self.session = ReplaySession(response)
+        self.metadata = {}
+
+    @contextmanager
+    def request_slot(self):
+        yield
+
+
+def replay_api(payload=None, text="") -> Linkedin:
+    """Return an unauthenticated ``Linkedin`` whose requests replay ``payload``."""
+    api = Linkedin("", "", authenticate=False)
+    response = ReplayResponse(payload=payload, text=text)
+    api.client = ReplayClient(response)
+    api._fetch = lambda *args, **kwargs: response
+    return api
+
+
+def _parse_list_raw_posts(size: int) -> Callable:
+    l_raw_posts, _ = payloads.feed_posts(size)
+    return lambda: parse_list_raw_posts(l_raw_posts, BASE_URL)
+
+
+def _get_list_posts_sorted_without_promoted(size: int) -> Callable:
+    l_raw_posts, l_raw_urns = payloads.feed_posts(size)
+    l_posts = payloads.shuffled(parse_list_raw_posts(l_raw_posts, BASE_URL))
+    l_urns = parse_list_raw_urns(l_raw_urns)
+    # the function filters ``l_posts`` in place, so hand it a fresh list each run
+    return lambda: get_list_posts_sorted_without_promoted(l_urns, list(l_posts))
+
+
+def _search(size: int) -> Callable:
+    api = replay_api(payloads.search_clusters(size))
+    return lambda: api.search({}, limit=size)
+
+
+def _search_people(size: int) -> Callable:
+    api = replay_api(payloads.search_clusters(size))
+    return lambda: api.search_people(limit=size, include_private_profiles=True)
+
+
+def _get_profile_experiences(size: int) -> Callable:
+    api = replay_api(payloads.profile_experiences(size, filler=size))
+    return lambda: api.get_profile_experiences(payloads.profile_id(0))
+
+
+def _get_conversations_v3(size: int) -> Callable:
+    api = replay_api(payloads.conversations(size))
+    return lambda: api.get_conversations_v3(payloads.MAILBOX_URN)
+
+
+def _resolve_public_id_to_urn(size: int) -> Callable:
+    api = replay_api(text=payloads.profile_html(size, public_id="billy-g"))
+    return lambda: api._resolve_public_id_to_urn("billy-g")
+
+
+def _captured(builder: Callable, run: Callable) -> Callable[[int], Optional[Callable]]:
+    def setup(size: int) -> Optional[Callable]:
+        payload = builder(payloads.load_captures())
+        if payload is None:
+            return None
+        return run(replay_api(payload))
+
+    return setup
+
+
+SYNTHETIC_SETUPS: Dict[str, Callable[[int], Callable]] = {
+    "helpers.parse_list_raw_posts": _parse_list_raw_posts,
+    "helpers.get_list_posts_sorted_without_promoted": _get_list_posts_sorted_without_promoted,
+    "Linkedin.search": _search,
+    "Linkedin.search_people": _search_people,
+    "Linkedin.get_profile_experiences": _get_profile_experiences,
+    "Linkedin.get_conversations_v3": _get_conversations_v3,
+    "Linkedin._resolve_public_id_to_urn": _resolve_public_id_to_urn,
+}
+
+# These two are quadratic in their input today; keep their default size in
+# the same ballpark of run time as the other cases.
+DEFAULT_SIZES: Dict[str, int] = {
+    "helpers.get_list_posts_sorted_without_promoted": 10_000,
+    "Linkedin.get_profile_experiences": 10_000,
+}
+
+CAPTURED_SETUPS: Dict[str, Callable[[int], Optional[Callable]]] = {
+    "capture.get_conversations_v3": _captured(
+        payloads.captured_conversations,
+        lambda api: lambda: api.get_conversations_v3(payloads.MAILBOX_URN),
+    ),
+    "capture.get_profile_v2": _captured(
+        payloads.captured_profile,
+        lambda api: lambda: api.get_profile_v2(urn_id=payloads.MAILBOX_URN),
+    ),
+}
+
+
+def get_cases(size: Optional[int] = None, default_size: int = 100_000) -> List[Case]:
+    """Return every benchmark case.
+
+    :param size: Number of elements for every synthetic case. Defaults to each
+        case's own default size.
+    :type size: int, optional
+    :param default_size: Size for synthetic cases without their own default
+    :type default_size: int, optional
+
+    :return: List of cases
+    :rtype: list
+    """
+    cases = []
+    for name, setup in SYNTHETIC_SETUPS.items():
+        case_size = size or DEFAULT_SIZES.get(name, default_size)
+        cases.append(Case(name, case_size, setup))
+    for name, setup in CAPTURED_SETUPS.items():
+        cases.append(Case(name, 1, setup))
+    return cases
@@ -0,0 +1,386 @@
+"""
+Synthetic and recorded Voyager payloads used by the benchmarks.
+
+Synthetic builders mirror the shape of real responses closely enough for the
+parsers in ``linkedin_api`` to walk every branch they would in production,
+while letting us scale the number of elements freely. Recorded samples come
+from ``voyager-captures.json`` at the repository root.
+"""
+
+import json
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+CAPTURES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "voyager-captures.json",
+)
+
+MAILBOX_URN = "ACoAABMCK14BZYQEFee5Ir7zBXRulzkHn_aCgio"
+
+_SEED = 1337
+
+
+def profile_id(i: int) -> str:
+    """Return a deterministic, URN-shaped profile ID for index ``i``."""
+    return f"ACoAA{i:010d}B"
+
+
+def feed_posts(n: int, promoted_every: int = 10) -> Tuple[List[Dict], List[str]]:
+    """Return ``(l_raw_posts, l_raw_urns)`` as found in a ``/feed/updatesV2`` page.
+
+    :param n: Number of posts
+    :type n: int
+    :param promoted_every: Mark every n-th post as promoted
+    :type promoted_every: int, optional
+
+    :return: Raw ``included`` post dicts and raw ``*elements`` URNs
+    :rtype: (list, list)
+    """
+    l_raw_posts = []
+    l_raw_urns = []
+    for i in range(n):
+        activity = f"urn:li:activity:{7000000000000000000 + i}"
+        l_raw_urns.append(
+            f"urn:li:fs_updateV2:({activity},MAIN_FEED,EMPTY,DEFAULT,false)"
+        )
+        l_raw_posts.append(
+            {
+                "actor": {
+                    "name": {"text": f"Author {i}"},
+                    "urn": f"urn:li:member:{100000 + i}",
+                    "subDescription": {
+                        "text": "Promoted" if i % promoted_every == 0 else "2 mo"
+                    },
+                },
+                "commentary": {"text": {"text": f"Post body number {i}"}},
+                "updateMetadata": {"urn": activity},
+            }
+        )
+    return l_raw_posts, l_raw_urns
+
+
+def shuffled(items: List, seed: int = _SEED) -> List:
+    """Return a deterministically shuffled copy of ``items``."""
+    items = list(items)
+    random.Random(seed).shuffle(items)
+    return items
+
+
+def search_clusters(n: int, per_cluster: int = 10) -> Dict:
+    """Return a ``voyagerSearchDashClusters`` response holding ``n`` entity results.
+
+    :param n: Number of entity results
+    :type n: int
+    :param per_cluster: Number of items per search cluster
+    :type per_cluster: int, optional
+
+    :return: Decoded response payload
+    :rtype: dict
+    """
+    clusters = []
+    items: List[Dict] = []
+    for i in range(n):
+        profile_urn = f"urn:li:fsd_profile:{profile_id(i)}"
+        items.append(
+            {
+                "_type": "com.linkedin.voyager.dash.search.SearchItem",
+                "item": {
+                    "entityResult": {
+                        "_type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+                        "entityUrn": f"urn:li:fsd_entityResultViewModel:({profile_urn},SEARCH_SRP,DEFAULT)",
+                        "trackingUrn": f"urn:li:member:{100000 + i}",
+                        "title": {"text": f"Person {i}"},
+                        "primarySubtitle": {"text": "Software Engineer"},
+                        "secondarySubtitle": {"text": "Sydney, Australia"},
+                        "entityCustomTrackingInfo": {
+                            "memberDistance": (
+                                "OUT_OF_NETWORK" if i % 7 == 0 else "DISTANCE_2"
+                            )
+                        },
+                    }
+                },
+            }
+        )
+        if len(items) == per_cluster or i == n - 1:
+            # every cluster also carries a non-entity item, as real pages do
+            items.append(
+                {
+                    "_type": "com.linkedin.voyager.dash.search.SearchItem",
+                    "item": {"entityResult": None},
+                }
+            )
+            clusters.append(
+                {
+                    "_type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+                    "items": items,
+                }
+            )
+            items = []
+    return {
+        "data": {
+            "searchDashClustersByAll": {
+                "_type": "com.linkedin.restli.common.CollectionResponse",
+                "elements": clusters,
+                "paging": {"count": n, "start": 0, "total": n},
+            }
+        }
+    }
+
+
+def _experience_component(
+    title: str, subtitle: Optional[str], caption: str, description: Optional[str]
+) -> Dict:
+    sub_components = None
+    if description is not None:
+        sub_components = {
+            "components": [
+                {
+                    "components": {
+                        "fixedListComponent": {
+                            "components": [
+                                {
+                                    "components": {
+                                        "textComponent": {"text": {"text": description}}
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            ]
+        }
+    return {
+        "components": {
+            "entityComponent": {
+                "titleV2": {"text": {"text": title}},
+                "subtitle": {"text": subtitle} if subtitle else None,
+                "metadata": {"text": "Sydney, New South Wales, Australia"},
+                "caption": {"text": caption},
+                "subComponents": sub_components,
+            }
+        }
+    }
+
+
+def profile_experiences(
+    n: int, group_every: int = 5, positions_per_group: int = 3, filler: int = 0
+) -> Dict:
+    """Return a profile-components ``experience`` response with ``n`` top-level items.
+
+    Every ``group_every``-th item is a position group (a company with several
+    positions) whose entries live in a separate ``included`` entity, which is
+    what makes the group lookup expensive.
+
+    :param n: Number of top-level experience items
+    :type n: int
+    :param group_every: Make every n-th item a position group
+    :type group_every: int, optional
+    :param positions_per_group: Number of positions inside each group
+    :type positions_per_group: int, optional
+    :param filler: Number of unrelated ``included`` entities to add
+    :type filler: int, optional
+
+    :return: Decoded response payload
+    :rtype: dict
+    """
+    owner = profile_id(0)
+    elements = []
+    groups = []
+    for i in range(n):
+        if i % group_every == 0:
+            group_urn = f"urn:li:fsd_profilePositionGroup:({owner},G{i})"
+            paged_urn = (
+                f"urn:li:fsd_profilePagedListComponent:({owner},"
+                f"EXPERIENCE-VIEW-DETAILS,{group_urn},NONE,en_US)"
+            )
+            elements.append(
+                {
+                    "components": {
+                        "entityComponent": {
+                            "titleV2": {"text": {"text": f"Company {i}"}},
+                            "subtitle": {"text": "Full-time · 6 yrs"},
+                            "metadata": None,
+                            "caption": {"text": "Sydney, Australia"},
+                            "subComponents": {
+                                "components": [
+                                    {"components": {"*pagedListComponent": paged_urn}}
+                                ]
+                            },
+                        }
+                    }
+                }
+            )
+            groups.append(
+                {
+                    "entityUrn": paged_urn,
+                    "components": {
+                        "elements": [
+                            _experience_component(
+                                f"Role {i}.{j}",
+                                "Full-time",
+                                "Jan 2018 - Dec 2019 · 2 yrs",
+                                f"Worked on thing {j}",
+                            )
+                            for j in range(positions_per_group)
+                        ]
+                    },
+                }
+            )
+            continue
+
+        elements.append(
+            _experience_component(
+                f"Engineer {i}",
+                f"Company {i} · Full-time",
+                "Jan 2020 - Present · 4 yrs 2 mos",
+                f"Description for position {i}" if i % 2 else None,
+            )
+        )
+
+    included = [{"components": {"elements": elements}}]
+    included.extend(groups)
+    included.extend(
+        {"entityUrn": f"urn:li:fsd_profileCard:({owner},FILLER{i},en_US)"}
+        for i in range(filler)
+    )
+    return {"included": included}
+
+
+def _member(i: int) -> Dict:
+    return {
+        "profileUrl": f"https://www.linkedin.com/in/{profile_id(i)}",
+        "firstName": {"text": f"First{i}"},
+        "lastName": {"text": f"Last{i}"},
+        "headline": {"text": f"Headline of participant {i}"},
+    }
+
+
+def conversations(n: int, participants: int = 2) -> Dict:
+    """Return a ``messengerConversationsBySearchCriteria`` page with ``n`` conversations.
+
+    :param n: Number of conversations
+    :type n: int
+    :param participants: Participants per conversation, excluding the mailbox owner
+    :type participants: int, optional
+
+    :return: Decoded response payload
+    :rtype: dict
+    """
+    me = f"urn:li:fsd_profile:{MAILBOX_URN}"
+    elements = []
+    for i in range(n):
+        thread = f"2-THREAD{i:08d}=="
+        people = [{"hostIdentityUrn": me, "participantType": {"member": _member(-1)}}]
+        for j in range(participants):
+            other = i * participants + j
+            people.append(
+                {
+                    "hostIdentityUrn": f"urn:li:fsd_profile:{profile_id(other)}",
+                    "participantType": {"member": _member(other)},
+                }
+            )
+        sender = people[1 + i % participants]["hostIdentityUrn"] if i % 3 else me
+        elements.append(
+            {
+                "entityUrn": f"urn:li:msg_conversation:({me},{thread})",
+                "backendUrn": f"urn:li:messagingThread:{thread}",
+                "read": bool(i % 4),
+                "unreadCount": 0 if i % 4 else 1,
+                "lastActivityAt": 1770000000000 + i,
+                "conversationParticipants": people,
+                "messages": {
+                    "elements": [
+                        {
+                            "body": {"text": f"Last message in thread {i}"},
+                            "sender": {"hostIdentityUrn": sender},
+                            "deliveredAt": 1770000000000 + i,
+                        }
+                    ]
+                },
+            }
+        )
+    return {
+        "data": {
+            "messengerConversationsBySearchCriteria": {
+                "elements": elements,
+                "metadata": {"nextCursor": "MCY1"},
+            }
+        }
+    }
+
+
+def profile_html(n: int, public_id: str = "billy-g") -> str:
+    """Return a profile page with ``n`` ``<code>`` data blocks.
+
+    The block describing ``public_id`` is placed last so the scanner has to
+    walk (and unescape) every block before it.
+
+    :param n: Number of ``<code>`` blocks
+    :type n: int
+    :param public_id: Public ID embedded in the target block
+    :type public_id: str, optional
+
+    :return: HTML document
+    :rtype: str
+    """
+    parts = ["<!DOCTYPE html><html><head><title>LinkedIn</title></head><body>"]
+    for i in range(n - 1):
+        parts.append(
+            f'<code style="display: none" id="bpr-guid-{i}">'
+            f"{{&quot;data&quot;:{{&quot;entityUrn&quot;:&quot;urn:li:fsd_profile:"
+            f"{profile_id(i + 1)}&quot;,&quot;publicIdentifier&quot;:&quot;"
+            f"someone-{i}&quot;,&quot;headline&quot;:&quot;Filler &amp; more"
+            f"&quot;}}}}</code>"
+        )
+    parts.append(
+        f'<code style="display: none" id="bpr-guid-{n}">'
+        f"{{&quot;data&quot;:{{&quot;*elements&quot;:[&quot;urn:li:fsd_profile:"
+        f"{profile_id(n + 1)}&quot;],&quot;entityUrn&quot;:&quot;"
+        f"urn:li:fsd_profile:{profile_id(0)}&quot;,&quot;publicIdentifier&quot;"
+        f":&quot;{public_id}&quot;}}}}</code>"
+    )
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def load_captures(path: str = CAPTURES_PATH) -> List[Dict]:
+    """Load recorded Voyager traffic, or an empty list if it is not available."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def captured_payload(captures: List[Dict], url_fragment: str) -> Optional[Dict]:
+    """Return the first decoded response body whose URL contains ``url_fragment``."""
+    for capture in captures:
+        body = capture.get("response_body")
+        if body and url_fragment in capture.get("url", ""):
+            try:
+                return json.loads(body)
+            except ValueError:
+                continue
+    return None
+
+
+def captured_conversations(captures: List[Dict]) -> Optional[Dict]:
+    """Return the recorded conversation list, keyed as ``get_conversations_v3`` expects.
+
+    The capture was taken with the sync-token flavour of the query, whose
+    elements share the shape of ``messengerConversationsBySearchCriteria``.
+    """
+    payload = captured_payload(captures, "queryId=messengerConversations.")
+    if not payload:
+        return None
+    raw = payload.get("data", {}).get("messengerConversationsBySyncToken")
+    if not raw:
+        return None
+    return {"data": {"messengerConversationsBySearchCriteria": raw}}
+
+
+def captured_profile(captures: List[Dict]) -> Optional[Dict]:
+    """Return the recorded ``FullProfile-76`` response used by ``get_profile_v2``."""
+    return captured_payload(captures, "FullProfile-76")
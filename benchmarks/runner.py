@@ -0,0 +1,120 @@
+"""
+Timing, memory measurement and baseline comparison for benchmark cases.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional
+
+BASELINES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines.json"
+)
+
+Result = namedtuple("Result", ["name", "size", "ops_per_sec", "peak_bytes", "runs"])
+
+
+def measure(fn: Callable, min_time: float = 1.0, max_runs: int = 1000) -> Dict:
+    """Time ``fn`` and record its peak traced memory.
+
+    ``fn`` is called once for warm-up, once under ``tracemalloc`` to capture
+    peak allocations, then repeatedly until ``min_time`` seconds have elapsed
+    (or ``max_runs`` runs have been made). Timing runs are not traced, as
+    tracing slows allocation-heavy code considerably.
+
+    :param fn: Zero-argument callable to measure
+    :type fn: callable
+    :param min_time: Minimum total timed duration, in seconds
+    :type min_time: float, optional
+    :param max_runs: Maximum number of timed runs
+    :type max_runs: int, optional
+
+    :return: Dict with ``ops_per_sec``, ``peak_bytes`` and ``runs``
+    :rtype: dict
+    """
+    fn()
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    runs = 0
+    elapsed = 0.0
+    while runs < max_runs and (runs == 0 or elapsed < min_time):
+        start = time.perf_counter()
+        fn()
+        elapsed += time.perf_counter() - start
+        runs += 1
+
+    return {
+        "ops_per_sec": runs / elapsed if elapsed else float("inf"),
+        "peak_bytes": peak_bytes,
+        "runs": runs,
+    }
+
+
+def load_baselines(path: str = BASELINES_PATH) -> Dict[str, Dict]:
+    """Load stored baselines, keyed by case name."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(results: List[Result], path: str = BASELINES_PATH):
+    """Merge ``results`` into the stored baselines."""
+    baselines = load_baselines(path)
+    for result in results:
+        baselines[result.name] = {
+            "size": result.size,
+            "ops_per_sec": round(result.ops_per_sec, 4),
+            "peak_bytes": result.peak_bytes,
+        }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(result: Result, baseline: Optional[Dict]) -> Optional[Dict]:
+    """Compare a result with its baseline.
+
+    Results are only comparable with a baseline recorded at the same size.
+
+    :return: Dict with relative ``speed`` and ``memory`` changes (``0.1`` means
+        10% faster / 10% more memory), or None if there is no comparable baseline
+    :rtype: dict
+    """
+    if not baseline or baseline.get("size") != result.size:
+        return None
+    speed = result.ops_per_sec / baseline["ops_per_sec"] - 1
+    memory = (
+        result.peak_bytes / baseline["peak_bytes"] - 1
+        if baseline.get("peak_bytes")
+        else 0.0
+    )
+    return {"speed": speed, "memory": memory}
+
+
+def _format_bytes(n: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def format_row(result: Result, delta: Optional[Dict]) -> str:
+    """Format one result as a line of the report."""
+    change = "no baseline"
+    if delta is not None:
+        change = f"{delta['speed']:+.1%} speed, {delta['memory']:+.1%} memory"
+    return (
+        f"{result.name:<48} {result.size:>8} {result.ops_per_sec:>12.2f} ops/s "
+        f"{_format_bytes(result.peak_bytes):>11} peak   {change}"
+    )
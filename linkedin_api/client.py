@@ -1,8 +1,13 @@
 import requests
 import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional
 from linkedin_api.cookie_repository import CookieRepository
+from linkedin_api.scheduler import RateLimiter
 from bs4 import BeautifulSoup, Tag
 from requests.cookies import RequestsCookieJar
+from requests.structures import CaseInsensitiveDict
 import json
 
 logger = logging.getLogger(__name__)
@@ -19,6 +24,11 @@ class UnauthorizedException(Exception):
 class Client(object):
     """
     Class to act as a client for the Linkedin API.
+
+    A client may be shared between threads. Each thread gets its own
+    ``requests`` session (sessions are not thread-safe), but all of them share
+    one cookie jar and one set of headers, so authenticating or refreshing
+    cookies from any thread applies to every thread.
     """
 
     # Settings for general Linkedin API calls
@@ -49,15 +59,32 @@ class Client(object):
     }
 
     def __init__(
-        self, *, debug=False, refresh_cookies=False, proxies={}, cookies_dir: str = "", useragent: str = None
+        self,
+        *,
+        debug=False,
+        refresh_cookies=False,
+        proxies={},
+        cookies_dir: str = "",
+        useragent: str = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
     ):
-        self.session = requests.session()
-        self.session.proxies.update(proxies)
+        # Guards cookies, headers and metadata
+        self.lock = threading.RLock()
+        self._local = threading.local()
+        self._cookies = RequestsCookieJar()
         # Update REQUEST_HEADERS with useragent if provided
         headers = Client.REQUEST_HEADERS.copy()
         if useragent:
             headers["user-agent"] = useragent
-        self.session.headers.update(headers)
+        self._headers = CaseInsensitiveDict(requests.utils.default_headers())
+        self._headers.update(headers)
+        self._request_slots = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        self.rate_limiter = (
+            RateLimiter(requests_per_minute) if requests_per_minute else None
+        )
         self.proxies = proxies
         self.logger = logger
         self.metadata = {}
@@ -79,31 +106,69 @@ class Client(object):
         )
         return res.cookies
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        Return the session of the calling thread.
+
+        Sessions are created lazily, one per thread, and always point at the
+        client's current cookie jar and headers.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.session()
+            session.proxies.update(self.proxies)
+            self._local.session = session
+        if session.cookies is not self._cookies:
+            session.cookies = self._cookies
+        if session.headers is not self._headers:
+            session.headers = self._headers
+        return session
+
+    @contextmanager
+    def request_slot(self):
+        """
+        Hold one of the ``max_concurrency`` request slots for the duration of a request.
+
+        Waits for the shared ``requests_per_minute`` budget first, if one is set.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self._request_slots is None:
+            yield
+            return
+        with self._request_slots:
+            yield
+
     def _set_session_cookies(self, cookies: RequestsCookieJar):
         """
         Set cookies of the current session and save them to a file named as the username.
         """
-        self.session.cookies = cookies
-        self.session.headers["csrf-token"] = self.session.cookies["JSESSIONID"].strip(
-            '"'
-        )
+        with self.lock:
+            # Headers are replaced rather than mutated, as other threads may be
+            # iterating over them while sending a request.
+            headers = CaseInsensitiveDict(self._headers)
+            headers["csrf-token"] = cookies["JSESSIONID"].strip('"')
+            self._cookies = cookies
+            self._headers = headers
 
     @property
     def cookies(self):
-        return self.session.cookies
+        return self._cookies
 
     def authenticate(self, username: str, password: str):
-        if self._use_cookie_cache:
-            self.logger.debug("Attempting to use cached cookies")
-            cookies = self._cookie_repository.get(username)
-            if cookies:
-                self.logger.debug("Using cached cookies")
-                self._set_session_cookies(cookies)
-                self._fetch_metadata()
-                return
-
-        self._do_authentication_request(username, password)
-        self._fetch_metadata()
+        with self.lock:
+            if self._use_cookie_cache:
+                self.logger.debug("Attempting to use cached cookies")
+                cookies = self._cookie_repository.get(username)
+                if cookies:
+                    self.logger.debug("Using cached cookies")
+                    self._set_session_cookies(cookies)
+                    self._fetch_metadata()
+                    return
+
+            self._do_authentication_request(username, password)
+            self._fetch_metadata()
 
     def _fetch_metadata(self):
         """
@@ -119,6 +184,7 @@ class Client(object):
         )
 
         soup = BeautifulSoup(res.text, "lxml")
+        metadata = {}
 
         clientApplicationInstanceRaw = soup.find(
             "meta", attrs={"name": "applicationInstance"}
@@ -130,14 +196,17 @@ class Client(object):
                 "content", {}
             )
             clientApplicationInstance = json.loads(clientApplicationInstanceRaw)
-            self.metadata["clientApplicationInstance"] = clientApplicationInstance
+            metadata["clientApplicationInstance"] = clientApplicationInstance
 
         clientPageInstanceIdRaw = soup.find(
             "meta", attrs={"name": "clientPageInstanceId"}
         )
         if clientPageInstanceIdRaw and isinstance(clientPageInstanceIdRaw, Tag):
             clientPageInstanceId = clientPageInstanceIdRaw.attrs.get("content", {})
-            self.metadata["clientPageInstanceId"] = clientPageInstanceId
+            metadata["clientPageInstanceId"] = clientPageInstanceId
+
+        with self.lock:
+            self.metadata.update(metadata)
 
     def _do_authentication_request(self, username: str, password: str):
         """
@@ -0,0 +1,146 @@
+"""
+Parsing of the profile components ``experience`` section.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+_POSITION_GROUP_PATTERN = re.compile(
+    r"urn:li:fsd_profilePositionGroup:\([A-z0-9]+,[A-z0-9]+\)"
+)
+_SEPARATOR = " · "
+_DATE_SEPARATOR = " - "
+
+
+def parse_experience_item(item: Dict, is_group_item: bool = False) -> Dict:
+    """Parse a single experience item.
+
+    Items as part of an 'experience group' (e.g. a company with multiple
+    positions) have different data structures. Therefore, some exceptions
+    need to be made when parsing these items.
+    """
+    component = item["components"]["entityComponent"]
+    subtitle = component["subtitle"]
+    subtitle_parts = subtitle["text"].split(_SEPARATOR) if subtitle else None
+    company = subtitle_parts[0] if subtitle_parts else None
+    employment_type = (
+        subtitle_parts[1] if subtitle_parts and len(subtitle_parts) > 1 else None
+    )
+    location = (component.get("metadata") or {}).get("text")
+
+    duration_parts = component["caption"]["text"].split(_SEPARATOR)
+    date_parts = duration_parts[0].split(_DATE_SEPARATOR)
+
+    # Extract additional description
+    description = None
+    sub_components = component["subComponents"]
+    if sub_components:
+        fixed_list = sub_components["components"][0]["components"].get(
+            "fixedListComponent"
+        )
+        if fixed_list:
+            text_component = fixed_list["components"][0]["components"]["textComponent"]
+            description = text_component["text"]["text"] if text_component else None
+
+    return {
+        "title": component["titleV2"]["text"]["text"],
+        "companyName": company if not is_group_item else None,
+        "employmentType": company if is_group_item else employment_type,
+        "locationName": location,
+        "duration": duration_parts[1] if len(duration_parts) > 1 else None,
+        "startDate": date_parts[0],
+        "endDate": date_parts[1] if len(date_parts) > 1 else None,
+        "description": description,
+    }
+
+
+def position_group_list_urn(item: Dict) -> Optional[str]:
+    """Return the URN of the paged list holding a position group's positions,
+    or None if ``item`` is a single position."""
+    sub_components = item["components"]["entityComponent"]["subComponents"]
+    if not sub_components:
+        return None
+    paged_list_urn = sub_components["components"][0]["components"].get(
+        "*pagedListComponent"
+    )
+    if (
+        paged_list_urn
+        and "fsd_profilePositionGroup" in paged_list_urn
+        and _POSITION_GROUP_PATTERN.search(paged_list_urn)
+    ):
+        return paged_list_urn
+    return None
+
+
+def index_position_groups(included: List[Dict]) -> Dict[str, Dict]:
+    """Index ``included`` entities by the position group URN they belong to."""
+    groups: Dict[str, Dict] = {}
+    for entity in included:
+        urn = entity.get("entityUrn")
+        if not urn or "fsd_profilePositionGroup" not in urn:
+            continue
+        match = _POSITION_GROUP_PATTERN.search(urn)
+        if match:
+            groups.setdefault(match.group(0), entity)
+    return groups
+
+
+def _group_positions(
+    group: Dict,
+    paged_list_urn: str,
+    fetch_page: Optional[Callable[[str, int], List[Dict]]],
+) -> List[Dict]:
+    components = group["components"]
+    elements = list(components["elements"])
+    total = (components.get("paging") or {}).get("total") or 0
+    while fetch_page is not None and len(elements) < total:
+        page = fetch_page(paged_list_urn, len(elements))
+        if not page:
+            break
+        elements.extend(page)
+    return elements
+
+
+def parse_experiences(
+    data: Dict,
+    fetch_page: Optional[Callable[[str, int], List[Dict]]] = None,
+) -> List[Dict]:
+    """Parse a profile components ``experience`` response.
+
+    :param data: Decoded response
+    :type data: dict
+    :param fetch_page: Called as ``fetch_page(paged_list_urn, start)`` to get
+        more positions of a group whose paged list is incomplete. Should
+        return the next elements, or an empty list to stop.
+    :type fetch_page: callable, optional
+
+    :return: List of experiences
+    :rtype: list
+    """
+    included = data["included"]
+    groups = index_position_groups(included)
+
+    items = []
+    for item in included[0]["components"]["elements"]:
+        paged_list_urn = position_group_list_urn(item)
+        if not paged_list_urn:
+            items.append(parse_experience_item(item))
+            continue
+
+        # The item is a group (e.g. a company with multiple positions), whose
+        # positions live in a separate entity
+        group = groups.get(_POSITION_GROUP_PATTERN.search(paged_list_urn).group(0))
+        if group is None:
+            continue
+
+        # use the company and location from the main item
+        component = item["components"]["entityComponent"]
+        company = component["titleV2"]["text"]["text"]
+        location = component["caption"]["text"] if component["caption"] else None
+        for group_item in _group_positions(group, paged_list_urn, fetch_page):
+            parsed_data = parse_experience_item(group_item, is_group_item=True)
+            parsed_data["companyName"] = company
+            parsed_data["locationName"] = location
+            items.append(parsed_data)
+
+    return items
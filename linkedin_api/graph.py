@@ -0,0 +1,234 @@
+"""
+Breadth-first crawl of the connection graph, resumable across runs.
+"""
+
+import gzip
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from linkedin_api.scheduler import Scheduler
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class GraphStore(SQLiteStore):
+    """
+    Frontier, visited set and adjacency list of a :class:`ConnectionGraphCrawler`.
+
+    Every profile the crawl has reached is a node, ``pending`` until its
+    connections are fetched. A fetched node's connections are stored as one
+    adjacency row, a space-separated list of URN IDs, written in the same
+    transaction that marks the node done and queues its neighbours, so an
+    interrupted crawl resumes exactly where it stopped.
+
+    :param path: Path of the database file. Defaults to ``graph.sqlite3`` in
+        the linkedin_api data directory.
+    :type path: str, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS nodes (
+            urn_id TEXT PRIMARY KEY,
+            depth INTEGER NOT NULL,
+            state TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS nodes_frontier ON nodes (state, depth);
+        CREATE TABLE IF NOT EXISTS adjacency (
+            urn_id TEXT PRIMARY KEY,
+            targets TEXT NOT NULL
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path or default_db_path("graph.sqlite3"))
+
+    def add_nodes(self, urn_ids: Iterable[str], depth: int):
+        """Queue profiles at ``depth``, unless they were reached before."""
+        self.execute_many(
+            "INSERT OR IGNORE INTO nodes (urn_id, depth, state) VALUES (?, ?, ?)",
+            [(urn_id, depth, PENDING) for urn_id in urn_ids],
+        )
+
+    def frontier(self, max_depth: int, limit: int) -> List[Dict]:
+        """Return pending nodes shallower than ``max_depth``, shallowest first."""
+        rows = self.execute(
+            "SELECT urn_id, depth, attempts FROM nodes"
+            " WHERE state = ? AND depth < ? ORDER BY depth, rowid LIMIT ?",
+            (PENDING, max_depth, limit),
+        )
+        return [dict(row) for row in rows]
+
+    def complete(
+        self, urn_id: str, targets: List[str], queue_depth: Optional[int] = None
+    ):
+        """Store a node's connections and mark it done.
+
+        :param queue_depth: Depth to queue the connections at. They are only
+            recorded as edges if None.
+        :type queue_depth: int, optional
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO adjacency VALUES (?, ?)",
+                (urn_id, " ".join(targets)),
+            )
+            conn.execute("UPDATE nodes SET state = ? WHERE urn_id = ?", (DONE, urn_id))
+            if queue_depth is not None:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO nodes (urn_id, depth, state)"
+                    " VALUES (?, ?, ?)",
+                    [(target, queue_depth, PENDING) for target in targets],
+                )
+
+    def fail(self, urn_id: str, retry: bool):
+        """Record a failed fetch, leaving the node queued if ``retry``."""
+        self.execute(
+            "UPDATE nodes SET attempts = attempts + 1, state = ? WHERE urn_id = ?",
+            (PENDING if retry else FAILED, urn_id),
+        )
+
+    def neighbors(self, urn_id: str) -> Optional[List[str]]:
+        """Return a crawled node's connections, or None if not crawled yet."""
+        row = self.fetchone("SELECT targets FROM adjacency WHERE urn_id = ?", (urn_id,))
+        if row is None:
+            return None
+        return row["targets"].split() if row["targets"] else []
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of nodes in each state."""
+        rows = self.execute("SELECT state, COUNT(*) AS n FROM nodes GROUP BY state")
+        return {row["state"]: row["n"] for row in rows}
+
+    def write_adjacency(self, path: str) -> int:
+        """Write the adjacency list to a text file.
+
+        Each line holds a profile's URN ID followed by its connections',
+        separated by spaces. Paths ending in ``.gz`` are gzip-compressed.
+
+        :param path: File to write
+        :type path: str
+
+        :return: Number of lines written
+        :rtype: int
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        lines = 0
+        with opener(path, "wt", encoding="utf-8") as f:
+            for row in self.execute(
+                "SELECT urn_id, targets FROM adjacency ORDER BY urn_id"
+            ):
+                f.write(f"{row['urn_id']} {row['targets']}".rstrip() + "\n")
+                lines += 1
+        return lines
+
+
+class ConnectionGraphCrawler(object):
+    """
+    Expand the connection graph breadth-first from seed profiles.
+
+    Connections are fetched with :meth:`Linkedin.get_profile_connections`,
+    ``concurrency`` profiles at a time; requests stay within the client's
+    request budget. Seeds are at depth 0 and a profile is expanded only if
+    its depth is below ``max_depth``, so ``max_depth=2`` maps the seeds'
+    connections and their connections. State lives in a :class:`GraphStore`,
+    so calling :meth:`crawl` again resumes an interrupted crawl.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param store: Crawl state. Defaults to a :class:`GraphStore` at the
+        default location.
+    :type store: GraphStore, optional
+    :param max_depth: Depth below which profiles are expanded
+    :type max_depth: int, optional
+    :param max_fanout: Maximum number of connections fetched per profile
+    :type max_fanout: int, optional
+    :param concurrency: Number of profiles fetched at once
+    :type concurrency: int, optional
+    :param max_attempts: Give up on a profile after this many failed fetches.
+        An empty result also counts as a failed fetch, since that is what
+        :meth:`Linkedin.get_profile_connections` returns when a request fails
+        or is throttled; a profile that comes back empty every time is stored
+        without connections.
+    :type max_attempts: int, optional
+    """
+
+    def __init__(
+        self,
+        api,
+        store: Optional[GraphStore] = None,
+        max_depth: int = 2,
+        max_fanout: Optional[int] = None,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+    ):
+        self.api = api
+        self.store = store or GraphStore()
+        self.max_depth = max_depth
+        self.max_fanout = max_fanout
+        self.scheduler = Scheduler(concurrency)
+        self.max_attempts = max_attempts
+        self._wave_size = concurrency * 8
+
+    def _connections(self, urn_id: str) -> List[str]:
+        kwargs = {"limit": self.max_fanout} if self.max_fanout else {}
+        results = self.api.get_profile_connections(urn_id, **kwargs)
+        return list(dict.fromkeys(r["urn_id"] for r in results if r.get("urn_id")))
+
+    def crawl(
+        self, seeds: Iterable[str] = (), max_nodes: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Crawl until the frontier is exhausted, streaming expanded profiles.
+
+        :param seeds: Profile URN IDs to start from. Can be omitted to resume
+            a previous crawl.
+        :type seeds: iterable, optional
+        :param max_nodes: Stop after expanding this many profiles
+        :type max_nodes: int, optional
+
+        :return: Iterator of dicts with ``urn_id``, ``depth`` and
+            ``connections`` (list of URN IDs)
+        :rtype: iterator
+        """
+        self.store.add_nodes(seeds, depth=0)
+        expanded = 0
+        while max_nodes is None or expanded < max_nodes:
+            limit = self._wave_size
+            if max_nodes is not None:
+                limit = min(limit, max_nodes - expanded)
+            wave = self.store.frontier(self.max_depth, limit)
+            if not wave:
+                break
+            for node, connections in self.scheduler.map(
+                lambda n: self._connections(n["urn_id"]), wave
+            ):
+                urn_id = node["urn_id"]
+                retry = node["attempts"] + 1 < self.max_attempts
+                if isinstance(connections, Exception):
+                    logger.info(
+                        f"Fetching connections of {urn_id} failed: {connections!r},"
+                        f" retry: {retry}"
+                    )
+                    self.store.fail(urn_id, retry=retry)
+                    continue
+                if not connections and retry:
+                    logger.info(f"No connections found for {urn_id}, retrying")
+                    self.store.fail(urn_id, retry=True)
+                    continue
+                depth = node["depth"] + 1
+                self.store.complete(
+                    urn_id,
+                    connections,
+                    queue_depth=depth if depth < self.max_depth else None,
+                )
+                expanded += 1
+                yield {
+                    "urn_id": urn_id,
+                    "depth": node["depth"],
+                    "connections": connections,
+                }
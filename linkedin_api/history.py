@@ -0,0 +1,227 @@
+"""
+Versioned history of profiles, stored as field-level deltas.
+"""
+
+import copy
+import json
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+FULL = "full"
+DELTA = "delta"
+
+
+def diff_documents(old: Dict, new: Dict) -> Dict[str, list]:
+    """Return the field-level changes turning ``old`` into ``new``.
+
+    Nested dicts are compared key by key; any other value (including lists)
+    is replaced as a whole when it differs.
+
+    :return: Dict with ``set`` (list of ``[path, value]``) and ``unset``
+        (list of paths), where a path is a list of keys
+    :rtype: dict
+    """
+    delta: Dict[str, list] = {"set": [], "unset": []}
+
+    def walk(a: Dict, b: Dict, path: Tuple):
+        for key in a.keys() - b.keys():
+            delta["unset"].append(list(path + (key,)))
+        for key, value in b.items():
+            if key not in a:
+                delta["set"].append([list(path + (key,)), value])
+            elif isinstance(value, dict) and isinstance(a[key], dict):
+                walk(a[key], value, path + (key,))
+            elif a[key] != value:
+                delta["set"].append([list(path + (key,)), value])
+
+    walk(old, new, ())
+    return delta
+
+
+def apply_delta(document: Dict, delta: Dict[str, list]) -> Dict:
+    """Return a copy of ``document`` with a :func:`diff_documents` delta applied."""
+    document = copy.deepcopy(document)
+    for path in delta["unset"]:
+        parent = document
+        for key in path[:-1]:
+            parent = parent[key]
+        del parent[path[-1]]
+    for path, value in delta["set"]:
+        parent = document
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[path[-1]] = value
+    return document
+
+
+def _changed_paths(delta: Dict[str, list]) -> List[str]:
+    return sorted(
+        ".".join(path) for path in delta["unset"] + [p for p, _ in delta["set"]]
+    )
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+
+
+def _unpack(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data))
+
+
+class ProfileHistory(SQLiteStore):
+    """
+    History of profile documents over time.
+
+    A profile's first version is stored in full; later versions only as the
+    fields that changed (see :func:`diff_documents`), compressed. Every
+    ``keyframe_interval`` versions a full copy is stored again, so rebuilding
+    any version reads one full copy and at most ``keyframe_interval - 1``
+    deltas. Changed field paths are kept next to each delta, so
+    :meth:`changed_since` never decodes documents. Recording a document
+    equal to the latest version stores nothing.
+
+    Documents are JSON-serialisable dicts, e.g. a :meth:`Linkedin.get_profile_v2`
+    profile with its ``experiences`` added.
+
+    :param path: Path of the database file. Defaults to ``history.sqlite3``
+        in the linkedin_api data directory.
+    :type path: str, optional
+    :param keyframe_interval: Store a full copy every this many versions
+    :type keyframe_interval: int, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS versions (
+            urn_id TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            taken_at REAL NOT NULL,
+            kind TEXT NOT NULL,
+            data BLOB NOT NULL,
+            changed TEXT NOT NULL,
+            PRIMARY KEY (urn_id, version)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS versions_by_time ON versions (urn_id, taken_at);
+        CREATE TABLE IF NOT EXISTS heads (
+            urn_id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            document BLOB NOT NULL
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Optional[str] = None, keyframe_interval: int = 26):
+        super().__init__(path or default_db_path("history.sqlite3"))
+        self.keyframe_interval = keyframe_interval
+
+    def record(
+        self, urn_id: str, document: Dict, taken_at: Optional[float] = None
+    ) -> Optional[int]:
+        """Add a version of a profile, if it differs from the latest one.
+
+        :param urn_id: Profile URN ID
+        :type urn_id: str
+        :param document: Profile document
+        :type document: dict
+        :param taken_at: Unix time of the snapshot. Defaults to now.
+        :type taken_at: float, optional
+
+        :return: The new version number, or None if nothing changed
+        :rtype: int
+        """
+        taken_at = time.time() if taken_at is None else taken_at
+        # Normalise through JSON, so later comparisons see what is stored
+        document = json.loads(json.dumps(document))
+        with self.transaction() as conn:
+            head = conn.execute(
+                "SELECT version, document FROM heads WHERE urn_id = ?", (urn_id,)
+            ).fetchone()
+            if head is None:
+                version, kind, data = 1, FULL, document
+                changed = sorted(document)
+            else:
+                delta = diff_documents(_unpack(head["document"]), document)
+                changed = _changed_paths(delta)
+                if not changed:
+                    return None
+                version = head["version"] + 1
+                if (version - 1) % self.keyframe_interval == 0:
+                    kind, data = FULL, document
+                else:
+                    kind, data = DELTA, delta
+            conn.execute(
+                "INSERT INTO versions VALUES (?, ?, ?, ?, ?, ?)",
+                (urn_id, version, taken_at, kind, _pack(data), json.dumps(changed)),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO heads VALUES (?, ?, ?)",
+                (urn_id, version, _pack(document)),
+            )
+        return version
+
+    def versions(self, urn_id: str) -> List[Dict]:
+        """Return a profile's versions (``version``, ``taken_at``, ``kind``, ``changed``)."""
+        rows = self.execute(
+            "SELECT version, taken_at, kind, changed FROM versions"
+            " WHERE urn_id = ? ORDER BY version",
+            (urn_id,),
+        )
+        return [dict(row, changed=json.loads(row["changed"])) for row in rows]
+
+    def latest(self, urn_id: str) -> Optional[Dict]:
+        """Return a profile's latest document."""
+        row = self.fetchone("SELECT document FROM heads WHERE urn_id = ?", (urn_id,))
+        return _unpack(row["document"]) if row else None
+
+    def get(self, urn_id: str, version: int) -> Optional[Dict]:
+        """Rebuild a given version of a profile."""
+        keyframe = self.fetchone(
+            "SELECT version, data FROM versions"
+            " WHERE urn_id = ? AND kind = ? AND version <= ?"
+            " ORDER BY version DESC LIMIT 1",
+            (urn_id, FULL, version),
+        )
+        if keyframe is None:
+            return None
+        document = _unpack(keyframe["data"])
+        for row in self.execute(
+            "SELECT data FROM versions"
+            " WHERE urn_id = ? AND version > ? AND version <= ? ORDER BY version",
+            (urn_id, keyframe["version"], version),
+        ):
+            document = apply_delta(document, _unpack(row["data"]))
+        return document
+
+    def as_of(self, urn_id: str, when: float) -> Optional[Dict]:
+        """Rebuild a profile as it was at a point in time.
+
+        :param when: Unix time
+        :type when: float
+
+        :return: The latest version recorded at or before ``when``, or None
+        :rtype: dict
+        """
+        row = self.fetchone(
+            "SELECT MAX(version) AS version FROM versions"
+            " WHERE urn_id = ? AND taken_at <= ?",
+            (urn_id, when),
+        )
+        if row is None or row["version"] is None:
+            return None
+        return self.get(urn_id, row["version"])
+
+    def changed_since(self, urn_id: str, since: float) -> List[str]:
+        """Return the paths of fields changed after ``since``, e.g. ``"headline"``
+        or ``"geoLocation.postalCode"``.
+
+        :param since: Unix time
+        :type since: float
+        """
+        changed = set()
+        for row in self.execute(
+            "SELECT changed FROM versions WHERE urn_id = ? AND taken_at > ?",
+            (urn_id, since),
+        ):
+            changed.update(json.loads(row["changed"]))
+        return sorted(changed)
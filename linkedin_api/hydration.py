@@ -0,0 +1,169 @@
+"""
+Profile hydration pipeline.
+"""
+
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from linkedin_api.utils.cache import TTLCache
+
+_MISSING = object()
+
+# Profile URN IDs look like "ACoAABMCK14BZYQEFee5Ir7zBXRulzkHn_aCgio"
+_URN_ID_PATTERN = re.compile(r"^ACoAA[A-Za-z0-9_-]{10,}$")
+
+SECTIONS: Dict[str, Callable] = {
+    "profile": lambda api, urn_id: api.get_profile_v2(urn_id=urn_id),
+    "experiences": lambda api, urn_id: api.get_profile_experiences(urn_id),
+    "skills": lambda api, urn_id: api.get_profile_skills(urn_id=urn_id),
+    "contact_info": lambda api, urn_id: api.get_profile_contact_info(urn_id=urn_id),
+}
+
+
+def split_profile_identifier(identifier: str) -> Tuple[str, str]:
+    """Tell a public ID (vanity name) from a profile URN or URN ID.
+
+    :param identifier: Public ID, URN ID or full profile URN
+    :type identifier: str
+
+    :return: ``("urn_id", <urn id>)`` or ``("public_id", <public id>)``
+    :rtype: tuple
+    """
+    if identifier.startswith("urn:li:"):
+        return "urn_id", identifier.split(":")[-1]
+    if _URN_ID_PATTERN.match(identifier):
+        return "urn_id", identifier
+    return "public_id", identifier
+
+
+class ProfileHydrator(object):
+    """
+    Produce fully hydrated profiles from public IDs or URNs.
+
+    Each profile goes through two stages: resolving its public ID to a URN
+    (skipped when a URN is given), then fetching the selected sections. All
+    stages share one worker pool, and a profile's sections are scheduled as
+    soon as its URN is known, so resolution of later profiles overlaps with
+    section fetches of earlier ones. Every stage result is cached by public
+    ID or URN ID.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param concurrency: Number of requests to run at once
+    :type concurrency: int, optional
+    :param ttl: Time-to-live of cached stage results, in seconds
+    :type ttl: float, optional
+    :param maxsize: Maximum number of cached stage results
+    :type maxsize: int, optional
+    """
+
+    def __init__(self, api, concurrency: int = 4, ttl: float = 3600.0, maxsize=10000):
+        self.api = api
+        self.concurrency = concurrency
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _cached(self, stage: str, key: str, fetch: Callable):
+        result = self.cache.get((stage, key), _MISSING)
+        if result is not _MISSING:
+            return result
+        result = fetch()
+        # Empty results usually mean a failed request; don't remember them
+        if result:
+            self.cache.set((stage, key), result)
+        return result
+
+    def hydrate(
+        self,
+        identifiers: Iterable[str],
+        sections: Optional[Sequence[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Hydrate profiles, yielding each one as soon as it is complete.
+
+        :param identifiers: Public IDs, URN IDs or full profile URNs
+        :type identifiers: iterable
+        :param sections: Sections to fetch, any of ``"profile"``,
+            ``"experiences"``, ``"skills"`` and ``"contact_info"``. Defaults to all.
+        :type sections: list, optional
+        :param concurrency: Overrides the hydrator's ``concurrency``
+        :type concurrency: int, optional
+
+        :return: Iterator of dicts with ``input``, ``urn_id``, one key per
+            requested section and ``errors`` (exceptions keyed by stage). A
+            section is None if its stage failed.
+        :rtype: iterator
+        """
+        sections = tuple(sections or SECTIONS)
+        unknown = set(sections) - set(SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown profile sections: {sorted(unknown)}")
+
+        identifiers = iter(identifiers)
+        concurrency = concurrency or self.concurrency
+        window = concurrency * 2
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = {}
+            remaining = {}
+
+            def submit(record, stage, key, fetch):
+                future = executor.submit(self._cached, stage, key, fetch)
+                pending[future] = (record, stage)
+
+            def submit_sections(record):
+                urn_id = record["urn_id"]
+                remaining[id(record)] = len(sections)
+                for section in sections:
+                    fetch = SECTIONS[section]
+                    submit(record, section, urn_id, lambda f=fetch: f(self.api, urn_id))
+
+            def fill():
+                while len(remaining) < window:
+                    try:
+                        identifier = next(identifiers)
+                    except StopIteration:
+                        return
+                    record = {"input": identifier, "urn_id": None, "errors": {}}
+                    record.update((section, None) for section in sections)
+                    kind, value = split_profile_identifier(identifier)
+                    if kind == "urn_id":
+                        record["urn_id"] = value
+                        submit_sections(record)
+                        continue
+                    remaining[id(record)] = 1
+                    submit(
+                        record,
+                        "urn_id",
+                        value,
+                        lambda v=value: self.api._resolve_public_id_to_urn(v),
+                    )
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record, stage = pending.pop(future)
+                    error = future.exception()
+                    result = future.result() if error is None else None
+
+                    if stage == "urn_id":
+                        del remaining[id(record)]
+                        if result:
+                            record["urn_id"] = result
+                            submit_sections(record)
+                            continue
+                        record["errors"]["urn_id"] = error or LookupError(
+                            f"Could not resolve '{record['input']}' to a URN"
+                        )
+                        yield record
+                        continue
+
+                    record[stage] = result
+                    if error is not None:
+                        record["errors"][stage] = error
+                    remaining[id(record)] -= 1
+                    if not remaining[id(record)]:
+                        del remaining[id(record)]
+                        yield record
+                fill()
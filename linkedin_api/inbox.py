@@ -0,0 +1,563 @@
+"""
+Local conversation store and incremental inbox sync.
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional, Set
+
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+logger = logging.getLogger(__name__)
+
+# Names and headlines of a thread's participants, for the search index
+_PARTICIPANTS_TEXT = """
+    (SELECT group_concat(
+        json_extract(p.value, '$.firstName') || ' ' ||
+        json_extract(p.value, '$.lastName') || ' ' ||
+        json_extract(p.value, '$.headline'), ' ')
+     FROM conversations c, json_each(c.participants) p
+     WHERE c.thread_id = {thread_id})
+"""
+
+
+class InboxStore(SQLiteStore):
+    """
+    Local SQLite store of conversations, keyed by ``conversation_urn``, and
+    of the messages of synced threads.
+
+    Conversations are stored in the shape returned by
+    :meth:`Linkedin.get_conversations_v3`.
+
+    :param path: Path of the database file. Defaults to ``inbox.sqlite3`` in
+        the linkedin_api data directory.
+    :type path: str, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS conversations (
+            conversation_urn TEXT PRIMARY KEY,
+            mailbox_urn TEXT NOT NULL,
+            thread_id TEXT,
+            read INTEGER,
+            unread_count INTEGER,
+            last_activity_at INTEGER,
+            participants TEXT,
+            last_message TEXT
+        );
+        CREATE INDEX IF NOT EXISTS conversations_by_activity
+            ON conversations (mailbox_urn, last_activity_at);
+        CREATE TABLE IF NOT EXISTS inbox_sync_state (
+            mailbox_urn TEXT NOT NULL,
+            inbox TEXT NOT NULL,
+            last_activity_at INTEGER,
+            PRIMARY KEY (mailbox_urn, inbox)
+        );
+        CREATE TABLE IF NOT EXISTS inbox_sync_progress (
+            mailbox_urn TEXT NOT NULL,
+            inbox TEXT NOT NULL,
+            next_cursor TEXT NOT NULL,
+            last_activity_at INTEGER,
+            PRIMARY KEY (mailbox_urn, inbox)
+        );
+        CREATE TABLE IF NOT EXISTS messages (
+            message_urn TEXT PRIMARY KEY,
+            thread_id TEXT NOT NULL,
+            sender_urn_id TEXT,
+            is_from_me INTEGER,
+            text TEXT,
+            delivered_at INTEGER,
+            origin_token TEXT
+        );
+        CREATE INDEX IF NOT EXISTS messages_by_thread
+            ON messages (thread_id, delivered_at);
+        CREATE TABLE IF NOT EXISTS thread_sync_state (
+            mailbox_urn TEXT NOT NULL,
+            thread_id TEXT NOT NULL,
+            sync_token TEXT,
+            PRIMARY KEY (mailbox_urn, thread_id)
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS message_search
+            USING fts5(text, participants);
+        CREATE TRIGGER IF NOT EXISTS message_search_insert
+            AFTER INSERT ON messages BEGIN
+                INSERT INTO message_search (rowid, text, participants)
+                VALUES (new.rowid, new.text, {participants});
+            END;
+        CREATE TRIGGER IF NOT EXISTS message_search_delete
+            AFTER DELETE ON messages BEGIN
+                DELETE FROM message_search WHERE rowid = old.rowid;
+            END;
+    """.format(
+        participants=_PARTICIPANTS_TEXT.format(thread_id="new.thread_id")
+    )
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path or default_db_path("inbox.sqlite3"))
+
+    @staticmethod
+    def _to_conversation(row) -> Dict:
+        return {
+            "conversation_urn": row["conversation_urn"],
+            "thread_id": row["thread_id"],
+            "read": None if row["read"] is None else bool(row["read"]),
+            "unread_count": row["unread_count"],
+            "last_activity_at": row["last_activity_at"],
+            "participants": json.loads(row["participants"] or "[]"),
+            "last_message": json.loads(row["last_message"] or "null"),
+        }
+
+    def get_conversation(self, conversation_urn: str) -> Optional[Dict]:
+        """Return a stored conversation, or None if it is not known."""
+        row = self.fetchone(
+            "SELECT * FROM conversations WHERE conversation_urn = ?",
+            (conversation_urn,),
+        )
+        return self._to_conversation(row) if row else None
+
+    def get_conversations(
+        self, mailbox_urn: str, unread_only=False, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Return stored conversations of a mailbox, most recent activity first.
+
+        :param mailbox_urn: Profile URN ID of the mailbox owner
+        :type mailbox_urn: str
+        :param unread_only: Only return unread conversations
+        :type unread_only: bool, optional
+        :param limit: Maximum number of conversations to return
+        :type limit: int, optional
+
+        :return: List of conversations
+        :rtype: list
+        """
+        sql = "SELECT * FROM conversations WHERE mailbox_urn = ?"
+        if unread_only:
+            sql += " AND read = 0"
+        sql += " ORDER BY last_activity_at DESC"
+        params: list = [mailbox_urn]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._to_conversation(row) for row in self.execute(sql, params)]
+
+    def save_conversations(self, mailbox_urn: str, conversations: List[Dict]):
+        """Insert or update conversations as returned by ``get_conversations_v3``."""
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO conversations VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (conversation_urn) DO UPDATE SET
+                    thread_id = excluded.thread_id,
+                    read = excluded.read,
+                    unread_count = excluded.unread_count,
+                    last_activity_at = excluded.last_activity_at,
+                    participants = excluded.participants,
+                    last_message = excluded.last_message
+                """,
+                [
+                    (
+                        c["conversation_urn"],
+                        mailbox_urn,
+                        c.get("thread_id"),
+                        None if c.get("read") is None else int(c["read"]),
+                        c.get("unread_count"),
+                        c.get("last_activity_at"),
+                        json.dumps(c.get("participants") or []),
+                        json.dumps(c.get("last_message")),
+                    )
+                    for c in conversations
+                ],
+            )
+
+    def get_watermark(self, mailbox_urn: str, inbox: str) -> Optional[int]:
+        """Return the latest activity timestamp covered by a completed sync."""
+        row = self.fetchone(
+            "SELECT last_activity_at FROM inbox_sync_state"
+            " WHERE mailbox_urn = ? AND inbox = ?",
+            (mailbox_urn, inbox),
+        )
+        return row["last_activity_at"] if row else None
+
+    def set_watermark(self, mailbox_urn: str, inbox: str, last_activity_at: int):
+        """Record the latest activity timestamp covered by a completed sync,
+        and drop the progress of the sync that completed."""
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO inbox_sync_state VALUES (?, ?, ?)
+                ON CONFLICT (mailbox_urn, inbox) DO UPDATE SET
+                    last_activity_at = excluded.last_activity_at
+                """,
+                (mailbox_urn, inbox, last_activity_at),
+            )
+            conn.execute(
+                "DELETE FROM inbox_sync_progress WHERE mailbox_urn = ? AND inbox = ?",
+                (mailbox_urn, inbox),
+            )
+
+    def get_progress(self, mailbox_urn: str, inbox: str) -> Optional[Dict]:
+        """Return where an unfinished sync stopped: its ``next_cursor`` and the
+        latest ``last_activity_at`` it saw, or None."""
+        row = self.fetchone(
+            "SELECT next_cursor, last_activity_at FROM inbox_sync_progress"
+            " WHERE mailbox_urn = ? AND inbox = ?",
+            (mailbox_urn, inbox),
+        )
+        return dict(row) if row else None
+
+    def set_progress(
+        self,
+        mailbox_urn: str,
+        inbox: str,
+        next_cursor: Optional[str],
+        last_activity_at: Optional[int],
+    ):
+        """Record where an unfinished sync stopped, or clear it if
+        ``next_cursor`` is None."""
+        if next_cursor is None:
+            self.execute(
+                "DELETE FROM inbox_sync_progress WHERE mailbox_urn = ? AND inbox = ?",
+                (mailbox_urn, inbox),
+            )
+            return
+        self.execute(
+            """
+            INSERT INTO inbox_sync_progress VALUES (?, ?, ?, ?)
+            ON CONFLICT (mailbox_urn, inbox) DO UPDATE SET
+                next_cursor = excluded.next_cursor,
+                last_activity_at = excluded.last_activity_at
+            """,
+            (mailbox_urn, inbox, next_cursor, last_activity_at),
+        )
+
+    @staticmethod
+    def _to_message(row) -> Dict:
+        return {
+            "message_urn": row["message_urn"],
+            "thread_id": row["thread_id"],
+            "sender_urn_id": row["sender_urn_id"],
+            "is_from_me": bool(row["is_from_me"]),
+            "text": row["text"],
+            "delivered_at": row["delivered_at"],
+            "origin_token": row["origin_token"],
+        }
+
+    def get_messages(self, thread_id: str) -> List[Dict]:
+        """Return the stored messages of a thread, oldest first."""
+        rows = self.execute(
+            "SELECT * FROM messages WHERE thread_id = ? ORDER BY delivered_at",
+            (thread_id,),
+        )
+        return [self._to_message(row) for row in rows]
+
+    def get_message_urns(self, thread_id: str) -> Set[str]:
+        """Return the URNs of the stored messages of a thread."""
+        rows = self.execute(
+            "SELECT message_urn FROM messages WHERE thread_id = ?", (thread_id,)
+        )
+        return {row["message_urn"] for row in rows}
+
+    def apply_thread_changes(
+        self,
+        mailbox_urn: str,
+        thread_id: str,
+        messages: List[Dict],
+        deleted_urns: List[str],
+        sync_token: Optional[str],
+        replace=False,
+    ):
+        """Store one thread sync response atomically.
+
+        :param replace: Drop the thread's stored messages first, for responses
+            that carry the full thread rather than a delta
+        :type replace: bool, optional
+        """
+        with self.transaction() as conn:
+            if replace:
+                conn.execute("DELETE FROM messages WHERE thread_id = ?", (thread_id,))
+            # Plain deletes rather than INSERT OR REPLACE, so the search
+            # index triggers see every removed row
+            conn.executemany(
+                "DELETE FROM messages WHERE message_urn = ?",
+                [(urn,) for urn in deleted_urns]
+                + [(m["message_urn"],) for m in messages],
+            )
+            conn.executemany(
+                "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        m["message_urn"],
+                        thread_id,
+                        m["sender_urn_id"],
+                        int(m["is_from_me"]),
+                        m["text"],
+                        m["delivered_at"],
+                        m["origin_token"],
+                    )
+                    for m in messages
+                ],
+            )
+            conn.execute(
+                """
+                INSERT INTO thread_sync_state VALUES (?, ?, ?)
+                ON CONFLICT (mailbox_urn, thread_id) DO UPDATE SET
+                    sync_token = excluded.sync_token
+                """,
+                (mailbox_urn, thread_id, sync_token),
+            )
+
+    def get_sync_token(self, mailbox_urn: str, thread_id: str) -> Optional[str]:
+        """Return the sync token of the last thread sync, if any."""
+        row = self.fetchone(
+            "SELECT sync_token FROM thread_sync_state"
+            " WHERE mailbox_urn = ? AND thread_id = ?",
+            (mailbox_urn, thread_id),
+        )
+        return row["sync_token"] if row else None
+
+    def search_messages(
+        self,
+        query: str,
+        thread_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict]:
+        """Search stored messages by keyword or participant, best match first.
+
+        Message text and the names and headlines of each thread's participants
+        are indexed as messages are synced. Participant details are those
+        known when the message was stored.
+
+        :param query: SQLite FTS5 query, e.g. ``"invoice"``, ``"contract AND draft"``
+            or ``"participants: Jane"``
+        :type query: str
+        :param thread_id: Only search this thread
+        :type thread_id: str, optional
+        :param limit: Maximum number of messages to return
+        :type limit: int, optional
+
+        :return: Messages as returned by :meth:`get_messages`, each with a
+            ``snippet`` of the matching text
+        :rtype: list
+        """
+        sql = """
+            SELECT m.*, snippet(message_search, 0, '[', ']', '...', 12) AS snippet
+            FROM message_search JOIN messages m ON m.rowid = message_search.rowid
+            WHERE message_search MATCH ?
+        """
+        params: list = [query]
+        if thread_id is not None:
+            sql += " AND m.thread_id = ?"
+            params.append(thread_id)
+        sql += " ORDER BY message_search.rank LIMIT ?"
+        params.append(limit)
+
+        results = []
+        for row in self.execute(sql, params):
+            message = self._to_message(row)
+            message["snippet"] = row["snippet"]
+            results.append(message)
+        return results
+
+    def rebuild_search_index(self):
+        """Re-index every stored message, e.g. after participants changed."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM message_search")
+            conn.execute(
+                "INSERT INTO message_search (rowid, text, participants)"
+                " SELECT m.rowid, m.text, {participants} FROM messages m".format(
+                    participants=_PARTICIPANTS_TEXT.format(thread_id="m.thread_id")
+                )
+            )
+
+
+def parse_message(element: Dict, mailbox_urn: str) -> Dict:
+    """Turn a ``messengerMessagesBySyncToken`` element into a compact record.
+
+    :param element: Raw message element
+    :type element: dict
+    :param mailbox_urn: Your profile URN ID, to tell your own messages apart
+    :type mailbox_urn: str
+
+    :return: Dict with ``message_urn``, ``thread_id``, ``sender_urn_id``,
+        ``is_from_me``, ``text``, ``delivered_at`` and ``origin_token``
+    :rtype: dict
+    """
+    sender_urn = (element.get("sender") or {}).get("hostIdentityUrn", "")
+    return {
+        "message_urn": element.get("entityUrn") or element.get("backendUrn"),
+        "thread_id": (element.get("backendConversationUrn") or "").replace(
+            "urn:li:messagingThread:", ""
+        ),
+        "sender_urn_id": sender_urn.replace("urn:li:fsd_profile:", ""),
+        "is_from_me": mailbox_urn in sender_urn,
+        "text": (element.get("body") or {}).get("text", ""),
+        "delivered_at": element.get("deliveredAt"),
+        "origin_token": element.get("originToken"),
+    }
+
+
+class InboxSync(object):
+    """
+    Incrementally sync a mailbox into an :class:`InboxStore`.
+
+    Conversations come back most recent activity first, so each sync only
+    pages until it reaches activity already covered by the previous complete
+    sync. In the common case, where little has changed since the last poll,
+    that is a single request. A sync cut short by ``max_pages`` saves its
+    cursor, and the next one carries on from there until the catch-up
+    completes.
+
+    Read-state changes are detected on every page that is fetched; a
+    conversation read elsewhere without new activity is only noticed if it is
+    on one of those pages.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param mailbox_urn: Your profile URN ID (the part after ``urn:li:fsd_profile:``)
+    :type mailbox_urn: str
+    :param store: Store to sync into. Defaults to an :class:`InboxStore` at the
+        default location.
+    :type store: InboxStore, optional
+    """
+
+    def __init__(self, api, mailbox_urn: str, store: Optional[InboxStore] = None):
+        self.api = api
+        self.mailbox_urn = mailbox_urn
+        self.store = store or InboxStore()
+
+    def sync(
+        self,
+        categories: Optional[List[str]] = None,
+        count: int = 25,
+        max_pages: Optional[int] = None,
+    ) -> Dict:
+        """Fetch new activity and update the store.
+
+        :param categories: Inbox categories to sync. Defaults to ``["PRIMARY_INBOX"]``.
+        :type categories: list, optional
+        :param count: Conversations per page (server cap: 25)
+        :type count: int, optional
+        :param max_pages: Stop after this many pages. A sync cut short this way
+            does not advance the sync watermark; the next one continues from
+            the page where it stopped.
+        :type max_pages: int, optional
+
+        :return: Dict with ``new`` (conversations not seen before), ``updated``
+            (conversations with new activity), ``read_changed`` (read state
+            changed without new activity) and ``pages`` (requests made)
+        :rtype: dict
+        """
+        categories = categories or ["PRIMARY_INBOX"]
+        inbox = ",".join(sorted(categories))
+        watermark = self.store.get_watermark(self.mailbox_urn, inbox)
+
+        progress = self.store.get_progress(self.mailbox_urn, inbox)
+
+        delta: Dict = {"new": [], "updated": [], "read_changed": [], "pages": 0}
+        latest = watermark
+        cursor = None
+        if progress is not None:
+            # Carry on with an unfinished catch-up; activity newer than what
+            # it saw is picked up from the top once it completes
+            cursor = progress["next_cursor"]
+            if progress["last_activity_at"] is not None:
+                latest = max(latest or 0, progress["last_activity_at"])
+        complete = False
+        while True:
+            page = self.api.get_conversations_v3(
+                mailbox_urn=self.mailbox_urn,
+                count=count,
+                next_cursor=cursor,
+                categories=categories,
+            )
+            delta["pages"] += 1
+            conversations = page["conversations"]
+
+            reached_watermark = False
+            for conversation in conversations:
+                activity = conversation.get("last_activity_at") or 0
+                if watermark is not None and activity <= watermark:
+                    reached_watermark = True
+                latest = activity if latest is None else max(latest, activity)
+
+                known = self.store.get_conversation(conversation["conversation_urn"])
+                if known is None:
+                    delta["new"].append(conversation)
+                elif activity > (known["last_activity_at"] or 0):
+                    delta["updated"].append(conversation)
+                elif (
+                    conversation.get("read") != known["read"]
+                    or conversation.get("unread_count") != known["unread_count"]
+                ):
+                    delta["read_changed"].append(conversation)
+
+            self.store.save_conversations(self.mailbox_urn, conversations)
+
+            if cursor and not conversations:
+                # A cursor that yields nothing (e.g. expired): start over
+                # from the top next time
+                self.store.set_progress(self.mailbox_urn, inbox, None, None)
+                break
+            cursor = page["next_cursor"]
+            if reached_watermark or not cursor or not conversations:
+                complete = True
+                break
+            if max_pages is not None and delta["pages"] >= max_pages:
+                self.store.set_progress(self.mailbox_urn, inbox, cursor, latest)
+                break
+
+        if complete and latest is not None:
+            self.store.set_watermark(self.mailbox_urn, inbox, latest)
+        elif complete:
+            self.store.set_progress(self.mailbox_urn, inbox, None, None)
+
+        logger.debug(
+            f"Inbox sync: {len(delta['new'])} new, {len(delta['updated'])} updated, "
+            f"{len(delta['read_changed'])} read changes in {delta['pages']} page(s)"
+        )
+        return delta
+
+    def sync_thread(self, messaging_thread_urn: str) -> Dict:
+        """Fetch the messages of a thread added since its last sync.
+
+        The first sync of a thread downloads it in full; later ones pass the
+        stored sync token so the server only returns what changed.
+
+        :param messaging_thread_urn: Thread ID (the ``thread_id`` of a conversation)
+        :type messaging_thread_urn: str
+
+        :return: Dict with ``messages`` (new messages, oldest first, as returned
+            by :func:`parse_message`) and ``deleted`` (URNs of removed messages)
+        :rtype: dict
+        """
+        thread_id = messaging_thread_urn
+        sync_token = self.store.get_sync_token(self.mailbox_urn, thread_id)
+        data = self.api.get_thread_v2(
+            self.mailbox_urn, messaging_thread_urn, sync_token=sync_token
+        )
+        raw = (data.get("data") or {}).get("messengerMessagesBySyncToken") or {}
+        if not raw:
+            logger.info(f"Thread sync failed for {messaging_thread_urn}")
+            return {"messages": [], "deleted": []}
+        metadata = raw.get("metadata") or {}
+
+        known = self.store.get_message_urns(thread_id)
+        messages = [
+            parse_message(element, self.mailbox_urn)
+            for element in raw.get("elements", [])
+        ]
+        messages.sort(key=lambda m: m["delivered_at"] or 0)
+        deleted = [urn for urn in metadata.get("deletedUrns") or [] if urn in known]
+
+        self.store.apply_thread_changes(
+            self.mailbox_urn,
+            thread_id,
+            messages,
+            deleted,
+            metadata.get("newSyncToken"),
+            replace=bool(metadata.get("shouldClearCache")),
+        )
+        return {
+            "messages": [m for m in messages if m["message_urn"] not in known],
+            "deleted": deleted,
+        }
@@ -0,0 +1,462 @@
+"""
+Job monitoring and crawling on top of :meth:`Linkedin.search_jobs`.
+"""
+
+import itertools
+import json
+import logging
+import math
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from linkedin_api.scheduler import Scheduler
+from linkedin_api.search_sharding import SEARCH_RESULT_CAP
+from linkedin_api.seen import JOBS, SeenIndex
+from linkedin_api.utils.cache import TTLCache
+from linkedin_api.utils.helpers import get_id_from_urn
+from linkedin_api.utils.sqlite import default_db_path
+
+logger = logging.getLogger(__name__)
+
+
+def job_id(job: Dict) -> str:
+    """Return the job ID of a posting returned by :meth:`Linkedin.search_jobs`."""
+    return get_id_from_urn(job.get("entityUrn") or "")
+
+
+def query_key(query: Dict) -> str:
+    """Return a stable key identifying a ``search_jobs`` query."""
+    return json.dumps(query, sort_keys=True, separators=(",", ":"))
+
+
+class JobWatchStore(SeenIndex):
+    """
+    Per-query state of a :class:`JobWatcher`: when each query last ran and
+    which job IDs it has already reported.
+
+    :param path: Path of the database file. Defaults to ``jobs.sqlite3`` in
+        the linkedin_api data directory.
+    :type path: str, optional
+    """
+
+    SCHEMA = (
+        SeenIndex.SCHEMA
+        + """
+        CREATE TABLE IF NOT EXISTS job_watch_state (
+            query_key TEXT PRIMARY KEY,
+            last_run_at REAL NOT NULL
+        );
+    """
+    )
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path or default_db_path("jobs.sqlite3"))
+
+    def get_last_run(self, key: str) -> Optional[float]:
+        """Return when a query last completed, as a Unix timestamp."""
+        row = self.fetchone(
+            "SELECT last_run_at FROM job_watch_state WHERE query_key = ?", (key,)
+        )
+        return row["last_run_at"] if row else None
+
+    def set_last_run(self, key: str, last_run_at: float):
+        """Record when a query last completed."""
+        self.execute(
+            """
+            INSERT INTO job_watch_state VALUES (?, ?)
+            ON CONFLICT (query_key) DO UPDATE SET last_run_at = excluded.last_run_at
+            """,
+            (key, last_run_at),
+        )
+
+    def forget(self, entity_type: str, seen_before: float):
+        """Drop entities of a type recorded before ``seen_before``."""
+        self.execute(
+            "DELETE FROM seen WHERE entity_type = ? AND seen_at < ?",
+            (entity_type, seen_before),
+        )
+
+
+class JobWatcher(object):
+    """
+    Poll saved job searches and report only postings not reported before.
+
+    Each poll asks for the smallest ``timePostedRange`` that covers the time
+    since the query's previous poll (plus ``slack``), so repeated polls only
+    fetch recent postings, usually a single page. Postings in the overlap are
+    filtered out by job ID. A poll that finds nothing leaves the query's
+    state alone, since an empty result may be a failed request.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param store: Watch state. Defaults to a :class:`JobWatchStore` at the
+        default location.
+    :type store: JobWatchStore, optional
+    :param slack: Seconds of overlap between consecutive polls, to allow for
+        clock skew and indexing delay
+    :type slack: int, optional
+    :param initial_window: Posting age, in seconds, covered by a query's first poll
+    :type initial_window: int, optional
+    :param max_window: Largest posting age, in seconds, a poll ever asks for
+    :type max_window: int, optional
+    :param timer: Clock returning the current Unix time
+    :type timer: callable, optional
+    """
+
+    def __init__(
+        self,
+        api,
+        store: Optional[JobWatchStore] = None,
+        slack: int = 15 * 60,
+        initial_window: int = 24 * 60 * 60,
+        max_window: int = 30 * 24 * 60 * 60,
+        timer: Callable[[], float] = time.time,
+    ):
+        self.api = api
+        self.store = store or JobWatchStore()
+        self.slack = slack
+        self.initial_window = initial_window
+        self.max_window = max_window
+        self._timer = timer
+
+    def window(self, key: str, now: float) -> int:
+        """Return the ``listed_at`` window, in seconds, for the next poll of a query."""
+        last_run = self.store.get_last_run(key)
+        if last_run is None:
+            return self.initial_window
+        return min(self.max_window, math.ceil(now - last_run + self.slack))
+
+    def poll(self, **query) -> List[Dict]:
+        """Run a saved query and return the postings it has not reported yet.
+
+        :param query: Keyword arguments for :meth:`Linkedin.search_jobs`, except
+            ``listed_at``, which the watcher sets
+        :type query: dict
+
+        :return: New job postings, as returned by :meth:`Linkedin.search_jobs`
+        :rtype: list
+        """
+        if "listed_at" in query:
+            raise ValueError("listed_at is managed by the watcher")
+        key = query_key(query)
+        entity_type = f"{JOBS}:{key}"
+        now = self._timer()
+        listed_at = self.window(key, now)
+
+        jobs = self.api.search_jobs(listed_at=listed_at, **query)
+        if not jobs:
+            # search_jobs also returns nothing when the request failed; keep
+            # the window, so the next poll covers this one's too
+            logger.debug(f"No postings in the last {listed_at}s for {key}")
+            return []
+        # A posting reported before this poll's window was posted before it
+        # too, so it can't be among the results; drop those sightings
+        self.store.forget(entity_type, seen_before=now - listed_at)
+        new_jobs = self.store.unseen(entity_type, jobs, key=job_id)
+
+        self.store.add(entity_type, [job_id(job) for job in new_jobs], seen_at=now)
+        self.store.set_last_run(key, now)
+
+        logger.debug(
+            f"{len(new_jobs)} new of {len(jobs)} postings in the last "
+            f"{listed_at}s for {key}"
+        )
+        return new_jobs
+
+    def poll_many(
+        self, queries: Iterable[Dict], concurrency: int = 4
+    ) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """Poll many saved queries concurrently.
+
+        :param queries: Keyword arguments for :meth:`poll`, one dict per query
+        :type queries: iterable
+        :param concurrency: Number of queries polled at once
+        :type concurrency: int, optional
+
+        :return: Iterator of ``(query, new postings or exception)`` pairs
+        :rtype: iterator
+        """
+        return Scheduler(concurrency).map(lambda q: self.poll(**q), queries)
+
+
+# Values of the search_jobs filters a capped grid cell can be split on
+SHARD_FILTERS: Dict[str, List[str]] = {
+    "experience": ["1", "2", "3", "4", "5", "6"],
+    "job_type": ["F", "C", "P", "T", "I", "V", "O"],
+    "remote": ["1", "2", "3"],
+}
+
+
+class JobGridCrawler(object):
+    """
+    Crawl ``search_jobs`` over every keyword × location × filter combination.
+
+    Every combination (a cell) is one ``search_jobs`` query; cells run
+    concurrently, so the client's ``max_concurrency`` and
+    ``requests_per_minute`` apply. A cell returning :data:`SEARCH_RESULT_CAP`
+    postings or more was probably truncated, and is split into one cell per
+    value of a :data:`SHARD_FILTERS` filter it does not set yet. Postings are
+    deduplicated by job ID as they stream in.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param concurrency: Number of cells searched at once
+    :type concurrency: int, optional
+    """
+
+    def __init__(self, api, concurrency: int = 4):
+        self.api = api
+        self.scheduler = Scheduler(concurrency)
+
+    @staticmethod
+    def plan(
+        keywords: Sequence[Optional[str]] = (None,),
+        location_names: Sequence[Optional[str]] = (None,),
+        filters: Optional[Dict[str, Sequence[str]]] = None,
+        **common,
+    ) -> List[Dict]:
+        """Return the ``search_jobs`` queries of a grid.
+
+        :param keywords: Search keywords, one cell per entry
+        :type keywords: list, optional
+        :param location_names: Locations, one cell per entry
+        :type location_names: list, optional
+        :param filters: ``search_jobs`` list filters (e.g. ``experience``,
+            ``job_type``, ``remote``) mapped to the values to cross, one cell
+            per value
+        :type filters: dict, optional
+        :param common: Other ``search_jobs`` arguments, shared by every cell
+        :type common: dict
+
+        :return: List of ``search_jobs`` keyword arguments
+        :rtype: list
+        """
+        filters = filters or {}
+        names = sorted(filters)
+        cells = []
+        for keyword, location, values in itertools.product(
+            keywords,
+            location_names,
+            itertools.product(*(filters[name] for name in names)),
+        ):
+            cell = dict(common)
+            if keyword is not None:
+                cell["keywords"] = keyword
+            if location is not None:
+                cell["location_name"] = location
+            cell.update((name, [value]) for name, value in zip(names, values))
+            cells.append(cell)
+        return cells
+
+    @staticmethod
+    def _shard(cell: Dict) -> Optional[List[Dict]]:
+        for name, values in SHARD_FILTERS.items():
+            if not cell.get(name):
+                return [dict(cell, **{name: [value]}) for value in values]
+        return None
+
+    def crawl(
+        self,
+        keywords: Sequence[Optional[str]] = (None,),
+        location_names: Sequence[Optional[str]] = (None,),
+        filters: Optional[Dict[str, Sequence[str]]] = None,
+        hydrate: bool = False,
+        **common,
+    ) -> Iterator[Dict]:
+        """Crawl a grid and stream each posting once.
+
+        Takes the same arguments as :meth:`plan`.
+
+        :param hydrate: Also fetch each new posting's details and skills with
+            :meth:`Linkedin.hydrate_jobs`
+        :type hydrate: bool, optional
+
+        :return: Iterator of dicts with ``job_id``, ``query`` (the cell that
+            found it) and ``posting``, plus ``job`` (see
+            :meth:`Linkedin.hydrate_jobs`) when hydrating
+        :rtype: iterator
+        """
+        seen = set()
+        cells = self.plan(keywords, location_names, filters, **common)
+        while cells:
+            shards = []
+            for cell, jobs in self.scheduler.map(
+                lambda c: self.api.search_jobs(**c), cells
+            ):
+                if isinstance(jobs, Exception):
+                    logger.info(f"Job search {cell} failed: {jobs!r}")
+                    continue
+                if len(jobs) >= SEARCH_RESULT_CAP:
+                    split = self._shard(cell)
+                    if split:
+                        logger.debug(f"{cell} hit the result cap, splitting it")
+                        shards.extend(split)
+                    else:
+                        logger.info(f"{cell} hit the result cap and can't be split")
+
+                records = []
+                for job in jobs:
+                    jid = job_id(job)
+                    if jid in seen:
+                        continue
+                    seen.add(jid)
+                    records.append({"job_id": jid, "query": cell, "posting": job})
+
+                if hydrate:
+                    yield from self._hydrate(records)
+                else:
+                    yield from records
+            cells = shards
+
+    def _hydrate(self, records: List[Dict]) -> Iterator[Dict]:
+        by_id = {record["job_id"]: record for record in records}
+        for job in self.api.hydrate_jobs(by_id, concurrency=self.scheduler.concurrency):
+            record = by_id[job["job_id"]]
+            record["job"] = job
+            yield record
+
+
+def compact_job(job_id: str, details: Dict, skills: Dict) -> Dict:
+    """Merge a posting's details and skills into a compact record.
+
+    :param job_id: LinkedIn job ID
+    :type job_id: str
+    :param details: Job data, as returned by :meth:`Linkedin.get_job`
+    :type details: dict
+    :param skills: Job skills, as returned by :meth:`Linkedin.get_job_skills`
+    :type skills: dict
+
+    :return: Dict with ``job_id``, ``title``, ``company_name``,
+        ``company_urn``, ``location``, ``listed_at``, ``remote_allowed``,
+        ``description``, ``apply_url`` and ``skills`` (list of skill names)
+    :rtype: dict
+    """
+    details = details or {}
+    company: Dict = {}
+    for value in (details.get("companyDetails") or {}).values():
+        if isinstance(value, dict) and value.get("companyResolutionResult"):
+            company = value["companyResolutionResult"]
+            break
+    apply_url = None
+    for value in (details.get("applyMethod") or {}).values():
+        if isinstance(value, dict):
+            apply_url = value.get("companyApplyUrl") or value.get("easyApplyUrl")
+            break
+    return {
+        "job_id": job_id,
+        "title": details.get("title"),
+        "company_name": company.get("name"),
+        "company_urn": company.get("entityUrn"),
+        "location": details.get("formattedLocation"),
+        "listed_at": details.get("listedAt"),
+        "remote_allowed": details.get("workRemoteAllowed"),
+        "description": (details.get("description") or {}).get("text"),
+        "apply_url": apply_url,
+        "skills": [
+            status.get("localizedSkillDisplayName")
+            or (status.get("skill") or {}).get("name")
+            for status in (skills or {}).get("skillMatchStatuses") or []
+        ],
+    }
+
+
+class JobHydrator(object):
+    """
+    Fetch details and skills of many job postings concurrently.
+
+    Details are fetched ``batch_size`` postings per request with
+    :meth:`Linkedin.get_jobs`, or one posting per request with
+    :meth:`Linkedin.get_job` once the server has rejected a batch get;
+    skills, which have no batch endpoint, one posting per request. All
+    requests share one worker pool. Merged records are cached by job ID.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param concurrency: Number of requests to run at once
+    :type concurrency: int, optional
+    :param batch_size: Postings per details request
+    :type batch_size: int, optional
+    :param ttl: Time-to-live of cached records, in seconds
+    :type ttl: float, optional
+    :param maxsize: Maximum number of cached records
+    :type maxsize: int, optional
+    """
+
+    def __init__(
+        self,
+        api,
+        concurrency: int = 4,
+        batch_size: int = 20,
+        ttl: float = 3600.0,
+        maxsize: int = 10000,
+    ):
+        self.api = api
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def hydrate(
+        self, job_ids: Iterable[str], concurrency: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Hydrate postings, yielding each record as soon as it is complete.
+
+        :param job_ids: LinkedIn job IDs
+        :type job_ids: iterable
+        :param concurrency: Overrides the hydrator's ``concurrency``
+        :type concurrency: int, optional
+
+        :return: Iterator of records as returned by :func:`compact_job`, in
+            completion order
+        :rtype: iterator
+        """
+        pending: Dict[str, Dict] = {}
+        cached = []
+        for jid in dict.fromkeys(str(j) for j in job_ids):
+            record = self.cache.get(jid)
+            if record is not None:
+                cached.append(record)
+            else:
+                pending[jid] = {}
+        yield from cached
+
+        concurrency = concurrency or self.concurrency
+        batched = self.api._job_batches_supported
+        batch_size = self.batch_size if batched else 1
+        ids = list(pending)
+        tasks = [
+            ("details", ids[i : i + batch_size])
+            for i in range(0, len(ids), batch_size)
+        ] + [("skills", [jid]) for jid in ids]
+
+        def run(task):
+            kind, batch = task
+            if kind == "skills":
+                return {batch[0]: self.api.get_job_skills(batch[0])}
+            if batched:
+                return self.api.get_jobs(batch, concurrency=concurrency)
+            return {batch[0]: self.api.get_job(batch[0])}
+
+        scheduler = Scheduler(concurrency)
+        for (kind, batch), result in scheduler.map(run, tasks):
+            if isinstance(result, Exception):
+                logger.info(f"Fetching job {kind} for {batch} failed: {result!r}")
+                result = {}
+            for jid in batch:
+                parts = pending[jid]
+                parts[kind] = result.get(jid) or {}
+                if len(parts) < 2:
+                    continue
+                record = compact_job(jid, parts["details"], parts["skills"])
+                # Empty details usually mean a failed request; don't remember them
+                if parts["details"]:
+                    self.cache.set(jid, record)
+                yield record
@@ -11,9 +11,26 @@ import warnings
 from operator import itemgetter
 from time import sleep
 from urllib.parse import urlencode, quote
-from typing import Dict, Union, Optional, List, Literal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Union,
+    Optional,
+    List,
+    Literal,
+    Tuple,
+)
 
 from linkedin_api.client import Client
+from linkedin_api.experiences import parse_experiences
+from linkedin_api.hydration import ProfileHydrator
+from linkedin_api.jobs import JobHydrator
+from linkedin_api.organizations import OrganizationCache
+from linkedin_api.scheduler import Scheduler
+from linkedin_api.seen import COMPANIES, JOBS, PEOPLE, SeenIndex
 from linkedin_api.utils.helpers import (
     get_id_from_urn,
     get_urn_from_raw_update,
@@ -23,9 +40,33 @@ from linkedin_api.utils.helpers import (
     generate_trackingId,
     generate_trackingId_as_charString,
 )
+from linkedin_api.utils.extract import Extractor
+from linkedin_api.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Fields of search results (entityResult) of people and companies
+_PERSON_RESULT = Extractor(
+    {
+        "urn_id": (
+            "entityUrn",
+            lambda urn: get_id_from_urn(get_urn_from_raw_update(urn)),
+        ),
+        "distance": "entityCustomTrackingInfo.memberDistance",
+        "jobtitle": "primarySubtitle.text",
+        "location": "secondarySubtitle.text",
+        "name": "title.text",
+    }
+)
+_COMPANY_RESULT = Extractor(
+    {
+        "urn_id": ("trackingUrn", get_id_from_urn),
+        "name": "title.text",
+        "headline": "primarySubtitle.text",
+        "subline": "secondarySubtitle.text",
+    }
+)
+
 
 def default_evade():
     """
@@ -35,14 +76,36 @@ def default_evade():
     sleep(random.randint(2, 5))  # sleep a random duration to try and evade suspention
 
 
+def _request_key(method: str, url: str, kwargs: Dict) -> tuple:
+    """Return a hashable key identifying a request, independent of argument order."""
+    params = kwargs.get("params") or {}
+    if isinstance(params, dict):
+        params = sorted((str(k), str(v)) for k, v in params.items())
+    headers = kwargs.get("headers") or {}
+    headers = sorted((str(k).lower(), str(v)) for k, v in headers.items())
+    others = sorted(
+        (k, repr(v)) for k, v in kwargs.items() if k not in ("params", "headers")
+    )
+    return (method, url, repr(params), tuple(headers), tuple(others))
+
+
 class Linkedin(object):
     """
     Class for accessing the LinkedIn API.
 
+    A single instance may be shared between threads, e.g. by the workers of a
+    ``ThreadPoolExecutor``.
+
     :param username: Username of LinkedIn account.
     :type username: str
     :param password: Password of LinkedIn account.
     :type password: str
+    :param max_concurrency: Maximum number of requests in flight at once,
+        across all threads using this instance. Defaults to no limit.
+    :type max_concurrency: int, optional
+    :param requests_per_minute: Request budget shared by all threads using this
+        instance, on top of the per-request evade delay. Defaults to no limit.
+    :type requests_per_minute: float, optional
     """
 
     _MAX_POST_COUNT = 100  # max seems to be 100 posts per page
@@ -51,6 +114,11 @@ class Linkedin(object):
     _MAX_REPEATED_REQUESTS = (
         200  # VERY conservative max requests count to avoid rate-limit
     )
+    _MAX_BATCH_URL_LENGTH = 4000  # keep batch-get URLs well under server limits
+    _BATCH_REJECTED = "batch rejected"  # _batch_get error of unbatchable IDs
+    _PROFILE_COMPONENTS_QUERY_ID = (
+        "voyagerIdentityDashProfileComponents.7af5d6f176f11583b382e37e5639e69e"
+    )
 
     def __init__(
         self,
@@ -64,6 +132,8 @@ class Linkedin(object):
         cookies=None,
         cookies_dir: str = "",
         useragent: str = None,  # Add useragent parameter
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
     ):
         """Constructor method"""
         self.client = Client(
@@ -72,9 +142,17 @@ class Linkedin(object):
             proxies=proxies,
             cookies_dir=cookies_dir,
             useragent=useragent,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
         )
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
         self.logger = logger
+        self._inflight = SingleFlight()
+        self.profile_hydrator = ProfileHydrator(self)
+        self.job_hydrator = JobHydrator(self)
+        # Cleared once /jobs/jobPostings rejects a batch get
+        self._job_batches_supported = True
+        self.organizations = OrganizationCache(self)
 
         if authenticate:
             if cookies:
@@ -84,12 +162,164 @@ class Linkedin(object):
             else:
                 self.client.authenticate(username, password)
 
-    def _fetch(self, uri: str, evade=default_evade, base_request=False, **kwargs):
-        """GET request to Linkedin API"""
-        evade()
+    def _fetch(
+        self,
+        uri: str,
+        evade=default_evade,
+        base_request=False,
+        coalesce=False,
+        **kwargs,
+    ):
+        """GET request to Linkedin API
 
+        With ``coalesce=True``, concurrent identical requests share a single
+        network call (and a single evade delay), and the JSON body is decoded
+        once for all of them. Callers then receive the same decoded object, so
+        only coalesce requests whose payload is not mutated.
+        """
         url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.get(url, **kwargs)
+        if not coalesce:
+            evade()
+            with self.client.request_slot():
+                return self.client.session.get(url, **kwargs)
+
+        def request():
+            evade()
+            with self.client.request_slot():
+                res = self.client.session.get(url, **kwargs)
+            data = res.json()
+            res.json = lambda **_: data
+            return res
+
+        return self._inflight.do(_request_key("GET", url, kwargs), request)
+
+    def _batch_get(
+        self,
+        uri: str,
+        ids: Iterable[str],
+        batch_size: int = 50,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> Tuple[Dict[str, Dict], List[Dict], Dict[str, Any]]:
+        """Fetch many entities of a collection with Rest.li batch gets.
+
+        IDs are sent ``batch_size`` at a time as ``?ids=List(...)``. A batch
+        whose URL would be too long, or that the server rejects as too long
+        (414), is split in two and retried. A 400 on a batch of several IDs
+        means the endpoint does not take batches: fetching stops, and every
+        ID not fetched yet gets the error ``_BATCH_REJECTED``, so the caller
+        can fall back to single gets.
+
+        :param uri: Collection URI, e.g. ``/organization/companies``
+        :type uri: str
+        :param ids: Entity keys
+        :type ids: iterable
+        :param batch_size: Maximum number of IDs per request
+        :type batch_size: int, optional
+        :param params: Extra query parameters, e.g. ``decorationId``
+        :type params: dict, optional
+        :param headers: Extra request headers
+        :type headers: dict, optional
+
+        :return: Tuple of entities keyed by ID, included entities (for
+            normalized responses), and errors keyed by ID for IDs that could
+            not be fetched
+        :rtype: tuple
+        """
+        ids = [str(i) for i in dict.fromkeys(ids)]
+        results: Dict[str, Dict] = {}
+        included: List[Dict] = []
+        errors: Dict[str, Any] = {}
+        query = f"&{urlencode(params)}" if params else ""
+
+        batches = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+        while batches:
+            batch = batches.pop(0)
+            keys = ",".join(quote(i, safe="") for i in batch)
+            url = f"{uri}?ids=List({keys}){query}"
+            if len(url) > Linkedin._MAX_BATCH_URL_LENGTH and len(batch) > 1:
+                half = len(batch) // 2
+                batches[:0] = [batch[:half], batch[half:]]
+                continue
+
+            res = self._fetch(url, headers=headers or {})
+            if res.status_code == 414 and len(batch) > 1:
+                half = len(batch) // 2
+                batches[:0] = [batch[:half], batch[half:]]
+                continue
+            if res.status_code == 400 and len(batch) > 1:
+                self.logger.info(f"{uri} rejected a batch get of {len(batch)} IDs")
+                for i in batch + [i for rest in batches for i in rest]:
+                    errors[i] = Linkedin._BATCH_REJECTED
+                break
+            if res.status_code != 200:
+                errors.update((i, res.status_code) for i in batch)
+                continue
+
+            payload = res.json()
+            # Normalized responses nest the batch under "data" and reference
+            # entities in "included" by URN
+            data = payload.get("data", payload)
+            batch_included = payload.get("included", [])
+            included.extend(batch_included)
+            by_urn = {item.get("entityUrn"): item for item in batch_included}
+            found = data.get("results") or data.get("*results") or {}
+            batch_errors = data.get("errors") or {}
+            for i in batch:
+                entity = found.get(i)
+                if isinstance(entity, str):
+                    entity = by_urn.get(entity)
+                if entity:
+                    results[i] = entity
+                else:
+                    errors[i] = batch_errors.get(i) or "not found"
+
+        return results, included, errors
+
+    def map(
+        self,
+        method_name: str,
+        inputs: Iterable[Any],
+        concurrency: int = 4,
+        ordered: bool = False,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Run a method of this class over many inputs concurrently.
+
+        Each input is passed to the method as its first positional argument,
+        unless it is a tuple (positional arguments) or a dict (keyword arguments).
+        All calls share this instance's ``max_concurrency`` and
+        ``requests_per_minute`` budgets.
+
+        Example::
+
+            for public_id, company in api.map("get_company", ["linkedin", "google"]):
+                if isinstance(company, Exception):
+                    continue
+                ...
+
+        :param method_name: Name of the method to call, e.g. ``"get_profile_v2"``
+        :type method_name: str
+        :param inputs: Inputs to call the method with
+        :type inputs: iterable
+        :param concurrency: Number of calls to run at once
+        :type concurrency: int, optional
+        :param ordered: Yield results in input order instead of completion order
+        :type ordered: bool, optional
+
+        :return: Iterator of ``(input, result)`` pairs. If a call raised, the
+            result is the exception.
+        :rtype: iterator
+        """
+        method = getattr(self, method_name)
+
+        def call(item):
+            if isinstance(item, dict):
+                return method(**item)
+            if isinstance(item, tuple):
+                return method(*item)
+            return method(item)
+
+        return Scheduler(concurrency).map(call, inputs, ordered=ordered)
 
     def _cookies(self):
         """Return client cookies"""
@@ -104,7 +334,8 @@ class Linkedin(object):
         evade()
 
         url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.post(url, **kwargs)
+        with self.client.request_slot():
+            return self.client.session.post(url, **kwargs)
 
     def get_profile_posts(
         self,
@@ -203,7 +434,57 @@ class Linkedin(object):
             data["paging"] = res.json()["paging"]
         return data["elements"]
 
-    def search(self, params: Dict, limit=-1, offset=0) -> List:
+    def _fetch_search_page(self, params: Dict, start: int) -> Optional[Dict]:
+        """Fetch one page of search results.
+
+        :return: The ``searchDashClustersByAll`` collection, or None if the
+            request failed
+        :rtype: dict
+        """
+        default_params = {
+            "filters": "List()",
+            "origin": "GLOBAL_SEARCH_HEADER",
+        }
+        default_params.update(params)
+
+        keywords = (
+            f"keywords:{default_params['keywords']},"
+            if "keywords" in default_params
+            else ""
+        )
+
+        res = self._fetch(
+            f"/graphql?variables=(start:{start},origin:{default_params['origin']},"
+            f"query:("
+            f"{keywords}"
+            f"flagshipSearchIntent:SEARCH_SRP,"
+            f"queryParameters:{default_params['filters']},"
+            f"includeFiltersInResponse:false))&queryId=voyagerSearchDashClusters"
+            f".b0928897b71bd00a5a7291755dcd64f0"
+        )
+        data = res.json()
+
+        data_clusters = data.get("data", {}).get("searchDashClustersByAll", [])
+
+        if not data_clusters:
+            return None
+
+        if (
+            not data_clusters.get("_type", [])
+            == "com.linkedin.restli.common.CollectionResponse"
+        ):
+            return None
+
+        return data_clusters
+
+    def search(
+        self,
+        params: Dict,
+        limit=-1,
+        offset=0,
+        unseen: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+        predicate: Optional[Callable[[Dict], bool]] = None,
+    ) -> List:
         """Perform a LinkedIn search.
 
         :param params: Search parameters (see code)
@@ -212,57 +493,27 @@ class Linkedin(object):
         :type limit: int, optional
         :param offset: Index to start searching from
         :type offset: int, optional
+        :param unseen: Called with each page of results, returns the ones not
+            seen before. Only those are kept, and the search stops at the
+            first page with none.
+        :type unseen: callable, optional
+        :param predicate: Only keep results for which this returns True.
+            Applied as pages arrive, so ``limit`` counts kept results and no
+            page is fetched once enough of them are found.
+        :type predicate: callable, optional
 
 
         :return: List of search results
         :rtype: list
         """
-        count = Linkedin._MAX_SEARCH_COUNT
         if limit is None:
             limit = -1
 
         results = []
+        fetched = 0
         while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "count": str(count),
-                "filters": "List()",
-                "origin": "GLOBAL_SEARCH_HEADER",
-                "q": "all",
-                "start": len(results) + offset,
-                "queryContext": "List(spellCorrectionEnabled->true,relatedSearchesEnabled->true,kcardTypes->PROFILE|COMPANY)",
-                "includeWebMetadata": "true",
-            }
-            default_params.update(params)
-
-            keywords = (
-                f"keywords:{default_params['keywords']},"
-                if "keywords" in default_params
-                else ""
-            )
-
-            res = self._fetch(
-                f"/graphql?variables=(start:{default_params['start']},origin:{default_params['origin']},"
-                f"query:("
-                f"{keywords}"
-                f"flagshipSearchIntent:SEARCH_SRP,"
-                f"queryParameters:{default_params['filters']},"
-                f"includeFiltersInResponse:false))&queryId=voyagerSearchDashClusters"
-                f".b0928897b71bd00a5a7291755dcd64f0"
-            )
-            data = res.json()
-
-            data_clusters = data.get("data", {}).get("searchDashClustersByAll", [])
-
-            if not data_clusters:
-                return []
-
-            if (
-                not data_clusters.get("_type", [])
-                == "com.linkedin.restli.common.CollectionResponse"
-            ):
+            data_clusters = self._fetch_search_page(params, fetched + offset)
+            if data_clusters is None:
                 return []
 
             new_elements = []
@@ -290,6 +541,17 @@ class Linkedin(object):
                         continue
                     new_elements.append(e)
 
+            if not new_elements:
+                break
+            fetched += len(new_elements)
+
+            if unseen is not None:
+                new_elements = unseen(new_elements)
+                if not new_elements:
+                    self.logger.debug("page entirely seen before, stopping")
+                    break
+            if predicate is not None:
+                new_elements = [e for e in new_elements if predicate(e)]
             results.extend(new_elements)
 
             # break the loop if we're done searching
@@ -297,13 +559,30 @@ class Linkedin(object):
             # This is in data["data"]["paging"]["total"]
             if (
                 (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(new_elements) == 0:
+                or fetched / Linkedin._MAX_SEARCH_COUNT
+                >= Linkedin._MAX_REPEATED_REQUESTS
+            ):
                 break
 
             self.logger.debug(f"results grew to {len(results)}")
 
-        return results
+        return results[:limit] if limit > -1 else results
+
+    def search_total(self, params: Dict) -> Optional[int]:
+        """Return the number of results LinkedIn reports for a search.
+
+        Costs a single request (the first page of results).
+
+        :param params: Search parameters, as passed to :meth:`search`
+        :type params: dict
+
+        :return: Total number of results, or None if it is unknown
+        :rtype: int
+        """
+        data_clusters = self._fetch_search_page(params, 0)
+        if data_clusters is None:
+            return None
+        return (data_clusters.get("paging") or {}).get("total")
 
     def search_people(
         self,
@@ -333,6 +612,7 @@ class Linkedin(object):
             Union[Literal["F"], Literal["S"], Literal["O"]]
         ] = None,  # DEPRECATED - use network_depths
         title: Optional[str] = None,  # DEPRECATED - use keyword_title
+        seen: Optional[SeenIndex] = None,
         **kwargs,
     ) -> List[Dict]:
         """Perform a LinkedIn search for people.
@@ -375,10 +655,92 @@ class Linkedin(object):
         :type connection_of: str, optional
         :param limit: Maximum length of the returned list, defaults to -1 (no limit)
         :type limit: int, optional
+        :param seen: Skip people recorded in this index, and stop at the first
+            page of results that are all known
+        :type seen: SeenIndex, optional
 
         :return: List of profiles (minimal data only)
         :rtype: list
         """
+        params = self._search_people_params(
+            keywords=keywords,
+            connection_of=connection_of,
+            network_depths=network_depths,
+            current_company=current_company,
+            past_companies=past_companies,
+            nonprofit_interests=nonprofit_interests,
+            profile_languages=profile_languages,
+            regions=regions,
+            industries=industries,
+            schools=schools,
+            service_categories=service_categories,
+            keyword_first_name=keyword_first_name,
+            keyword_last_name=keyword_last_name,
+            keyword_title=keyword_title,
+            keyword_company=keyword_company,
+            keyword_school=keyword_school,
+            network_depth=network_depth,
+            title=title,
+        )
+
+        if seen is not None:
+            kwargs["unseen"] = lambda items: seen.unseen(
+                PEOPLE,
+                items,
+                key=lambda item: get_id_from_urn(
+                    get_urn_from_raw_update(item.get("entityUrn", None))
+                ),
+            )
+
+        if not include_private_profiles:
+            kwargs["predicate"] = (
+                lambda item: (item.get("entityCustomTrackingInfo") or {}).get(
+                    "memberDistance", None
+                )
+                != "OUT_OF_NETWORK"
+            )
+
+        data = self.search(params, **kwargs)
+
+        return _PERSON_RESULT.many(data)
+
+    def search_people_total(self, **filters) -> Optional[int]:
+        """Return the number of people LinkedIn reports for a people search.
+
+        :param filters: Any filter accepted by :meth:`search_people`
+        :type filters: dict
+
+        :return: Total number of results, or None if it is unknown
+        :rtype: int
+        """
+        filters.pop("include_private_profiles", None)
+        filters.pop("limit", None)
+        filters.pop("offset", None)
+        return self.search_total(self._search_people_params(**filters))
+
+    @staticmethod
+    def _search_people_params(
+        keywords: Optional[str] = None,
+        connection_of: Optional[str] = None,
+        network_depths: Optional[List[str]] = None,
+        current_company: Optional[List[str]] = None,
+        past_companies: Optional[List[str]] = None,
+        nonprofit_interests: Optional[List[str]] = None,
+        profile_languages: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        schools: Optional[List[str]] = None,
+        contact_interests: Optional[List[str]] = None,
+        service_categories: Optional[List[str]] = None,
+        keyword_first_name: Optional[str] = None,
+        keyword_last_name: Optional[str] = None,
+        keyword_title: Optional[str] = None,
+        keyword_company: Optional[str] = None,
+        keyword_school: Optional[str] = None,
+        network_depth: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> Dict:
+        """Build the :meth:`search` parameters of a people search."""
         filters = ["(key:resultType,value:List(PEOPLE))"]
         if connection_of:
             filters.append(f"(key:connectionOf,value:List({connection_of}))")
@@ -429,39 +791,21 @@ class Linkedin(object):
         if keywords:
             params["keywords"] = keywords
 
-        data = self.search(params, **kwargs)
-
-        results = []
-        for item in data:
-            if (
-                not include_private_profiles
-                and (item.get("entityCustomTrackingInfo") or {}).get(
-                    "memberDistance", None
-                )
-                == "OUT_OF_NETWORK"
-            ):
-                continue
-            results.append(
-                {
-                    "urn_id": get_id_from_urn(
-                        get_urn_from_raw_update(item.get("entityUrn", None))
-                    ),
-                    "distance": (item.get("entityCustomTrackingInfo") or {}).get(
-                        "memberDistance", None
-                    ),
-                    "jobtitle": (item.get("primarySubtitle") or {}).get("text", None),
-                    "location": (item.get("secondarySubtitle") or {}).get("text", None),
-                    "name": (item.get("title") or {}).get("text", None),
-                }
-            )
-
-        return results
+        return params
 
-    def search_companies(self, keywords: Optional[List[str]] = None, **kwargs) -> List:
+    def search_companies(
+        self,
+        keywords: Optional[List[str]] = None,
+        seen: Optional[SeenIndex] = None,
+        **kwargs,
+    ) -> List:
         """Perform a LinkedIn search for companies.
 
         :param keywords: A list of search keywords (str)
         :type keywords: list, optional
+        :param seen: Skip companies recorded in this index, and stop at the
+            first page of results that are all known
+        :type seen: SeenIndex, optional
 
         :return: List of companies
         :rtype: list
@@ -476,22 +820,20 @@ class Linkedin(object):
         if keywords:
             params["keywords"] = keywords
 
-        data = self.search(params, **kwargs)
-
-        results = []
-        for item in data:
-            if "company" not in item.get("trackingUrn"):
-                continue
-            results.append(
-                {
-                    "urn_id": get_id_from_urn(item.get("trackingUrn", None)),
-                    "name": (item.get("title") or {}).get("text", None),
-                    "headline": (item.get("primarySubtitle") or {}).get("text", None),
-                    "subline": (item.get("secondarySubtitle") or {}).get("text", None),
-                }
+        if seen is not None:
+            kwargs["unseen"] = lambda items: seen.unseen(
+                COMPANIES,
+                items,
+                key=lambda item: get_id_from_urn(item.get("trackingUrn") or ""),
             )
 
-        return results
+        data = self.search(
+            params,
+            predicate=lambda item: "company" in (item.get("trackingUrn") or ""),
+            **kwargs,
+        )
+
+        return _COMPANY_RESULT.many(data)
 
     def search_jobs(
         self,
@@ -530,6 +872,7 @@ class Linkedin(object):
         distance: Optional[int] = None,
         limit=-1,
         offset=0,
+        seen: Optional[SeenIndex] = None,
         **kwargs,
     ) -> List[Dict]:
         """Perform a LinkedIn search for jobs.
@@ -558,6 +901,9 @@ class Linkedin(object):
         :type limit: int, optional, default -1
         :param offset: indicates how many search results shall be skipped
         :type offset: int, optional
+        :param seen: Skip jobs recorded in this index (by job ID), and stop at
+            the first page of results that are all known
+        :type seen: SeenIndex, optional
         :return: List of jobs
         :rtype: list
         """
@@ -618,6 +964,7 @@ class Linkedin(object):
             .replace("}", ")")
         )
         results = []
+        fetched = 0
         while True:
             # when we're close to the limit, only fetch what we need to
             if limit > -1 and limit - len(results) < count:
@@ -627,7 +974,7 @@ class Linkedin(object):
                 "count": count,
                 "q": "jobSearch",
                 "query": query_string,
-                "start": len(results) + offset,
+                "start": fetched + offset,
             }
 
             res = self._fetch(
@@ -645,13 +992,25 @@ class Linkedin(object):
             # break the loop if we're done searching or no results returned
             if not new_data:
                 break
+            fetched += len(new_data)
+            # a short page is the last one, don't ask for an empty one after it
+            last_page = len(new_data) < count
+            if seen is not None:
+                new_data = seen.unseen(
+                    JOBS,
+                    new_data,
+                    key=lambda job: get_id_from_urn(job.get("entityUrn") or ""),
+                )
+                if not new_data:
+                    self.logger.debug("page entirely seen before, stopping")
+                    break
             # NOTE: we could also check for the `total` returned in the response.
             # This is in data["data"]["paging"]["total"]
             results.extend(new_data)
             if (
                 (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(elements) == 0:
+                or fetched / count >= Linkedin._MAX_REPEATED_REQUESTS
+            ) or last_page:
                 break
 
             self.logger.debug(f"results grew to {len(results)}")
@@ -755,8 +1114,15 @@ class Linkedin(object):
             'cache-control': 'no-cache',
         }
 
-        # The session already has cookies set, so they'll be included automatically
-        res = self.client.session.get(url, headers=headers, allow_redirects=False)
+        # The session already has cookies set, so they'll be included automatically.
+        # Concurrent resolutions of the same public ID share one page fetch.
+        kwargs = {"headers": headers, "allow_redirects": False}
+
+        def request():
+            with self.client.request_slot():
+                return self.client.session.get(url, **kwargs)
+
+        res = self._inflight.do(_request_key("GET", url, kwargs), request)
 
         if res.status_code == 302 or res.status_code == 301:
             location = res.headers.get('location', '')
@@ -895,6 +1261,7 @@ class Linkedin(object):
             f"/identity/dash/profiles/{profile_urn}"
             f"?decorationId=com.linkedin.voyager.dash.deco.identity.profile.FullProfile-76",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+            coalesce=True,
         )
 
         data = res.json()
@@ -906,7 +1273,37 @@ class Linkedin(object):
         if not profile_data:
             return {}
 
-        # Build a clean profile dict
+        included = data.get("included", [])
+        # A single profile's response only holds its own industry, so it can
+        # be used even when the profile does not reference it
+        industry = next(
+            (
+                item
+                for item in included
+                if item.get("$type") == "com.linkedin.voyager.dash.common.Industry"
+            ),
+            None,
+        )
+        return self._parse_profile_v2(
+            profile_data,
+            {item.get("entityUrn"): item for item in included},
+            urn_id,
+            default_industry=industry,
+        )
+
+    @staticmethod
+    def _parse_profile_v2(
+        profile_data: Dict,
+        included: Dict[str, Dict],
+        urn_id: str,
+        default_industry: Optional[Dict] = None,
+    ) -> Dict:
+        """Build a clean profile dict from a ``FullProfile-76`` entity.
+
+        :param included: Included entities of the response, keyed by ``entityUrn``
+        :param default_industry: Industry entity to use when the profile does
+            not reference one
+        """
         profile = {
             "firstName": profile_data.get("firstName"),
             "lastName": profile_data.get("lastName"),
@@ -967,26 +1364,113 @@ class Linkedin(object):
             }
 
         # Extract industry from included entities
-        included = data.get("included", [])
-        for item in included:
-            if item.get("$type") == "com.linkedin.voyager.dash.common.Industry":
-                profile["industryName"] = item.get("name")
-                profile["industryUrn"] = item.get("entityUrn")
-                break
+        industry_urn = profile_data.get("*industry") or profile_data.get("industryUrn")
+        industry = included.get(industry_urn) if industry_urn else default_industry
+        if (
+            industry
+            and industry.get("$type") == "com.linkedin.voyager.dash.common.Industry"
+        ):
+            profile["industryName"] = industry.get("name")
+            profile["industryUrn"] = industry.get("entityUrn")
 
         # Extract geo names from included entities
         geo_urn = geo.get("*geo") or geo.get("geoUrn")
-        if geo_urn:
-            for item in included:
-                if (
-                    item.get("$type") == "com.linkedin.voyager.dash.common.Geo"
-                    and item.get("entityUrn") == geo_urn
-                ):
-                    profile["geoLocationName"] = item.get("defaultLocalizedName")
-                    break
+        geo_item = included.get(geo_urn) if geo_urn else None
+        if geo_item and geo_item.get("$type") == "com.linkedin.voyager.dash.common.Geo":
+            profile["geoLocationName"] = geo_item.get("defaultLocalizedName")
 
         return profile
 
+    def get_profiles_v2(
+        self, urn_ids: Iterable[str], batch_size: int = 25
+    ) -> Dict[str, Dict]:
+        """Fetch many profiles using the new dash endpoint, several per request.
+
+        :param urn_ids: LinkedIn URN IDs for profiles
+        :type urn_ids: iterable
+        :param batch_size: Maximum number of profiles per request
+        :type batch_size: int, optional
+
+        :return: Profiles as returned by :meth:`get_profile_v2`, keyed by URN
+            ID. Profiles that could not be fetched map to an empty dict.
+        :rtype: dict
+        """
+        urn_ids = list(dict.fromkeys(urn_ids))
+        urns = {f"urn:li:fsd_profile:{urn_id}": urn_id for urn_id in urn_ids}
+        results, included, errors = self._batch_get(
+            "/identity/dash/profiles",
+            urns,
+            batch_size=batch_size,
+            params={
+                "decorationId": "com.linkedin.voyager.dash.deco.identity.profile.FullProfile-76"
+            },
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        )
+        for urn, error in errors.items():
+            self.logger.info(f"could not fetch profile {urn}: {error}")
+
+        included_by_urn = {item.get("entityUrn"): item for item in included}
+        return {
+            urn_id: (
+                self._parse_profile_v2(results[urn], included_by_urn, urn_id)
+                if urn in results
+                else {}
+            )
+            for urn, urn_id in urns.items()
+        }
+
+    def hydrate_profiles(
+        self,
+        identifiers: Iterable[str],
+        sections: Optional[List[str]] = None,
+        concurrency: int = 4,
+    ) -> Iterator[Dict]:
+        """Fetch full profiles for many public IDs or URNs concurrently.
+
+        Chains :meth:`_resolve_public_id_to_urn`, :meth:`get_profile_v2`,
+        :meth:`get_profile_experiences`, :meth:`get_profile_skills` and
+        :meth:`get_profile_contact_info`. A profile's sections are fetched in
+        parallel as soon as its URN is known, and every stage is cached on this
+        instance (see :class:`~linkedin_api.hydration.ProfileHydrator`).
+
+        :param identifiers: Public IDs, URN IDs or full profile URNs
+        :type identifiers: iterable
+        :param sections: Sections to fetch, any of ``"profile"``,
+            ``"experiences"``, ``"skills"`` and ``"contact_info"``. Defaults to all.
+        :type sections: list, optional
+        :param concurrency: Number of requests to run at once
+        :type concurrency: int, optional
+
+        :return: Iterator of hydrated profile dicts, in completion order
+        :rtype: iterator
+        """
+        return self.profile_hydrator.hydrate(
+            identifiers, sections=sections, concurrency=concurrency
+        )
+
+    def hydrate_jobs(
+        self,
+        job_ids: Iterable[str],
+        concurrency: int = 4,
+    ) -> Iterator[Dict]:
+        """Fetch details and skills for many job postings concurrently.
+
+        Details come from :meth:`get_jobs`, several postings per request, and
+        skills from :meth:`get_job_skills`; both run in parallel across jobs.
+        Records are cached on this instance by job ID (see
+        :class:`~linkedin_api.jobs.JobHydrator`).
+
+        :param job_ids: LinkedIn job IDs
+        :type job_ids: iterable
+        :param concurrency: Number of requests to run at once
+        :type concurrency: int, optional
+
+        :return: Iterator of compact job records, in completion order (see
+            :func:`~linkedin_api.jobs.compact_job`)
+        :rtype: iterator
+        """
+        return self.job_hydrator.hydrate(job_ids, concurrency=concurrency)
+
     def get_profile_connections(self, urn_id: str, **kwargs) -> List:
         """Fetch connections for a given LinkedIn profile.
 
@@ -1015,137 +1499,74 @@ class Linkedin(object):
         variables = ",".join(
             [f"profileUrn:{quote(profile_urn)}", "sectionType:experience"]
         )
-        query_id = (
-            "voyagerIdentityDashProfileComponents.7af5d6f176f11583b382e37e5639e69e"
-        )
 
         res = self._fetch(
-            f"/graphql?variables=({variables})&queryId={query_id}&includeWebMetadata=true",
+            f"/graphql?variables=({variables})&queryId={Linkedin._PROFILE_COMPONENTS_QUERY_ID}&includeWebMetadata=true",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
         )
 
-        def parse_item(item, is_group_item=False):
-            """
-            Parse a single experience item.
-
-            Items as part of an 'experience group' (e.g. a company with multiple positions) have different data structures.
-            Therefore, some exceptions need to be made when parsing these items.
-            """
-            component = item["components"]["entityComponent"]
-            title = component["titleV2"]["text"]["text"]
-            subtitle = component["subtitle"]
-            company = subtitle["text"].split(" · ")[0] if subtitle else None
-            employment_type_parts = subtitle["text"].split(" · ") if subtitle else None
-            employment_type = (
-                employment_type_parts[1]
-                if employment_type_parts and len(employment_type_parts) > 1
-                else None
-            )
-            metadata = component.get("metadata", {}) or {}
-            location = metadata.get("text")
-
-            duration_text = component["caption"]["text"]
-            duration_parts = duration_text.split(" · ")
-            date_parts = duration_parts[0].split(" - ")
+        return parse_experiences(res.json(), fetch_page=self._fetch_experience_page)
 
-            duration = (
-                duration_parts[1]
-                if duration_parts and len(duration_parts) > 1
-                else None
-            )
-            start_date = date_parts[0] if date_parts else None
-            end_date = date_parts[1] if date_parts and len(date_parts) > 1 else None
-
-            sub_components = component["subComponents"]
-            fixed_list_component = (
-                sub_components["components"][0]["components"]["fixedListComponent"]
-                if sub_components
-                else None
-            )
-
-            fixed_list_text_component = (
-                fixed_list_component["components"][0]["components"]["textComponent"]
-                if fixed_list_component
-                else None
-            )
-
-            # Extract additional description
-            description = (
-                fixed_list_text_component["text"]["text"]
-                if fixed_list_text_component
-                else None
-            )
-
-            # Create a dictionary with the extracted information
-            parsed_data = {
-                "title": title,
-                "companyName": company if not is_group_item else None,
-                "employmentType": company if is_group_item else employment_type,
-                "locationName": location,
-                "duration": duration,
-                "startDate": start_date,
-                "endDate": end_date,
-                "description": description,
-            }
-
-            return parsed_data
+    def _fetch_experience_page(
+        self, paged_list_urn: str, start: int, count: int = 20
+    ) -> List[Dict]:
+        """Fetch more positions of a position group with a long history.
 
-        def get_grouped_item_id(item):
-            sub_components = item["components"]["entityComponent"]["subComponents"]
-            sub_components_components = (
-                sub_components["components"][0]["components"]
-                if sub_components
-                else None
-            )
-            paged_list_component_id = (
-                sub_components_components.get("*pagedListComponent", "")
-                if sub_components_components
-                else None
+        The ``sectionType`` finder's query ID is reused with paged-list
+        variables; no recorded traffic confirms that LinkedIn accepts it, so
+        every way this request can fail is logged as a warning.
+        """
+        variables = ",".join(
+            [
+                f"pagedListComponent:{quote(paged_list_urn)}",
+                f"start:{start}",
+                f"count:{count}",
+            ]
+        )
+        res = self._fetch(
+            f"/graphql?variables=({variables})&queryId={Linkedin._PROFILE_COMPONENTS_QUERY_ID}&includeWebMetadata=true",
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        )
+        if res.status_code != 200:
+            self.logger.warning(
+                f"could not fetch positions {start}+ of {paged_list_urn}: {res.status_code}"
             )
-            if (
-                paged_list_component_id
-                and "fsd_profilePositionGroup" in paged_list_component_id
-            ):
-                pattern = r"urn:li:fsd_profilePositionGroup:\([A-z0-9]+,[A-z0-9]+\)"
-                match = re.search(pattern, paged_list_component_id)
-                return match.group(0) if match else None
-
+            return []
         data = res.json()
+        for entity in data.get("included", []):
+            elements = (entity.get("components") or {}).get("elements")
+            if elements:
+                return elements
+        self.logger.warning(
+            f"no positions {start}+ in the response for {paged_list_urn}: "
+            f"{data.get('errors') or 'no elements'}"
+        )
+        return []
 
-        items = []
-        for item in data["included"][0]["components"]["elements"]:
-            grouped_item_id = get_grouped_item_id(item)
-            # if the item is part of a group (e.g. a company with multiple positions),
-            # find the group items and parse them.
-            if grouped_item_id:
-                component = item["components"]["entityComponent"]
-                # use the company and location from the main item
-                company = component["titleV2"]["text"]["text"]
-
-                location = (
-                    component["caption"]["text"] if component["caption"] else None
-                )
+    def get_profiles_experiences(
+        self, urn_ids: Iterable[str], concurrency: int = 4
+    ) -> Dict[str, List]:
+        """Fetch experiences of many LinkedIn profiles concurrently.
 
-                # find the group
-                group = [
-                    i
-                    for i in data["included"]
-                    if grouped_item_id in i.get("entityUrn", "")
-                ]
-                if not group:
-                    continue
-                for group_item in group[0]["components"]["elements"]:
-                    parsed_data = parse_item(group_item, is_group_item=True)
-                    parsed_data["companyName"] = company
-                    parsed_data["locationName"] = location
-                    items.append(parsed_data)
-                continue
+        :param urn_ids: LinkedIn URN IDs for profiles
+        :type urn_ids: iterable
+        :param concurrency: Number of profiles fetched at once
+        :type concurrency: int, optional
 
-            # else, parse the regular item
-            parsed_data = parse_item(item)
-            items.append(parsed_data)
-
-        return items
+        :return: Lists of experiences, as returned by
+            :meth:`get_profile_experiences`, keyed by URN ID. Profiles whose
+            experiences could not be fetched map to None.
+        :rtype: dict
+        """
+        experiences = {}
+        for urn_id, result in Scheduler(concurrency).map(
+            self.get_profile_experiences, dict.fromkeys(urn_ids)
+        ):
+            if isinstance(result, Exception):
+                self.logger.info(f"could not fetch experiences of {urn_id}: {result!r}")
+                result = None
+            experiences[urn_id] = result
+        return experiences
 
     def get_company_updates(
         self,
@@ -1282,7 +1703,7 @@ class Linkedin(object):
             "universalName": public_id,
         }
 
-        res = self._fetch(f"/organization/companies?{urlencode(params)}")
+        res = self._fetch(f"/organization/companies?{urlencode(params)}", coalesce=True)
 
         data = res.json()
 
@@ -1291,9 +1712,62 @@ class Linkedin(object):
             return {}
 
         school = data["elements"][0]
+        self.organizations.put(school)
 
         return school
 
+    def _get_organizations(
+        self, ids: Iterable[str], batch_size: int, fetch_one, kind: str
+    ) -> Dict[str, Dict]:
+        ids = [str(i) for i in dict.fromkeys(ids)]
+        numeric = [i for i in ids if i.isdigit()]
+        results, _, errors = self._batch_get(
+            "/organization/companies",
+            numeric,
+            batch_size=batch_size,
+            params={
+                "decorationId": "com.linkedin.voyager.deco.organization.web.WebFullCompanyMain-12"
+            },
+        )
+        for i, error in errors.items():
+            self.logger.info(f"could not fetch {kind} {i}: {error}")
+        for organization in results.values():
+            self.organizations.put(organization)
+        # Universal names have no batch endpoint
+        return {i: results.get(i, {}) if i.isdigit() else fetch_one(i) for i in ids}
+
+    def get_schools(self, ids: Iterable[str], batch_size: int = 50) -> Dict[str, Dict]:
+        """Fetch data about many LinkedIn schools, several per request.
+
+        :param ids: School URN IDs (numeric), or public IDs, which are
+            fetched one by one with :meth:`get_school`
+        :type ids: iterable
+        :param batch_size: Maximum number of schools per request
+        :type batch_size: int, optional
+
+        :return: School data keyed by ID. Schools that could not be fetched
+            map to an empty dict.
+        :rtype: dict
+        """
+        return self._get_organizations(ids, batch_size, self.get_school, "school")
+
+    def get_companies(
+        self, ids: Iterable[str], batch_size: int = 50
+    ) -> Dict[str, Dict]:
+        """Fetch data about many LinkedIn companies, several per request.
+
+        :param ids: Company URN IDs (numeric), or public IDs, which are
+            fetched one by one with :meth:`get_company`
+        :type ids: iterable
+        :param batch_size: Maximum number of companies per request
+        :type batch_size: int, optional
+
+        :return: Company data keyed by ID. Companies that could not be fetched
+            map to an empty dict.
+        :rtype: dict
+        """
+        return self._get_organizations(ids, batch_size, self.get_company, "company")
+
     def get_company(self, public_id):
         """Fetch data about a given LinkedIn company.
 
@@ -1309,7 +1783,7 @@ class Linkedin(object):
             "universalName": public_id,
         }
 
-        res = self._fetch(f"/organization/companies", params=params)
+        res = self._fetch(f"/organization/companies", params=params, coalesce=True)
 
         data = res.json()
 
@@ -1318,6 +1792,7 @@ class Linkedin(object):
             return {}
 
         company = data["elements"][0]
+        self.organizations.put(company)
 
         return company
 
@@ -1338,7 +1813,10 @@ class Linkedin(object):
             f"/feed/dash/followingStates/{following_state_urn}", data=payload
         )
 
-        return res.status_code != 200
+        err = res.status_code != 200
+        if not err:
+            self.organizations.set_following(following_state_urn, following)
+        return err
 
     def get_conversation_details(self, profile_urn_id):
         """Fetch conversation (message thread) details for a given LinkedIn profile.
@@ -1562,7 +2040,12 @@ class Linkedin(object):
         next_cursor = raw.get("metadata", {}).get("nextCursor")
         return {"conversations": parsed, "next_cursor": next_cursor}
 
-    def get_thread_v2(self, mailbox_urn: str, messaging_thread_urn: str) -> Dict:
+    def get_thread_v2(
+        self,
+        mailbox_urn: str,
+        messaging_thread_urn: str,
+        sync_token: Optional[str] = None,
+    ) -> Dict:
         """Fetch a thread of messages using the new LinkedIn Voyager API.
 
         :param mailbox_urn: Your profile URN ID (the part after
@@ -1572,6 +2055,9 @@ class Linkedin(object):
         :param messaging_thread_urn: Thread ID (normally starts with ``2-``).
             Get it from the ``thread_id`` field in :meth:`get_conversations_v3`.
         :type messaging_thread_urn: str
+        :param sync_token: ``newSyncToken`` from a previous call. When given,
+            only changes since that call are returned.
+        :type sync_token: str, optional
 
         :return: Dictionary containing the message thread.
             Messages are in ``data.messengerMessagesBySyncToken.elements``.
@@ -1580,8 +2066,11 @@ class Linkedin(object):
         query_id = "messengerMessages.455dde239612d966346c1d1c4352f648"
         variables = (
             f"(conversationUrn:urn%3Ali%3Amsg_conversation%3A"
-            f"%28urn%3Ali%3Afsd_profile%3A{mailbox_urn}%2C{quote(messaging_thread_urn)}%29)"
+            f"%28urn%3Ali%3Afsd_profile%3A{mailbox_urn}%2C{quote(messaging_thread_urn)}%29"
         )
+        if sync_token:
+            variables += f",syncToken:{quote(sync_token, safe='')}"
+        variables += ")"
 
         url = f"/voyagerMessagingGraphQL/graphql?queryId={query_id}&variables={variables}"
         res = self._fetch(url)
@@ -1606,6 +2095,7 @@ class Linkedin(object):
         message_body: str,
         conversation_urn_id: Optional[str] = None,
         recipients: Optional[List[str]] = None,
+        origin_token: Optional[str] = None,
     ):
         """Send a message to a given conversation.
 
@@ -1615,6 +2105,10 @@ class Linkedin(object):
         :type conversation_urn_id: str, optional
         :param recipients: List of profile urn id's
         :type recipients: list, optional
+        :param origin_token: Client-generated message token. Retrying a send
+            with the same token never delivers the message twice. Defaults to
+            a fresh token.
+        :type origin_token: str, optional
 
         :return: Error state. If True, an error occured.
         :rtype: boolean
@@ -1627,7 +2121,7 @@ class Linkedin(object):
 
         message_event = {
             "eventCreate": {
-                "originToken": str(uuid.uuid4()),
+                "originToken": origin_token or str(uuid.uuid4()),
                 "value": {
                     "com.linkedin.voyager.messaging.create.MessageCreate": {
                         "attributedBody": {
@@ -1639,7 +2133,7 @@ class Linkedin(object):
                 },
                 "trackingId": generate_trackingId_as_charString(),
             },
-            "dedupeByClientGeneratedToken": False,
+            "dedupeByClientGeneratedToken": origin_token is not None,
         }
 
         if conversation_urn_id and not recipients:
@@ -1685,6 +2179,7 @@ class Linkedin(object):
         message_body: str,
         mailbox_urn: str,
         conversation_urn: str,
+        origin_token: Optional[str] = None,
     ):
         """Send a message to an existing conversation using the new dash endpoint.
 
@@ -1697,6 +2192,10 @@ class Linkedin(object):
         :param conversation_urn: Full conversation URN from ``get_conversations_v3()``,
             e.g. ``urn:li:msg_conversation:(urn:li:fsd_profile:xxx,2-yyy==)``
         :type conversation_urn: str
+        :param origin_token: Client-generated message token. Retrying a send
+            with the same token never delivers the message twice. Defaults to
+            a fresh token.
+        :type origin_token: str, optional
 
         :return: Error state. True if error occurred.
         :rtype: bool
@@ -1709,11 +2208,11 @@ class Linkedin(object):
                 },
                 "renderContentUnions": [],
                 "conversationUrn": conversation_urn,
-                "originToken": str(uuid.uuid4()),
+                "originToken": origin_token or str(uuid.uuid4()),
             },
             "mailboxUrn": f"urn:li:fsd_profile:{mailbox_urn}",
             "trackingId": generate_trackingId_as_charString(),
-            "dedupeByClientGeneratedToken": False,
+            "dedupeByClientGeneratedToken": origin_token is not None,
         }
 
         res = self._post(
@@ -1740,31 +2239,65 @@ class Linkedin(object):
         :return: Error state. True if error occurred.
         :rtype: bool
         """
-        from urllib.parse import quote
+        return self.mark_conversations_as_read_v2([conversation_urn])[conversation_urn]
 
-        payload = {
-            "entities": {
-                conversation_urn: {
-                    "patch": {
-                        "$set": {
-                            "read": True,
-                        }
-                    }
-                }
+    def mark_conversations_as_read_v2(
+        self,
+        conversation_urns: Iterable[str],
+        batch_size: int = 50,
+    ) -> Dict[str, bool]:
+        """Mark many conversations as read, several per request.
+
+        The conversations are patched in batches of ``batch_size``, so
+        clearing a large inbox takes a handful of requests.
+
+        :param conversation_urns: Full conversation URNs from ``get_conversations_v3()``
+        :type conversation_urns: iterable
+        :param batch_size: Maximum number of conversations per request
+        :type batch_size: int, optional
+
+        :return: Error state per conversation URN. True if an error occurred.
+        :rtype: dict
+        """
+        urns = list(dict.fromkeys(conversation_urns))
+        results: Dict[str, bool] = {}
+
+        for i in range(0, len(urns), batch_size):
+            batch = urns[i : i + batch_size]
+            payload = {
+                "entities": {urn: {"patch": {"$set": {"read": True}}} for urn in batch}
             }
-        }
+            ids = ",".join(quote(urn, safe="") for urn in batch)
+            res = self._post(
+                f"/voyagerMessagingDashMessengerConversations?ids=List({ids})",
+                data=json.dumps(payload),
+                headers={
+                    "accept": "application/json",
+                    "Content-Type": "text/plain;charset=UTF-8",
+                },
+            )
 
-        encoded_urn = quote(conversation_urn, safe="")
-        res = self._post(
-            f"/voyagerMessagingDashMessengerConversations?ids=List({encoded_urn})",
-            data=json.dumps(payload),
-            headers={
-                "accept": "application/json",
-                "Content-Type": "text/plain;charset=UTF-8",
-            },
-        )
+            if res.status_code != 200:
+                self.logger.info(
+                    f"mark as read failed for {len(batch)} conversations: "
+                    f"{res.status_code}"
+                )
+                results.update((urn, True) for urn in batch)
+                continue
 
-        return res.status_code != 200
+            # Batch responses report a status per entity; a plain 200 with no
+            # body means every patch was applied.
+            try:
+                data = res.json()
+            except ValueError:
+                data = {}
+            entity_results = data.get("results") or {}
+            errors = data.get("errors") or {}
+            for urn in batch:
+                status = (entity_results.get(urn) or {}).get("status", 200)
+                results[urn] = urn in errors or status >= 400
+
+        return results
 
     def get_user_profile(self, use_cache=True) -> Dict:
         """Get the current user profile. If not cached, a network request will be fired.
@@ -1772,12 +2305,14 @@ class Linkedin(object):
         :return: Profile data for currently logged in user
         :rtype: dict
         """
-        me_profile = self.client.metadata.get("me", {})
-        if not self.client.metadata.get("me") or not use_cache:
-            res = self._fetch(f"/me")
+        with self.client.lock:
+            me_profile = self.client.metadata.get("me", {})
+        if not me_profile or not use_cache:
+            res = self._fetch(f"/me", coalesce=True)
             me_profile = res.json()
             # cache profile
-            self.client.metadata["me"] = me_profile
+            with self.client.lock:
+                self.client.metadata["me"] = me_profile
 
         return me_profile
 
@@ -2007,6 +2542,8 @@ class Linkedin(object):
         err = False
         if res.status_code != 200:
             err = True
+        else:
+            self.organizations.set_following(urn_id, False)
 
         return err
 
@@ -2127,6 +2664,50 @@ class Linkedin(object):
 
         return data
 
+    def get_jobs(
+        self, job_ids: Iterable[str], batch_size: int = 50, concurrency: int = 4
+    ) -> Dict[str, Dict]:
+        """Fetch data about many jobs, several per request.
+
+        Postings are requested with a Rest.li batch get; any the batch
+        response leaves out are fetched concurrently with :meth:`get_job`.
+        If the server rejects batch gets, this instance stops trying them
+        and fetches every posting with :meth:`get_job`.
+
+        :param job_ids: LinkedIn job IDs
+        :type job_ids: iterable
+        :param batch_size: Maximum number of jobs per request
+        :type batch_size: int, optional
+        :param concurrency: Number of :meth:`get_job` calls to run at once
+        :type concurrency: int, optional
+
+        :return: Job data keyed by job ID. Jobs that could not be fetched map
+            to an empty dict.
+        :rtype: dict
+        """
+        ids = list(dict.fromkeys(str(job_id) for job_id in job_ids))
+        results: Dict[str, Dict] = {}
+        if self._job_batches_supported:
+            results, _, errors = self._batch_get(
+                "/jobs/jobPostings",
+                ids,
+                batch_size=batch_size,
+                params={
+                    "decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebLightJobPosting-23",
+                },
+            )
+            if Linkedin._BATCH_REJECTED in errors.values():
+                self.logger.info("job batch gets rejected, using single gets")
+                self._job_batches_supported = False
+
+        missing = [job_id for job_id in ids if job_id not in results]
+        for job_id, job in self.map("get_job", missing, concurrency=concurrency):
+            if isinstance(job, Exception):
+                self.logger.info(f"could not fetch job {job_id}: {job!r}")
+                job = {}
+            results[job_id] = job
+        return {job_id: results[job_id] for job_id in ids}
+
     def get_post_reactions(self, urn_id, max_results=None, results=None):
         """Fetch social reactions for a given LinkedIn post.
 
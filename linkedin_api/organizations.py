@@ -0,0 +1,189 @@
+"""
+Local cache of company and school data.
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+
+from linkedin_api.utils.cache import TTLCache
+
+COMPANY = "company"
+SCHOOL = "school"
+
+
+def _urn_id(urn: Optional[str]) -> Optional[str]:
+    return urn.split(":")[-1] if urn else None
+
+
+def compact_organization(organization: Dict) -> Dict:
+    """Trim a ``WebFullCompanyMain-12`` company or school to the fields we use.
+
+    :param organization: Company or school data, as returned by
+        :meth:`Linkedin.get_company` or :meth:`Linkedin.get_school`
+    :type organization: dict
+
+    :return: Dict with ``urn_id``, ``universal_name``, ``name``,
+        ``description``, ``url``, ``industries``, ``staff_count``,
+        ``headquarter``, ``follower_count``, ``following`` and
+        ``following_state_urn``
+    :rtype: dict
+    """
+    following_info = organization.get("followingInfo") or {}
+    headquarter = organization.get("headquarter") or {}
+    return {
+        "urn_id": _urn_id(organization.get("entityUrn")),
+        "universal_name": organization.get("universalName"),
+        "name": organization.get("name"),
+        "description": organization.get("description"),
+        "url": organization.get("companyPageUrl") or organization.get("url"),
+        "industries": [
+            industry.get("localizedName")
+            for industry in organization.get("companyIndustries") or []
+        ],
+        "staff_count": organization.get("staffCount"),
+        "headquarter": {
+            key: headquarter[key]
+            for key in ("city", "geographicArea", "country")
+            if headquarter.get(key)
+        },
+        "follower_count": following_info.get("followerCount"),
+        "following": following_info.get("following"),
+        "following_state_urn": following_info.get("dashFollowingStateUrn"),
+    }
+
+
+class OrganizationCache(object):
+    """
+    Size-bounded, expiring cache of companies and schools.
+
+    Entries are :func:`compact_organization` projections rather than full
+    payloads, and can be looked up by numeric URN ID or by universal name
+    (public ID). :meth:`Linkedin.follow_company` and
+    :meth:`Linkedin.unfollow_entity` keep the cached follow state current.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param ttl: Time-to-live of cached entries, in seconds
+    :type ttl: float, optional
+    :param maxsize: Maximum number of cached organizations
+    :type maxsize: int, optional
+    """
+
+    def __init__(self, api, ttl: float = 24 * 3600.0, maxsize: int = 10000):
+        self.api = api
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Universal names and following state URNs, to URN IDs. These are
+        # only pointers, so they can afford to outlive the entries.
+        self._aliases = TTLCache(maxsize=maxsize * 2, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _alias(identifier: str) -> Optional[str]:
+        if identifier.isdigit():
+            return None
+        if identifier.startswith("urn:li:"):
+            return identifier
+        return identifier.lower()
+
+    def get_cached(self, identifier: str) -> Optional[Dict]:
+        """Return the cached organization for a URN ID or universal name, if any."""
+        identifier = str(identifier)
+        alias = self._alias(identifier)
+        urn_id = self._aliases.get(alias) if alias else identifier
+        return self._entries.get(urn_id) if urn_id else None
+
+    def put(self, organization: Dict) -> Optional[Dict]:
+        """Cache a full company or school payload and return its projection."""
+        if not organization:
+            return None
+        entry = compact_organization(organization)
+        if not entry["urn_id"]:
+            return None
+        with self._lock:
+            self._entries.set(entry["urn_id"], entry)
+            for alias in (entry["universal_name"], entry["following_state_urn"]):
+                if alias:
+                    self._aliases.set(self._alias(alias), entry["urn_id"])
+        return entry
+
+    def _get_many(self, identifiers: Iterable[str], kind: str) -> Dict[str, Dict]:
+        identifiers = [str(i) for i in dict.fromkeys(identifiers)]
+        result = {i: self.get_cached(i) for i in identifiers}
+        missing = [i for i, entry in result.items() if entry is None]
+        if missing:
+            fetch = self.api.get_companies if kind == COMPANY else self.api.get_schools
+            for identifier, organization in fetch(missing).items():
+                result[identifier] = self.put(organization)
+        # Failed lookups are not cached, and come back as empty dicts
+        return {i: entry or {} for i, entry in result.items()}
+
+    def get_company(self, identifier: str) -> Dict:
+        """Return a company's projection, fetching it on a cache miss.
+
+        :param identifier: Company URN ID (numeric) or universal name
+        :type identifier: str
+
+        :return: Company data as returned by :func:`compact_organization`,
+            or an empty dict if it could not be fetched
+        :rtype: dict
+        """
+        return self._get_many([identifier], COMPANY)[str(identifier)]
+
+    def get_school(self, identifier: str) -> Dict:
+        """Return a school's projection, fetching it on a cache miss.
+
+        :param identifier: School URN ID (numeric) or universal name
+        :type identifier: str
+
+        :return: School data as returned by :func:`compact_organization`,
+            or an empty dict if it could not be fetched
+        :rtype: dict
+        """
+        return self._get_many([identifier], SCHOOL)[str(identifier)]
+
+    def get_companies(self, identifiers: Iterable[str]) -> Dict[str, Dict]:
+        """Return many companies' projections, batch-fetching cache misses.
+
+        :param identifiers: Company URN IDs or universal names
+        :type identifiers: iterable
+
+        :return: Company data keyed by identifier
+        :rtype: dict
+        """
+        return self._get_many(identifiers, COMPANY)
+
+    def get_schools(self, identifiers: Iterable[str]) -> Dict[str, Dict]:
+        """Return many schools' projections, batch-fetching cache misses.
+
+        :param identifiers: School URN IDs or universal names
+        :type identifiers: iterable
+
+        :return: School data keyed by identifier
+        :rtype: dict
+        """
+        return self._get_many(identifiers, SCHOOL)
+
+    def set_following(self, identifier: str, following: bool):
+        """Record a follow or unfollow of a cached organization.
+
+        :param identifier: URN ID, universal name, following state URN or
+            any URN ending with the organization's URN ID
+        :type identifier: str
+        :param following: New follow state
+        :type following: bool
+        """
+        identifier = str(identifier)
+        with self._lock:
+            entry = self.get_cached(identifier) or self.get_cached(_urn_id(identifier))
+            if entry is None or entry["following"] == following:
+                return
+            updated = dict(entry, following=following)
+            if entry["follower_count"] is not None:
+                updated["follower_count"] += 1 if following else -1
+            self._entries.set(entry["urn_id"], updated)
+
+    def invalidate(self, identifier: str):
+        """Drop an organization from the cache."""
+        entry = self.get_cached(str(identifier))
+        if entry is not None:
+            self._entries.pop(entry["urn_id"])
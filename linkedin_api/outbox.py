@@ -0,0 +1,250 @@
+"""
+Durable outbound message queue.
+"""
+
+import json
+import logging
+import time
+import uuid
+from typing import Dict, Iterator, List, Optional
+
+from linkedin_api.scheduler import RateLimiter, Scheduler
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+
+class Outbox(SQLiteStore):
+    """
+    SQLite-backed queue of messages waiting to be sent.
+
+    Every message gets an ``origin_token`` when it is queued. The token is
+    sent with every delivery attempt, so LinkedIn deduplicates retries and a
+    message is never delivered twice, even when a run crashes between sending
+    it and recording the result.
+
+    :param path: Path of the database file. Defaults to ``outbox.sqlite3`` in
+        the linkedin_api data directory.
+    :type path: str, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            origin_token TEXT NOT NULL UNIQUE,
+            conversation_urn TEXT,
+            recipients TEXT,
+            body TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            queued_at REAL NOT NULL,
+            sent_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS outbox_by_status ON outbox (status, id);
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path or default_db_path("outbox.sqlite3"))
+
+    @staticmethod
+    def _to_message(row) -> Dict:
+        message = dict(row)
+        message["recipients"] = json.loads(row["recipients"] or "null")
+        return message
+
+    def enqueue(
+        self,
+        message_body: str,
+        conversation_urn: Optional[str] = None,
+        recipients: Optional[List[str]] = None,
+        origin_token: Optional[str] = None,
+    ) -> str:
+        """Queue a message to a conversation or to a list of recipients.
+
+        Queueing the same ``origin_token`` twice is a no-op, so a producer can
+        safely re-run after a crash.
+
+        :param message_body: Message text to send
+        :type message_body: str
+        :param conversation_urn: Full conversation URN from ``get_conversations_v3()``
+        :type conversation_urn: str, optional
+        :param recipients: List of profile URN IDs, to start a new conversation
+        :type recipients: list, optional
+        :param origin_token: Token identifying the message. Defaults to a new UUID.
+        :type origin_token: str, optional
+
+        :return: The message's origin token
+        :rtype: str
+        """
+        if bool(conversation_urn) == bool(recipients):
+            raise ValueError("Provide exactly one of conversation_urn or recipients")
+        origin_token = origin_token or str(uuid.uuid4())
+        self.execute(
+            """
+            INSERT OR IGNORE INTO outbox
+                (origin_token, conversation_urn, recipients, body, status, queued_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                origin_token,
+                conversation_urn,
+                json.dumps(recipients) if recipients else None,
+                message_body,
+                PENDING,
+                time.time(),
+            ),
+        )
+        return origin_token
+
+    def get(self, origin_token: str) -> Optional[Dict]:
+        """Return a queued message and its delivery state."""
+        row = self.fetchone(
+            "SELECT * FROM outbox WHERE origin_token = ?", (origin_token,)
+        )
+        return self._to_message(row) if row else None
+
+    def due(self, max_attempts: int, limit: Optional[int] = None) -> List[Dict]:
+        """Return messages still to be delivered, oldest first.
+
+        Messages left ``sending`` by an interrupted run are included; their
+        stable origin token makes resending them safe. Those interrupted
+        during their last allowed attempt are marked failed instead.
+        """
+        sql = (
+            "SELECT * FROM outbox WHERE status IN (?, ?) AND attempts < ?"
+            " ORDER BY id"
+        )
+        params: list = [PENDING, SENDING, max_attempts]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, last_error = ?"
+                " WHERE status = ? AND attempts >= ?",
+                (FAILED, "interrupted during last attempt", SENDING, max_attempts),
+            )
+            rows = conn.execute(sql, params).fetchall()
+        return [self._to_message(row) for row in rows]
+
+    def mark_sending(self, origin_token: str):
+        """Record the start of a delivery attempt."""
+        self.execute(
+            "UPDATE outbox SET status = ?, attempts = attempts + 1"
+            " WHERE origin_token = ?",
+            (SENDING, origin_token),
+        )
+
+    def mark_sent(self, origin_token: str):
+        """Record a successful delivery."""
+        self.execute(
+            "UPDATE outbox SET status = ?, sent_at = ?, last_error = NULL"
+            " WHERE origin_token = ?",
+            (SENT, time.time(), origin_token),
+        )
+
+    def mark_failed(self, origin_token: str, error: str, retry: bool):
+        """Record a failed delivery attempt.
+
+        :param retry: Leave the message queued for another attempt
+        :type retry: bool
+        """
+        self.execute(
+            "UPDATE outbox SET status = ?, last_error = ? WHERE origin_token = ?",
+            (PENDING if retry else FAILED, error, origin_token),
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of messages in each status."""
+        rows = self.execute("SELECT status, COUNT(*) AS n FROM outbox GROUP BY status")
+        return {row["status"]: row["n"] for row in rows}
+
+
+class OutboxSender(object):
+    """
+    Drain an :class:`Outbox` through a Linkedin instance.
+
+    Conversation messages go through :meth:`Linkedin.send_message_v2`,
+    messages to new recipients through :meth:`Linkedin.send_message`.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param mailbox_urn: Your profile URN ID (the part after ``urn:li:fsd_profile:``)
+    :type mailbox_urn: str
+    :param outbox: Queue to drain. Defaults to an :class:`Outbox` at the
+        default location.
+    :type outbox: Outbox, optional
+    :param messages_per_minute: Maximum sending rate. None leaves throughput to
+        the client's own request budget.
+    :type messages_per_minute: float, optional
+    :param concurrency: Number of messages sent at once
+    :type concurrency: int, optional
+    :param max_attempts: Give up on a message after this many failed attempts
+    :type max_attempts: int, optional
+    """
+
+    def __init__(
+        self,
+        api,
+        mailbox_urn: str,
+        outbox: Optional[Outbox] = None,
+        messages_per_minute: Optional[float] = None,
+        concurrency: int = 1,
+        max_attempts: int = 3,
+    ):
+        self.api = api
+        self.mailbox_urn = mailbox_urn
+        self.outbox = outbox or Outbox()
+        self.rate_limiter = (
+            RateLimiter(messages_per_minute) if messages_per_minute else None
+        )
+        self.scheduler = Scheduler(concurrency)
+        self.max_attempts = max_attempts
+
+    def _send(self, message: Dict) -> bool:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        token = message["origin_token"]
+        self.outbox.mark_sending(token)
+        if message["conversation_urn"]:
+            return self.api.send_message_v2(
+                message["body"],
+                mailbox_urn=self.mailbox_urn,
+                conversation_urn=message["conversation_urn"],
+                origin_token=token,
+            )
+        return self.api.send_message(
+            message["body"], recipients=message["recipients"], origin_token=token
+        )
+
+    def drain(self, limit: Optional[int] = None) -> Iterator[Dict]:
+        """Send queued messages and record the outcome of each attempt.
+
+        :param limit: Maximum number of messages to attempt
+        :type limit: int, optional
+
+        :return: Iterator of the updated queue entries, as each attempt finishes
+        :rtype: iterator
+        """
+        messages = self.outbox.due(self.max_attempts, limit=limit)
+        for message, error in self.scheduler.map(self._send, messages):
+            token = message["origin_token"]
+            if isinstance(error, Exception):
+                reason = repr(error)
+            elif error:
+                reason = "request failed"
+            else:
+                self.outbox.mark_sent(token)
+                yield self.outbox.get(token)
+                continue
+
+            retry = message["attempts"] + 1 < self.max_attempts
+            logger.info(f"Sending {token} failed ({reason}), retry: {retry}")
+            self.outbox.mark_failed(token, reason, retry=retry)
+            yield self.outbox.get(token)
@@ -0,0 +1,277 @@
+"""
+Profile refreshes that skip work for profiles that have not changed.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from linkedin_api.hydration import SECTIONS
+from linkedin_api.scheduler import Scheduler
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+logger = logging.getLogger(__name__)
+
+NEW = "new"
+CHANGED = "changed"
+
+# Image URLs carry expiring signatures and change on every fetch
+VOLATILE_FIELDS = frozenset(["displayPictureUrl", "backgroundPictureUrl", "versionTag"])
+# Picture URLs are keyed img_{width}_{height}, for whatever sizes were returned
+VOLATILE_PREFIXES = ("img_",)
+
+
+def is_volatile(key: str) -> bool:
+    """Return whether a profile field changes on every fetch."""
+    return key in VOLATILE_FIELDS or key.startswith(VOLATILE_PREFIXES)
+
+
+DEFAULT_SECTIONS = ("experiences", "skills", "contact_info")
+
+
+def content_hash(document: Dict) -> str:
+    """Return a stable hash of a profile document, ignoring volatile fields."""
+    stable = {k: v for k, v in document.items() if not is_volatile(k)}
+    encoded = json.dumps(stable, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+def changed_fields(old: Optional[Dict], new: Dict) -> List[str]:
+    """Return the top-level keys whose values differ, ignoring volatile fields."""
+    old = old or {}
+    return sorted(
+        key
+        for key in set(old) | set(new)
+        if not is_volatile(key) and old.get(key) != new.get(key)
+    )
+
+
+class ProfileStore(SQLiteStore):
+    """
+    Last known state of profiles: their ``versionTag``, a content hash and
+    the document itself (the profile plus its hydrated sections).
+
+    :param path: Path of the database file. Defaults to ``profiles.sqlite3``
+        in the linkedin_api data directory.
+    :type path: str, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS profiles (
+            urn_id TEXT PRIMARY KEY,
+            version_tag TEXT,
+            content_hash TEXT NOT NULL,
+            document TEXT NOT NULL,
+            checked_at REAL NOT NULL,
+            changed_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path or default_db_path("profiles.sqlite3"))
+
+    def get(self, urn_id: str) -> Optional[Dict]:
+        """Return a profile's stored state, with ``document`` decoded."""
+        row = self.fetchone("SELECT * FROM profiles WHERE urn_id = ?", (urn_id,))
+        if row is None:
+            return None
+        state = dict(row)
+        state["document"] = json.loads(row["document"])
+        return state
+
+    def version_tags(self, urn_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Return the stored ``versionTag`` of each known profile."""
+        urn_ids = list(urn_ids)
+        if not urn_ids:
+            return {}
+        rows = self.execute(
+            f"SELECT urn_id, version_tag FROM profiles"
+            f" WHERE urn_id IN ({','.join('?' * len(urn_ids))})",
+            urn_ids,
+        )
+        return {row["urn_id"]: row["version_tag"] for row in rows}
+
+    def touch(self, urn_ids: Iterable[str], checked_at: Optional[float] = None):
+        """Record that profiles were checked and found unchanged."""
+        now = time.time() if checked_at is None else checked_at
+        self.execute_many(
+            "UPDATE profiles SET checked_at = ? WHERE urn_id = ?",
+            [(now, urn_id) for urn_id in urn_ids],
+        )
+
+    def save(
+        self,
+        urn_id: str,
+        version_tag: Optional[str],
+        document: Dict,
+        changed: bool,
+        checked_at: Optional[float] = None,
+    ):
+        """Store a profile's current state.
+
+        :param changed: Whether the content changed, which moves ``changed_at``
+        :type changed: bool
+        """
+        now = time.time() if checked_at is None else checked_at
+        self.execute(
+            """
+            INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (urn_id) DO UPDATE SET
+                version_tag = excluded.version_tag,
+                content_hash = excluded.content_hash,
+                document = excluded.document,
+                checked_at = excluded.checked_at,
+                changed_at = CASE WHEN ? THEN excluded.changed_at ELSE changed_at END
+            """,
+            (
+                urn_id,
+                version_tag,
+                content_hash(document),
+                json.dumps(document, sort_keys=True),
+                now,
+                now,
+                changed,
+            ),
+        )
+
+
+class ProfileRefresher(object):
+    """
+    Refresh stored profiles, re-hydrating only those that changed.
+
+    Profiles are fetched in batches with :meth:`Linkedin.get_profiles_v2`.
+    A profile whose ``versionTag`` matches the stored one is only marked as
+    checked: its sections (experiences, skills, contact info) are not
+    fetched again. Otherwise its sections are fetched and the content hash
+    decides whether anything really changed, since LinkedIn also bumps the
+    tag for changes we do not keep.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param store: Stored profile states. Defaults to a :class:`ProfileStore`
+        at the default location.
+    :type store: ProfileStore, optional
+    :param sections: Sections to hydrate, any of ``"experiences"``,
+        ``"skills"`` and ``"contact_info"``
+    :type sections: list, optional
+    :param concurrency: Number of requests to run at once
+    :type concurrency: int, optional
+    :param batch_size: Profiles per :meth:`Linkedin.get_profiles_v2` request
+    :type batch_size: int, optional
+
+    :ivar stats: Counts of ``new``, ``changed``, ``unchanged`` (content hash
+        matched), ``skipped`` (``versionTag`` matched) and ``failed``
+        profiles in the last :meth:`refresh`
+    """
+
+    def __init__(
+        self,
+        api,
+        store: Optional[ProfileStore] = None,
+        sections: Sequence[str] = DEFAULT_SECTIONS,
+        concurrency: int = 4,
+        batch_size: int = 25,
+    ):
+        unknown = set(sections) - (set(SECTIONS) - {"profile"})
+        if unknown:
+            raise ValueError(f"Unknown profile sections: {sorted(unknown)}")
+        self.api = api
+        self.store = store or ProfileStore()
+        self.sections = tuple(sections)
+        self.scheduler = Scheduler(concurrency)
+        self.batch_size = batch_size
+        self.stats: Dict[str, int] = {}
+
+    def refresh(self, urn_ids: Iterable[str]) -> Iterator[Dict]:
+        """Refresh profiles and stream an event for each one that changed.
+
+        :param urn_ids: Profile URN IDs
+        :type urn_ids: iterable
+
+        :return: Iterator of dicts with ``urn_id``, ``change`` (``"new"`` or
+            ``"changed"``), ``changed_fields`` and ``document`` (the profile
+            with one key per hydrated section)
+        :rtype: iterator
+        """
+        self.stats = dict.fromkeys(
+            ("new", "changed", "unchanged", "skipped", "failed"), 0
+        )
+        urn_ids = list(dict.fromkeys(urn_ids))
+        batches = [
+            urn_ids[i : i + self.batch_size]
+            for i in range(0, len(urn_ids), self.batch_size)
+        ]
+        for batch, profiles in self.scheduler.map(self.api.get_profiles_v2, batches):
+            if isinstance(profiles, Exception):
+                logger.info(f"Fetching profiles {batch} failed: {profiles!r}")
+                self.stats["failed"] += len(batch)
+                continue
+            known_tags = self.store.version_tags(batch)
+            stale, fresh = [], []
+            for urn_id in batch:
+                profile = profiles.get(urn_id)
+                if not profile:
+                    self.stats["failed"] += 1
+                elif (
+                    urn_id in known_tags
+                    and profile.get("versionTag")
+                    and known_tags[urn_id] == profile["versionTag"]
+                ):
+                    fresh.append(urn_id)
+                else:
+                    stale.append(profile)
+            self.store.touch(fresh)
+            self.stats["skipped"] += len(fresh)
+            yield from self._hydrate(stale)
+
+    def _hydrate(self, profiles: List[Dict]) -> Iterator[Dict]:
+        documents = {p["urn_id"]: dict(p) for p in profiles}
+        remaining = {urn_id: len(self.sections) for urn_id in documents}
+        failed = set()
+        tasks = [(urn_id, section) for urn_id in documents for section in self.sections]
+        for (urn_id, section), result in self.scheduler.map(
+            lambda t: SECTIONS[t[1]](self.api, t[0]), tasks
+        ):
+            if isinstance(result, Exception):
+                logger.info(f"Fetching {section} of {urn_id} failed: {result!r}")
+                failed.add(urn_id)
+            else:
+                documents[urn_id][section] = result
+            remaining[urn_id] -= 1
+            if remaining[urn_id]:
+                continue
+            document = documents.pop(urn_id)
+            if urn_id in failed:
+                # Keep the stored state, so the next refresh tries again
+                self.stats["failed"] += 1
+                continue
+            event = self._record(document)
+            if event is not None:
+                yield event
+
+        # Left over when there are no sections to fetch
+        for document in documents.values():
+            event = self._record(document)
+            if event is not None:
+                yield event
+
+    def _record(self, document: Dict) -> Optional[Dict]:
+        urn_id = document["urn_id"]
+        previous = self.store.get(urn_id)
+        changed = previous is None or previous["content_hash"] != content_hash(document)
+        self.store.save(urn_id, document.get("versionTag"), document, changed)
+        if not changed:
+            self.stats["unchanged"] += 1
+            return None
+        change = NEW if previous is None else CHANGED
+        self.stats[change] += 1
+        return {
+            "urn_id": urn_id,
+            "change": change,
+            "changed_fields": changed_fields(
+                previous["document"] if previous else None, document
+            ),
+            "document": document,
+        }
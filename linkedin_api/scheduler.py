@@ -0,0 +1,104 @@
+"""
+Concurrency and rate budgeting helpers.
+"""
+
+import collections
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+
+class RateLimiter(object):
+    """
+    Thread-safe rate budget shared by every caller.
+
+    Calls to :meth:`acquire` are spaced at least ``60 / requests_per_minute``
+    seconds apart, whichever thread makes them. Each caller reserves the next
+    free slot under a lock and then sleeps outside of it, so waiting threads do
+    not block each other from reserving.
+
+    :param requests_per_minute: Budget of requests per minute
+    :type requests_per_minute: float
+    """
+
+    def __init__(self, requests_per_minute: float):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """Block until the caller may make its request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Scheduler(object):
+    """
+    Run a function over many inputs with bounded concurrency.
+
+    Inputs are consumed lazily, so only a small window of them is in flight
+    at any time; ``inputs`` may be a generator over millions of items.
+
+    :param concurrency: Number of worker threads
+    :type concurrency: int, optional
+    """
+
+    def __init__(self, concurrency: int = 4):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        inputs: Iterable[Any],
+        ordered: bool = False,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Call ``fn`` on every input and stream ``(input, outcome)`` pairs.
+
+        ``outcome`` is the return value of ``fn``, or the exception it raised;
+        one failing input never stops the others.
+
+        :param fn: Function called with each input
+        :type fn: callable
+        :param inputs: Inputs to process
+        :type inputs: iterable
+        :param ordered: Yield pairs in input order instead of completion order
+        :type ordered: bool, optional
+
+        :return: Iterator of ``(input, result or exception)`` pairs
+        :rtype: iterator
+        """
+        inputs = iter(inputs)
+        window = self.concurrency * 2
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = collections.OrderedDict()
+
+            def fill():
+                while len(pending) < window:
+                    try:
+                        item = next(inputs)
+                    except StopIteration:
+                        return
+                    pending[executor.submit(fn, item)] = item
+
+            fill()
+            while pending:
+                if ordered:
+                    done = [next(iter(pending))]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    error = future.exception()
+                    yield item, (error if error is not None else future.result())
+                fill()
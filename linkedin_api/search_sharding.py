@@ -0,0 +1,193 @@
+"""
+Sharded people search, to enumerate result sets larger than LinkedIn's cap.
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from linkedin_api.scheduler import Scheduler
+
+logger = logging.getLogger(__name__)
+
+# LinkedIn stops returning results past roughly this many per query
+SEARCH_RESULT_CAP = 1000
+
+# Facets of `search_people` a query can be split on, in the order they are tried
+SHARD_FACETS = (
+    "network_depths",
+    "regions",
+    "industries",
+    "current_company",
+    "profile_languages",
+)
+
+DEFAULT_FACET_VALUES: Dict[str, List[str]] = {"network_depths": ["F", "S", "O"]}
+
+
+class Shard(object):
+    """
+    One leaf query of a :class:`SearchPlan`.
+
+    :ivar query: Keyword arguments for :meth:`Linkedin.search_people`
+    :ivar total: Number of results LinkedIn reports, or None if unknown
+    :ivar complete: Whether the shard fits under the result cap
+    """
+
+    def __init__(self, query: Dict, total: Optional[int]):
+        self.query = query
+        self.total = total
+        self.complete = total is not None and total <= SEARCH_RESULT_CAP
+
+    def __repr__(self):
+        return f"Shard(query={self.query!r}, total={self.total!r})"
+
+
+class SearchPlan(object):
+    """
+    Shards covering a people search, with coverage figures.
+
+    :ivar query: The original query
+    :ivar total: Number of results LinkedIn reports for the original query
+    :ivar shards: Leaf queries to run
+    :ivar fetched: Unique people yielded so far by :meth:`ShardedPeopleSearch.run`
+    :ivar duplicates: People skipped because another shard already yielded them
+    """
+
+    def __init__(self, query: Dict, total: Optional[int], shards: List[Shard]):
+        self.query = query
+        self.total = total
+        self.shards = shards
+        self.fetched = 0
+        self.duplicates = 0
+
+    @property
+    def reachable(self) -> int:
+        """Number of results the shards can return, given the result cap."""
+        return sum(min(s.total or 0, SEARCH_RESULT_CAP) for s in self.shards)
+
+    @property
+    def coverage(self) -> Optional[float]:
+        """Fraction of the original query's results the shards can reach.
+
+        Shards overlap when a person matches several facet values, so this
+        is an estimate; ``fetched`` gives the exact count after a run.
+        """
+        if not self.total:
+            return None
+        return min(1.0, self.reachable / self.total)
+
+    @property
+    def incomplete(self) -> List[Shard]:
+        """Shards still over the result cap once every facet was used."""
+        return [s for s in self.shards if not s.complete]
+
+
+class ShardedPeopleSearch(object):
+    """
+    Enumerate broad people searches by splitting them into capped shards.
+
+    A query whose reported total is over :data:`SEARCH_RESULT_CAP` is split
+    into one sub-query per value of the next facet in :data:`SHARD_FACETS`,
+    recursively, until every shard fits under the cap or no facet is left.
+    A facet the query already filters on is split into its own values; other
+    facets use the values given in ``facet_values``. Results are deduplicated
+    by ``urn_id``, since one person can match several shards.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param facet_values: Values to split each facet into when the query does
+        not filter on it, e.g. ``{"regions": [...], "industries": [...]}``.
+        ``network_depths`` defaults to ``["F", "S", "O"]``.
+    :type facet_values: dict, optional
+    :param concurrency: Number of searches to run at once
+    :type concurrency: int, optional
+    """
+
+    def __init__(
+        self,
+        api,
+        facet_values: Optional[Dict[str, Sequence[str]]] = None,
+        concurrency: int = 4,
+    ):
+        unknown = set(facet_values or {}) - set(SHARD_FACETS)
+        if unknown:
+            raise ValueError(f"Cannot shard on {sorted(unknown)}")
+        self.api = api
+        self.facet_values = dict(DEFAULT_FACET_VALUES, **(facet_values or {}))
+        self.scheduler = Scheduler(concurrency)
+
+    def _split(self, query: Dict) -> Optional[List[Dict]]:
+        for facet in SHARD_FACETS:
+            values = query.get(facet) or self.facet_values.get(facet)
+            if not values or len(values) < 2:
+                continue
+            return [dict(query, **{facet: [value]}) for value in values]
+        return None
+
+    def plan(self, **query) -> SearchPlan:
+        """Probe totals and split ``query`` until every shard fits under the cap.
+
+        Totals are probed concurrently, one request per candidate shard.
+
+        :param query: Keyword arguments for :meth:`Linkedin.search_people`
+        :type query: dict
+
+        :return: The search plan
+        :rtype: SearchPlan
+        """
+        total = self.api.search_people_total(**query)
+        shards = []
+        level = [(query, total)]
+        while level:
+            to_probe = []
+            for q, q_total in level:
+                children = (
+                    self._split(q)
+                    if q_total is not None and q_total > SEARCH_RESULT_CAP
+                    else None
+                )
+                if children is None:
+                    shards.append(Shard(q, q_total))
+                else:
+                    to_probe.extend(children)
+
+            level = []
+            for child, child_total in self.scheduler.map(
+                lambda q: self.api.search_people_total(**q), to_probe, ordered=True
+            ):
+                if isinstance(child_total, Exception):
+                    logger.info(f"Could not probe shard {child}: {child_total!r}")
+                    child_total = None
+                # Empty shards need no request at all
+                if child_total != 0:
+                    level.append((child, child_total))
+
+        plan = SearchPlan(query, total, shards)
+        logger.debug(
+            f"Planned {len(shards)} shard(s) reaching {plan.reachable} of {total}"
+        )
+        return plan
+
+    def run(self, plan: SearchPlan) -> Iterator[Dict]:
+        """Run a plan's shards concurrently and stream unique people.
+
+        :param plan: Plan from :meth:`plan`
+        :type plan: SearchPlan
+
+        :return: Iterator of people, as returned by :meth:`Linkedin.search_people`
+        :rtype: iterator
+        """
+        seen = set()
+        for shard, results in self.scheduler.map(
+            lambda s: self.api.search_people(**s.query), plan.shards
+        ):
+            if isinstance(results, Exception):
+                logger.info(f"Shard {shard.query} failed: {results!r}")
+                continue
+            for person in results:
+                if person["urn_id"] in seen:
+                    plan.duplicates += 1
+                    continue
+                seen.add(person["urn_id"])
+                plan.fetched += 1
+                yield person
@@ -0,0 +1,159 @@
+"""
+Persistent record of entities already seen, shared across searches and runs.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+PEOPLE = "people"
+COMPANIES = "companies"
+JOBS = "jobs"
+
+
+class BloomFilter(object):
+    """
+    Fixed-size Bloom filter of strings.
+
+    Membership tests never give false negatives; false positives happen at
+    about ``error_rate`` once ``capacity`` items have been added.
+
+    :param capacity: Expected number of items
+    :type capacity: int
+    :param error_rate: Target false positive rate at ``capacity`` items
+    :type error_rate: float, optional
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class SeenIndex(SQLiteStore):
+    """
+    Persistent set of seen entity IDs per entity type.
+
+    IDs are stored in SQLite; an in-memory Bloom filter per entity type
+    answers most lookups of unseen IDs without touching the database, and
+    only possible hits are confirmed against it.
+
+    Pass an index as ``seen`` to :meth:`Linkedin.search_people`,
+    :meth:`Linkedin.search_companies` or :meth:`Linkedin.search_jobs` to skip
+    results already recorded, and call :meth:`add` once an entity has been
+    processed.
+
+    :param path: Path of the database file. Defaults to ``seen.sqlite3`` in
+        the linkedin_api data directory.
+    :type path: str, optional
+    :param error_rate: False positive rate of the Bloom filters
+    :type error_rate: float, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS seen (
+            entity_type TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            seen_at REAL NOT NULL,
+            PRIMARY KEY (entity_type, entity_id)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Optional[str] = None, error_rate: float = 0.001):
+        super().__init__(path or default_db_path("seen.sqlite3"))
+        self.error_rate = error_rate
+        self._filters: Dict[str, BloomFilter] = {}
+        self._filters_lock = threading.Lock()
+
+    def _load_filter(self, entity_type: str) -> BloomFilter:
+        rows = self.execute(
+            "SELECT entity_id FROM seen WHERE entity_type = ?", (entity_type,)
+        )
+        bloom = BloomFilter(max(10000, len(rows) * 2), self.error_rate)
+        for row in rows:
+            bloom.add(row["entity_id"])
+        return bloom
+
+    def _filter(self, entity_type: str) -> BloomFilter:
+        with self._filters_lock:
+            bloom = self._filters.get(entity_type)
+            # Rebuild a filter that outgrew its capacity, to keep the error rate
+            if bloom is None or bloom.count > bloom.capacity:
+                bloom = self._filters[entity_type] = self._load_filter(entity_type)
+            return bloom
+
+    def add(
+        self,
+        entity_type: str,
+        entity_ids: Iterable[str],
+        seen_at: Optional[float] = None,
+    ):
+        """Record entities as seen.
+
+        :param entity_type: Kind of entity, e.g. ``"people"``, ``"companies"``
+            or ``"jobs"``
+        :type entity_type: str
+        :param entity_ids: URN IDs or job IDs
+        :type entity_ids: iterable
+        :param seen_at: Unix time to record. Defaults to now.
+        :type seen_at: float, optional
+        """
+        entity_ids = [str(i) for i in entity_ids]
+        now = time.time() if seen_at is None else seen_at
+        self.execute_many(
+            "INSERT OR IGNORE INTO seen VALUES (?, ?, ?)",
+            [(entity_type, entity_id, now) for entity_id in entity_ids],
+        )
+        bloom = self._filter(entity_type)
+        with self._filters_lock:
+            for entity_id in entity_ids:
+                bloom.add(entity_id)
+
+    def seen(self, entity_type: str, entity_ids: Iterable[str]) -> set:
+        """Return the subset of ``entity_ids`` already recorded."""
+        bloom = self._filter(entity_type)
+        candidates = [str(i) for i in entity_ids if str(i) in bloom]
+        if not candidates:
+            return set()
+        placeholders = ",".join("?" * len(candidates))
+        rows = self.execute(
+            f"SELECT entity_id FROM seen WHERE entity_type = ?"
+            f" AND entity_id IN ({placeholders})",
+            [entity_type] + candidates,
+        )
+        return {row["entity_id"] for row in rows}
+
+    def __contains__(self, key) -> bool:
+        entity_type, entity_id = key
+        return bool(self.seen(entity_type, [entity_id]))
+
+    def unseen(
+        self, entity_type: str, items: List, key: Callable[[object], str]
+    ) -> List:
+        """Return the items whose ID (given by ``key``) was not recorded yet."""
+        known = self.seen(entity_type, (key(item) for item in items))
+        return [item for item in items if str(key(item)) not in known]
@@ -0,0 +1,217 @@
+"""
+Snapshots of connection lists, stored compactly, and diffs between them.
+"""
+
+import itertools
+import logging
+import sys
+import time
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from linkedin_api.utils.sqlite import SQLiteStore, default_db_path
+
+logger = logging.getLogger(__name__)
+
+# Stay under SQLite's default limit on bound parameters
+_CHUNK = 900
+
+
+def encode_ids(ids: Iterable[int]) -> bytes:
+    """Encode a set of non-negative integer IDs as compressed sorted deltas."""
+    ids = sorted(set(ids))
+    deltas = array("I", (b - a for a, b in zip([0] + ids, ids)))
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return zlib.compress(deltas.tobytes())
+
+
+def decode_ids(data: bytes) -> List[int]:
+    """Decode IDs encoded with :func:`encode_ids`, in ascending order."""
+    deltas = array("I")
+    deltas.frombytes(zlib.decompress(data))
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return list(itertools.accumulate(deltas))
+
+
+class SnapshotStore(SQLiteStore):
+    """
+    Point-in-time snapshots of profiles' connections.
+
+    Each URN ID is interned once as a small integer; a snapshot is the sorted
+    set of its members' integers, delta-encoded and compressed with
+    :func:`encode_ids`. IDs are assigned in first-seen order, so members of
+    one network get nearby integers and a 30k-member snapshot takes a few
+    kilobytes. :meth:`diff` compares snapshots on the integers and only
+    translates the differences back to URN IDs.
+
+    :param path: Path of the database file. Defaults to ``snapshots.sqlite3``
+        in the linkedin_api data directory.
+    :type path: str, optional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS members (
+            id INTEGER PRIMARY KEY,
+            urn_id TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            profile_urn_id TEXT NOT NULL,
+            taken_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            members BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS snapshots_by_profile
+            ON snapshots (profile_urn_id, taken_at);
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__(path or default_db_path("snapshots.sqlite3"))
+
+    def _intern(self, urn_ids: List[str]) -> List[int]:
+        ids = []
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO members (urn_id) VALUES (?)",
+                ((urn_id,) for urn_id in urn_ids),
+            )
+            for i in range(0, len(urn_ids), _CHUNK):
+                chunk = urn_ids[i : i + _CHUNK]
+                rows = conn.execute(
+                    f"SELECT id FROM members WHERE urn_id IN"
+                    f" ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                ids.extend(row["id"] for row in rows)
+        return ids
+
+    def _urn_ids(self, ids: List[int]) -> List[str]:
+        urn_ids: Dict[int, str] = {}
+        for i in range(0, len(ids), _CHUNK):
+            chunk = ids[i : i + _CHUNK]
+            rows = self.execute(
+                f"SELECT id, urn_id FROM members WHERE id IN"
+                f" ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            urn_ids.update((row["id"], row["urn_id"]) for row in rows)
+        return [urn_ids[i] for i in ids]
+
+    def save(
+        self,
+        profile_urn_id: str,
+        member_urn_ids: Iterable[str],
+        taken_at: Optional[float] = None,
+    ) -> int:
+        """Store a snapshot of a profile's connections.
+
+        :param profile_urn_id: URN ID of the profile whose connections these are
+        :type profile_urn_id: str
+        :param member_urn_ids: URN IDs of the connections
+        :type member_urn_ids: iterable
+        :param taken_at: Unix time of the snapshot. Defaults to now.
+        :type taken_at: float, optional
+
+        :return: Snapshot ID
+        :rtype: int
+        """
+        ids = self._intern(list(dict.fromkeys(member_urn_ids)))
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO snapshots (profile_urn_id, taken_at, size, members)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    profile_urn_id,
+                    time.time() if taken_at is None else taken_at,
+                    len(ids),
+                    encode_ids(ids),
+                ),
+            )
+            return cursor.lastrowid
+
+    def snapshots(self, profile_urn_id: str) -> List[Dict]:
+        """Return a profile's snapshots (``id``, ``taken_at``, ``size``), oldest first."""
+        rows = self.execute(
+            "SELECT id, taken_at, size FROM snapshots"
+            " WHERE profile_urn_id = ? ORDER BY taken_at, id",
+            (profile_urn_id,),
+        )
+        return [dict(row) for row in rows]
+
+    def _ids(self, snapshot_id: int) -> List[int]:
+        row = self.fetchone(
+            "SELECT members FROM snapshots WHERE id = ?", (snapshot_id,)
+        )
+        if row is None:
+            raise KeyError(f"No snapshot {snapshot_id}")
+        return decode_ids(row["members"])
+
+    def members(self, snapshot_id: int) -> List[str]:
+        """Return the URN IDs in a snapshot."""
+        return self._urn_ids(self._ids(snapshot_id))
+
+    def diff(self, old_snapshot_id: int, new_snapshot_id: int) -> Dict[str, List[str]]:
+        """Compare two snapshots.
+
+        :return: Dict with the URN IDs ``added`` and ``removed`` between
+            the old and the new snapshot
+        :rtype: dict
+        """
+        old = self._ids(old_snapshot_id)
+        new = self._ids(new_snapshot_id)
+        old_set = set(old)
+        new_set = set(new)
+        return {
+            "added": self._urn_ids([i for i in new if i not in old_set]),
+            "removed": self._urn_ids([i for i in old if i not in new_set]),
+        }
+
+    def diff_latest(self, profile_urn_id: str) -> Optional[Dict[str, List[str]]]:
+        """Compare a profile's two most recent snapshots.
+
+        :return: As :meth:`diff`, or None if there are fewer than two snapshots
+        :rtype: dict
+        """
+        history = self.snapshots(profile_urn_id)
+        if len(history) < 2:
+            return None
+        return self.diff(history[-2]["id"], history[-1]["id"])
+
+
+def snapshot_connections(
+    api, store: SnapshotStore, urn_id: str, **kwargs
+) -> Optional[Dict]:
+    """Enumerate a profile's connections, store them and diff with the last snapshot.
+
+    :param api: Authenticated Linkedin instance
+    :type api: Linkedin
+    :param store: Snapshot store
+    :type store: SnapshotStore
+    :param urn_id: URN ID of the profile
+    :type urn_id: str
+    :param kwargs: Passed on to :meth:`Linkedin.get_profile_connections`
+
+    :return: Dict with the new ``snapshot_id`` and the URN IDs ``added`` and
+        ``removed`` since the previous snapshot (everyone is ``added`` the
+        first time), or None if no connections were found while the previous
+        snapshot had some. A failed enumeration also comes back empty, so it
+        is not stored.
+    :rtype: dict
+    """
+    connections = api.get_profile_connections(urn_id, **kwargs)
+    if not connections:
+        history = store.snapshots(urn_id)
+        if history and history[-1]["size"]:
+            logger.info(
+                f"No connections found for {urn_id}, keeping the previous snapshot"
+            )
+            return None
+    snapshot_id = store.save(urn_id, (c["urn_id"] for c in connections))
+    changes = store.diff_latest(urn_id) or {
+        "added": store.members(snapshot_id),
+        "removed": [],
+    }
+    return dict(changes, snapshot_id=snapshot_id)
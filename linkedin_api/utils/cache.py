@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache(object):
+    """
+    Thread-safe, size-bounded cache whose entries expire after a time-to-live.
+
+    When full, the least recently used entry is evicted. Expired entries are
+    dropped lazily, when they are looked up or evicted.
+
+    :param maxsize: Maximum number of entries
+    :type maxsize: int, optional
+    :param ttl: Default time-to-live of an entry, in seconds. None means entries
+        never expire.
+    :type ttl: float, optional
+    :param timer: Clock used for expiry, in seconds
+    :type timer: callable, optional
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value cached for ``key``, or ``default`` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._timer():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING):
+        """Cache ``value`` for ``key``.
+
+        :param ttl: Time-to-live of this entry, in seconds. Defaults to the
+            cache's ``ttl``.
+        :type ttl: float, optional
+        """
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = self._timer() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` and return its value, or ``default`` if absent."""
+        with self._lock:
+            entry = self._entries.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
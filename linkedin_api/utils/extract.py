@@ -0,0 +1,209 @@
+"""
+Declarative field extraction from nested Voyager payloads.
+
+Instead of walking payloads with chains of ``(d.get(...) or {}).get(...)``,
+declare the fields of a result type once as paths and compile them::
+
+    PERSON = Extractor(
+        {
+            "name": "title.text",
+            "distance": "entityCustomTrackingInfo.memberDistance",
+            "urn_id": ("entityUrn", urn_to_id),
+        }
+    )
+    people = PERSON.many(elements)
+
+Path syntax, segments separated by dots:
+
+- ``key``: a dict key
+- ``key[0]``, ``key[-1]``: a list index, after a key or on its own (``[0]``)
+- ``["key.with.dots"]``: a dict key containing dots or brackets
+- ``{com.linkedin.Type}``: a ``$type`` guard. The path yields nothing unless
+  the current value's ``$type`` (or ``_type``) is the given type.
+- ``a.b | c.d``: alternatives, the first path yielding a value wins
+
+A path that runs into a missing key, an out-of-range index, a None or a value
+of the wrong shape yields the default (None) instead of raising.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+_TOKEN = re.compile(
+    r"""
+    \{(?P<guard>[^}]+)\}
+    | \[(?P<index>-?\d+)\]
+    | \["(?P<quoted>[^"]*)"\]
+    | (?P<key>[^.\[\]{}|\s]+)
+    | (?P<dot>\.)
+    """,
+    re.VERBOSE,
+)
+
+_NOT_FOUND = (KeyError, IndexError, TypeError, AttributeError)
+
+
+class _Guard(object):
+    __slots__ = ("type",)
+
+    def __init__(self, type_: str):
+        self.type = type_
+
+
+def parse_path(path: str) -> Tuple:
+    """Split a single path into its steps: keys, indices and ``$type`` guards.
+
+    :raises ValueError: if the path is malformed
+    """
+    steps: List[Any] = []
+    position = 0
+    path = path.strip()
+    while position < len(path):
+        match = _TOKEN.match(path, position)
+        if match is None:
+            raise ValueError(f"Invalid path {path!r} at position {position}")
+        position = match.end()
+        if match.group("guard") is not None:
+            steps.append(_Guard(match.group("guard")))
+        elif match.group("index") is not None:
+            steps.append(int(match.group("index")))
+        elif match.group("quoted") is not None:
+            steps.append(match.group("quoted"))
+        elif match.group("key") is not None:
+            steps.append(match.group("key"))
+    return tuple(steps)
+
+
+def _is_plain(steps: Tuple) -> bool:
+    return not any(isinstance(step, _Guard) for step in steps)
+
+
+def _subscripts(steps: Tuple) -> str:
+    return "".join(f"[{step!r}]" for step in steps)
+
+
+def _compile_steps(steps: Tuple) -> Callable[[Any], Any]:
+    if _is_plain(steps):
+        # The common case: plain lookups, each of which may fail
+        namespace = {"_NOT_FOUND": _NOT_FOUND}
+        exec(
+            "def get(obj):\n"
+            "    try:\n"
+            f"        return obj{_subscripts(steps)}\n"
+            "    except _NOT_FOUND:\n"
+            "        return None\n",
+            namespace,
+        )
+        return namespace["get"]
+
+    def get_guarded(obj):
+        try:
+            for step in steps:
+                if step.__class__ is _Guard:
+                    if (obj.get("$type") or obj.get("_type")) != step.type:
+                        return None
+                else:
+                    obj = obj[step]
+        except _NOT_FOUND:
+            return None
+        return obj
+
+    return get_guarded
+
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """Compile a path (see the module docstring) into an accessor function.
+
+    :param path: Path, possibly with ``|`` alternatives
+    :type path: str
+
+    :return: Function taking a payload and returning the value at ``path``,
+        or None
+    :rtype: callable
+    """
+    accessors = [_compile_steps(parse_path(p)) for p in path.split(" | ")]
+    if len(accessors) == 1:
+        return accessors[0]
+
+    def get_first(obj):
+        for accessor in accessors:
+            value = accessor(obj)
+            if value is not None:
+                return value
+        return None
+
+    return get_first
+
+
+FieldSpec = Union[str, Tuple[str, Callable[[Any], Any]]]
+
+
+class Extractor(object):
+    """
+    Fields of one result type, compiled into a single generated function
+    that reads plain paths with inlined subscripts.
+
+    :param fields: Output field names mapped to a path, or to a
+        ``(path, convert)`` tuple. ``convert`` is only called on values that
+        were found.
+    :type fields: dict
+    :param type: Only accept payloads with this ``$type`` (or ``_type``);
+        :meth:`many` skips the others and calling the extractor on one
+        returns None.
+    :type type: str, optional
+    """
+
+    def __init__(self, fields: Dict[str, FieldSpec], type: Optional[str] = None):
+        self.type = type
+        self.fields = dict(fields)
+        self._extract = self._compile()
+
+    def _compile(self) -> Callable[[Any], Dict]:
+        # Generate one function with every plain path inlined as subscripts;
+        # guarded paths and alternatives call their compiled accessor.
+        namespace: Dict[str, Any] = {"_NOT_FOUND": _NOT_FOUND}
+        lines = ["def extract(obj):"]
+        for i, (name, spec) in enumerate(self.fields.items()):
+            path, convert = (spec, None) if isinstance(spec, str) else spec
+            steps = parse_path(path) if " | " not in path else None
+            if steps is not None and _is_plain(steps):
+                lines += [
+                    "    try:",
+                    f"        v{i} = obj{_subscripts(steps)}",
+                    "    except _NOT_FOUND:",
+                    f"        v{i} = None",
+                ]
+            else:
+                namespace[f"get{i}"] = compile_path(path)
+                lines.append(f"    v{i} = get{i}(obj)")
+            if convert is not None:
+                namespace[f"convert{i}"] = convert
+                lines += [
+                    f"    if v{i} is not None:",
+                    f"        v{i} = convert{i}(v{i})",
+                ]
+        items = ", ".join(f"{name!r}: v{i}" for i, name in enumerate(self.fields))
+        lines.append(f"    return {{{items}}}")
+        exec("\n".join(lines) + "\n", namespace)
+        return namespace["extract"]
+
+    def _accepts(self, obj) -> bool:
+        return (
+            self.type is None
+            or isinstance(obj, dict)
+            and (obj.get("$type") or obj.get("_type")) == self.type
+        )
+
+    def __call__(self, obj) -> Optional[Dict]:
+        """Extract the fields of one payload."""
+        if not self._accepts(obj):
+            return None
+        return self._extract(obj)
+
+    def many(self, objs: Iterable) -> List[Dict]:
+        """Extract the fields of every accepted payload in ``objs``."""
+        extract = self._extract
+        if self.type is None:
+            return [extract(obj) for obj in objs]
+        accepts = self._accepts
+        return [extract(obj) for obj in objs if accepts(obj)]
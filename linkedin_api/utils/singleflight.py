@@ -0,0 +1,65 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call(object):
+    """An in-flight call and its eventual outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Any = None
+
+
+class SingleFlight(object):
+    """
+    Coalesce concurrent calls that share a key into a single execution.
+
+    While a call for a given key is in flight, later callers with the same key
+    block until it finishes and receive its result (or its exception) instead
+    of running the function again. Once the call completes the key is
+    forgotten, so nothing is cached beyond the lifetime of the call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless a call for ``key`` is already in flight.
+
+        :param key: Canonical key identifying the call
+        :type key: hashable
+        :param fn: Zero-argument callable to run
+        :type fn: callable
+
+        :return: Result of ``fn``, shared by every caller of the same flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,72 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, List, Optional
+
+import linkedin_api.settings as settings
+
+
+def default_db_path(filename: str) -> str:
+    """Return the default location of a store's database file."""
+    return os.path.join(settings.DATA_PATH, filename)
+
+
+class SQLiteStore(object):
+    """
+    Base class for local stores backed by a single SQLite database.
+
+    One connection is shared by every thread, serialised by a lock. File
+    databases use write-ahead logging so a crash never leaves a half-written
+    transaction behind. Subclasses declare their tables in ``SCHEMA``.
+
+    :param path: Path of the database file, or ``":memory:"``
+    :type path: str
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements atomically.
+
+        Yields the connection; the transaction is committed when the block
+        exits and rolled back if it raises.
+        """
+        with self._lock:
+            with self._conn:
+                yield self._conn
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        """Run one statement in its own transaction and return all result rows."""
+        with self.transaction() as conn:
+            return conn.execute(sql, tuple(params)).fetchall()
+
+    def execute_many(self, sql: str, seq_of_params: Iterable[Iterable[Any]]):
+        """Run one statement for every parameter set, in a single transaction."""
+        with self.transaction() as conn:
+            conn.executemany(sql, seq_of_params)
+
+    def fetchone(self, sql: str, params: Iterable[Any] = ()) -> Optional[sqlite3.Row]:
+        """Run one statement and return its first result row, if any."""
+        rows = self.execute(sql, params)
+        return rows[0] if rows else None
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,174 @@
+import re
+from urllib.parse import unquote
+
+from linkedin_api import Linkedin
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def _ids(uri):
+    return unquote(re.search(r"ids=List\(([^)]*)\)", uri).group(1)).split(",")
+
+
+def test_batch_get_splits_oversize_batches_and_reports_errors(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    requests = []
+
+    def _fetch(uri, **kwargs):
+        ids = _ids(uri)
+        requests.append(ids)
+        if len(ids) > 2:
+            return FakeResponse(414)
+        if "5" in ids:
+            return FakeResponse(500)
+        return FakeResponse(
+            200,
+            {
+                "results": {i: {"id": i} for i in ids if i != "2"},
+                "errors": {"2": {"status": 403}} if "2" in ids else {},
+            },
+        )
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+
+    results, _, errors = api._batch_get("/things", ["1", "2", "3", "4", "5", "1"])
+
+    assert requests == [
+        ["1", "2", "3", "4", "5"],
+        ["1", "2"],
+        ["3", "4", "5"],
+        ["3"],
+        ["4", "5"],
+    ]
+    assert sorted(results) == ["1", "3"]
+    assert errors == {"2": {"status": 403}, "4": 500, "5": 500}
+
+
+def test_batch_get_stops_when_batches_are_rejected(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    requests = []
+
+    def _fetch(uri, **kwargs):
+        requests.append(_ids(uri))
+        return FakeResponse(400)
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+
+    results, _, errors = api._batch_get(
+        "/things", [str(i) for i in range(20)], batch_size=8
+    )
+
+    assert len(requests) == 1
+    assert results == {}
+    assert errors == {str(i): Linkedin._BATCH_REJECTED for i in range(20)}
+
+
+def test_get_companies_batches_numeric_ids(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    requests = []
+
+    def _fetch(uri, **kwargs):
+        requests.append(uri)
+        return FakeResponse(
+            200, {"results": {i: {"name": f"Co {i}"} for i in _ids(uri) if i != "2"}}
+        )
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+    monkeypatch.setattr(api, "get_company", lambda public_id: {"name": public_id})
+
+    companies = api.get_companies(["1", "2", "acme"])
+
+    assert len(requests) == 1
+    assert "decorationId=" in requests[0]
+    assert companies == {"1": {"name": "Co 1"}, "2": {}, "acme": {"name": "acme"}}
+
+
+def test_get_profiles_v2_resolves_normalized_results(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+
+    def _fetch(uri, **kwargs):
+        urns = _ids(uri)
+        return FakeResponse(
+            200,
+            {
+                "data": {"results": {urns[0]: urns[0]}, "errors": {}},
+                "included": [
+                    {
+                        "$type": "com.linkedin.voyager.dash.common.Industry",
+                        "entityUrn": "urn:li:fsd_industry:2",
+                        "name": "Other",
+                    },
+                    {
+                        "$type": "com.linkedin.voyager.dash.common.Industry",
+                        "entityUrn": "urn:li:fsd_industry:1",
+                        "name": "Software",
+                    },
+                    {
+                        "entityUrn": urns[0],
+                        "firstName": "Ada",
+                        "*industry": "urn:li:fsd_industry:1",
+                    },
+                ],
+            },
+        )
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+
+    profiles = api.get_profiles_v2(["A", "B"])
+
+    assert profiles["A"]["firstName"] == "Ada"
+    assert profiles["A"]["industryName"] == "Software"
+    assert profiles["B"] == {}
+
+
+def test_get_profiles_v2_does_not_borrow_another_members_industry(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+
+    def _fetch(uri, **kwargs):
+        return FakeResponse(
+            200,
+            {
+                "data": {"results": {u: u for u in _ids(uri)}, "errors": {}},
+                "included": [
+                    {
+                        "$type": "com.linkedin.voyager.dash.common.Industry",
+                        "entityUrn": "urn:li:fsd_industry:1",
+                        "name": "Software",
+                    },
+                    {
+                        "entityUrn": "urn:li:fsd_profile:A",
+                        "*industry": "urn:li:fsd_industry:1",
+                    },
+                    {"entityUrn": "urn:li:fsd_profile:B"},
+                ],
+            },
+        )
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+
+    profiles = api.get_profiles_v2(["A", "B"])
+
+    assert profiles["A"]["industryName"] == "Software"
+    assert "industryName" not in profiles["B"]
+
+
+def test_get_jobs_accepts_a_generator(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+
+    def _fetch(uri, **kwargs):
+        return FakeResponse(
+            200, {"results": {i: {"title": f"Job {i}"} for i in _ids(uri)}}
+        )
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+
+    jobs = api.get_jobs(job_id for job_id in (1, 2))
+
+    assert jobs == {"1": {"title": "Job 1"}, "2": {"title": "Job 2"}}
@@ -0,0 +1,36 @@
+from linkedin_api.utils.cache import TTLCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, timer=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=None)
+
+    clock.now = 9
+    assert cache.get("a") == 1
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get("b") == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import requests
+
+from linkedin_api.client import Client
+
+
+def mock_cookies(jsessionid="ajax:1234"):
+    jar = requests.cookies.RequestsCookieJar()
+    jar.set("JSESSIONID", jsessionid)
+    jar.set("li_at", "token")
+    return jar
+
+
+def session_in_thread(client):
+    sessions = []
+    t = threading.Thread(target=lambda: sessions.append(client.session))
+    t.start()
+    t.join()
+    return sessions[0]
+
+
+def test_sessions_are_per_thread_and_share_cookies():
+    client = Client()
+    client._set_session_cookies(mock_cookies())
+
+    other = session_in_thread(client)
+
+    assert other is not client.session
+    assert other.cookies is client.session.cookies
+    assert other.headers["csrf-token"] == "ajax:1234"
+
+
+def test_cookie_refresh_reaches_existing_sessions():
+    client = Client(proxies={"https": "http://proxy:3128"})
+    client._set_session_cookies(mock_cookies())
+    session = client.session
+
+    client._set_session_cookies(mock_cookies("ajax:5678"))
+
+    assert client.session is session
+    assert session.headers["csrf-token"] == "ajax:5678"
+    assert session.cookies["JSESSIONID"] == "ajax:5678"
+    assert session.proxies["https"] == "http://proxy:3128"
+
+
+def test_max_concurrency_bounds_request_slots():
+    client = Client(max_concurrency=2)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def work():
+        with client.request_slot():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) == 2
@@ -0,0 +1,116 @@
+import logging
+
+from linkedin_api import Linkedin
+from linkedin_api.experiences import parse_experiences
+
+GROUP = "urn:li:fsd_profilePositionGroup:(ACoAA1,G1)"
+PAGED = f"urn:li:fsd_profilePagedListComponent:(ACoAA1,EXPERIENCE-VIEW-DETAILS,{GROUP},NONE,en_US)"
+
+
+def _position(title, subtitle, caption="Jan 2020 - Present · 4 yrs"):
+    return {
+        "components": {
+            "entityComponent": {
+                "titleV2": {"text": {"text": title}},
+                "subtitle": {"text": subtitle} if subtitle else None,
+                "metadata": {"text": "Berlin"},
+                "caption": {"text": caption},
+                "subComponents": None,
+            }
+        }
+    }
+
+
+def _payload(group_total=None):
+    group_header = {
+        "components": {
+            "entityComponent": {
+                "titleV2": {"text": {"text": "Acme"}},
+                "subtitle": {"text": "Full-time · 6 yrs"},
+                "caption": {"text": "Berlin, Germany"},
+                "subComponents": {
+                    "components": [{"components": {"*pagedListComponent": PAGED}}]
+                },
+            }
+        }
+    }
+    group = {
+        "entityUrn": PAGED,
+        "components": {"elements": [_position("Lead", "Full-time")]},
+    }
+    if group_total:
+        group["components"]["paging"] = {"start": 0, "count": 1, "total": group_total}
+    return {
+        "included": [
+            {
+                "components": {
+                    "elements": [
+                        _position("Engineer", "Initech · Contract"),
+                        group_header,
+                    ]
+                }
+            },
+            {"entityUrn": "urn:li:fsd_profileCard:(ACoAA1,OTHER,en_US)"},
+            group,
+        ]
+    }
+
+
+def test_parse_experiences_flattens_position_groups():
+    items = parse_experiences(_payload())
+
+    assert items[0]["companyName"] == "Initech"
+    assert items[0]["employmentType"] == "Contract"
+    assert items[0]["startDate"] == "Jan 2020"
+    assert items[0]["endDate"] == "Present"
+    assert items[0]["duration"] == "4 yrs"
+    assert items[1]["title"] == "Lead"
+    assert items[1]["companyName"] == "Acme"
+    assert items[1]["employmentType"] == "Full-time"
+    assert items[1]["locationName"] == "Berlin, Germany"
+
+
+def test_parse_experiences_pages_through_long_groups():
+    pages = []
+
+    def fetch_page(paged_list_urn, start):
+        pages.append((paged_list_urn, start))
+        return [_position(f"Role {start}", "Part-time")]
+
+    items = parse_experiences(_payload(group_total=3), fetch_page=fetch_page)
+
+    assert pages == [(PAGED, 1), (PAGED, 2)]
+    assert [i["title"] for i in items] == ["Engineer", "Lead", "Role 1", "Role 2"]
+
+
+def test_get_profiles_experiences_fetches_concurrently(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+
+    def get_profile_experiences(urn_id):
+        if urn_id == "B":
+            raise RuntimeError("boom")
+        return [{"title": urn_id}]
+
+    monkeypatch.setattr(api, "get_profile_experiences", get_profile_experiences)
+
+    assert api.get_profiles_experiences(["A", "B", "A"]) == {
+        "A": [{"title": "A"}],
+        "B": None,
+    }
+
+
+def test_fetch_experience_page_warns_when_paging_fails(monkeypatch, caplog):
+    api = Linkedin("test", "test", authenticate=False)
+
+    class Response(object):
+        status_code = 200
+
+        def json(self):
+            return {"errors": [{"message": "unknown queryId"}], "included": []}
+
+    monkeypatch.setattr(api, "_fetch", lambda uri, **kwargs: Response())
+
+    with caplog.at_level(logging.WARNING):
+        assert api._fetch_experience_page(PAGED, 5) == []
+
+    assert "unknown queryId" in caplog.text
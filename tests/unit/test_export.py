@@ -0,0 +1,93 @@
+import pytest
+
+from linkedin_api import Linkedin
+from linkedin_api.export import ConversationExporter
+
+pa = pytest.importorskip("pyarrow")
+
+MAILBOX = "ACoAAMailbox"
+
+
+def make_api(monkeypatch, n_conversations, page_size=3):
+    api = Linkedin("test", "test", authenticate=False)
+
+    def get_conversations_v3(mailbox_urn, next_cursor=None, categories=None):
+        start = int(next_cursor or 0)
+        end = min(start + page_size, n_conversations)
+        return {
+            "conversations": [
+                {
+                    "conversation_urn": f"urn:li:msg_conversation:({MAILBOX},2-{n})",
+                    "thread_id": f"2-{n}",
+                    "read": n % 2 == 0,
+                    "unread_count": n % 2,
+                    "last_activity_at": 1770000000000 + n,
+                    "participants": [{"urn_id": f"ACoAAPerson{n % 2}"}],
+                    "last_message": {"text": f"last {n}"},
+                }
+                for n in range(start, end)
+            ],
+            "next_cursor": str(end) if end < n_conversations else None,
+        }
+
+    def get_thread_v2(mailbox_urn, messaging_thread_urn):
+        sender = f"urn:li:fsd_profile:ACoAAPerson{int(messaging_thread_urn[2:]) % 2}"
+        return {
+            "data": {
+                "messengerMessagesBySyncToken": {
+                    "elements": [
+                        {
+                            "entityUrn": f"urn:li:msg_message:{messaging_thread_urn}-{i}",
+                            "sender": {"hostIdentityUrn": sender},
+                            "body": {"text": f"message {i}"},
+                            "deliveredAt": 1770000000000 + i,
+                        }
+                        for i in range(2)
+                    ]
+                }
+            }
+        }
+
+    monkeypatch.setattr(api, "get_conversations_v3", get_conversations_v3)
+    monkeypatch.setattr(api, "get_thread_v2", get_thread_v2)
+    return api
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_export_writes_chunked_files(monkeypatch, tmp_path, fmt):
+    api = make_api(monkeypatch, n_conversations=7)
+    exporter = ConversationExporter(api, MAILBOX, chunk_size=4)
+    conversations_path = str(tmp_path / f"conversations.{fmt}")
+    messages_path = str(tmp_path / f"messages.{fmt}")
+
+    counts = exporter.export(conversations_path, messages_path, format=fmt)
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        conversations = pq.read_table(conversations_path)
+        messages = pq.read_table(messages_path)
+        assert pq.ParquetFile(messages_path).num_row_groups == 4
+    else:
+        conversations = pa.ipc.open_file(conversations_path).read_all()
+        messages = pa.ipc.open_file(messages_path).read_all()
+
+    assert counts == {"conversations": 7, "messages": 14}
+    assert conversations.num_rows == 7
+    assert conversations.column("participant_urn_ids").to_pylist()[:2] == [
+        ["ACoAAPerson0"],
+        ["ACoAAPerson1"],
+    ]
+    assert messages.num_rows == 14
+    assert messages.column("thread_id").to_pylist()[:3] == ["2-0", "2-0", "2-1"]
+    assert set(messages.column("sender_urn_id").to_pylist()) == {
+        "ACoAAPerson0",
+        "ACoAAPerson1",
+    }
+
+
+def test_export_rejects_unknown_format(monkeypatch, tmp_path):
+    exporter = ConversationExporter(make_api(monkeypatch, 1), MAILBOX)
+
+    with pytest.raises(ValueError):
+        exporter.export(str(tmp_path / "out.csv"), format="csv")
@@ -0,0 +1,70 @@
+import pytest
+
+from linkedin_api.utils.extract import Extractor, compile_path, parse_path
+
+PAYLOAD = {
+    "$type": "com.linkedin.Job",
+    "title": {"text": "Engineer"},
+    "images": [{"url": "a"}, {"url": "b"}],
+    "details": {
+        "com.linkedin.jobs.Company": {
+            "$type": "com.linkedin.jobs.Company",
+            "name": "Acme",
+        }
+    },
+    "apply": {"easyApplyUrl": "https://apply"},
+    "missing": None,
+}
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("title.text", "Engineer"),
+        ("images[1].url", "b"),
+        ("images[-1].url", "b"),
+        ("images[5].url", None),
+        ('details.["com.linkedin.jobs.Company"].name', "Acme"),
+        (
+            'details.["com.linkedin.jobs.Company"].{com.linkedin.jobs.Company}.name',
+            "Acme",
+        ),
+        ('details.["com.linkedin.jobs.Company"].{com.linkedin.Other}.name', None),
+        ("apply.companyApplyUrl | apply.easyApplyUrl", "https://apply"),
+        ("missing.text", None),
+        ("title.text.more", None),
+        ("title[0]", None),
+    ],
+)
+def test_compile_path(path, expected):
+    assert compile_path(path)(PAYLOAD) == expected
+
+
+def test_parse_path_rejects_malformed_paths():
+    assert parse_path("a[0].b") == ("a", 0, "b")
+    with pytest.raises(ValueError):
+        parse_path("a[x]")
+
+
+def test_extractor_applies_converters_and_type_filter():
+    extractor = Extractor(
+        {
+            "title": "title.text",
+            "image_count": ("images", len),
+            "company": 'details.["com.linkedin.jobs.Company"].name',
+            "salary": ("salary.amount", int),
+        },
+        type="com.linkedin.Job",
+    )
+
+    assert extractor(PAYLOAD) == {
+        "title": "Engineer",
+        "image_count": 2,
+        "company": "Acme",
+        "salary": None,
+    }
+    assert extractor({"$type": "com.linkedin.Other"}) is None
+    assert (
+        extractor.many([PAYLOAD, {"_type": "x"}, None, PAYLOAD])
+        == [extractor(PAYLOAD)] * 2
+    )
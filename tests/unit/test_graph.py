@@ -0,0 +1,86 @@
+import gzip
+
+from linkedin_api.graph import DONE, FAILED, ConnectionGraphCrawler, GraphStore
+
+GRAPH = {
+    "a": ["b", "c"],
+    "b": ["a", "d"],
+    "c": ["d", "e"],
+    "d": ["f"],
+}
+
+
+class FakeApi(object):
+    def __init__(self, fail=(), empty=()):
+        self.calls = []
+        self.fail = set(fail)
+        # times each profile comes back empty, as a failed search does
+        self.empty = dict(empty)
+
+    def get_profile_connections(self, urn_id, limit=None):
+        self.calls.append(urn_id)
+        if urn_id in self.fail:
+            raise RuntimeError("boom")
+        if self.empty.get(urn_id):
+            self.empty[urn_id] -= 1
+            return []
+        return [{"urn_id": i} for i in GRAPH.get(urn_id, [])][:limit]
+
+
+def test_crawl_expands_breadth_first_up_to_max_depth():
+    api = FakeApi()
+    crawler = ConnectionGraphCrawler(api, GraphStore(":memory:"), max_depth=2)
+
+    nodes = list(crawler.crawl(["a"]))
+
+    assert [(n["urn_id"], n["depth"]) for n in nodes][0] == ("a", 0)
+    assert sorted(api.calls) == ["a", "b", "c"]
+    assert crawler.store.neighbors("c") == ["d", "e"]
+    assert crawler.store.neighbors("d") is None
+    assert crawler.store.counts() == {DONE: 3}
+
+
+def test_crawl_resumes_and_respects_fanout(tmp_path):
+    path = str(tmp_path / "graph.sqlite3")
+    api = FakeApi()
+    crawler = ConnectionGraphCrawler(
+        api, GraphStore(path), max_depth=3, max_fanout=1, max_attempts=2
+    )
+
+    assert len(list(crawler.crawl(["a"], max_nodes=1))) == 1
+
+    resumed = ConnectionGraphCrawler(
+        api, GraphStore(path), max_depth=3, max_fanout=1, max_attempts=2
+    )
+    list(resumed.crawl())
+
+    assert api.calls == ["a", "b"]
+    assert resumed.store.neighbors("b") == ["a"]
+
+    out = str(tmp_path / "edges.txt.gz")
+    assert resumed.store.write_adjacency(out) == 2
+    with gzip.open(out, "rt") as f:
+        assert f.read() == "a b\nb a\n"
+
+
+def test_failed_fetches_are_retried_then_given_up():
+    api = FakeApi(fail=["a"])
+    crawler = ConnectionGraphCrawler(
+        api, GraphStore(":memory:"), max_depth=2, max_attempts=2
+    )
+
+    assert list(crawler.crawl(["a"])) == []
+    assert api.calls == ["a", "a"]
+    assert crawler.store.counts() == {FAILED: 1}
+
+    # empty results are retried too, and kept once attempts run out
+    api = FakeApi(empty={"b": 1, "c": 5})
+    crawler = ConnectionGraphCrawler(
+        api, GraphStore(":memory:"), max_depth=1, max_attempts=2
+    )
+
+    nodes = {n["urn_id"]: n["connections"] for n in crawler.crawl(["a", "b", "c"])}
+
+    assert sorted(api.calls) == ["a", "b", "b", "c", "c"]
+    assert nodes == {"a": ["b", "c"], "b": ["a", "d"], "c": []}
+    assert crawler.store.counts() == {DONE: 3}
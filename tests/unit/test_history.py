@@ -0,0 +1,49 @@
+from linkedin_api.history import (
+    DELTA,
+    FULL,
+    ProfileHistory,
+    apply_delta,
+    diff_documents,
+)
+
+
+def test_diff_and_apply_delta_round_trip():
+    old = {"headline": "A", "geo": {"city": "Berlin", "zip": "1"}, "skills": [1]}
+    new = {"headline": "B", "geo": {"city": "Berlin"}, "skills": [1, 2], "x": None}
+
+    delta = diff_documents(old, new)
+
+    assert apply_delta(old, delta) == new
+    assert old["geo"] == {"city": "Berlin", "zip": "1"}
+    assert delta["unset"] == [["geo", "zip"]]
+
+
+def test_history_rebuilds_versions_from_keyframes_and_deltas():
+    history = ProfileHistory(":memory:", keyframe_interval=3)
+    documents = [{"headline": f"Role {i}", "name": "Ada"} for i in range(5)]
+    for week, document in enumerate(documents):
+        history.record("A", document, taken_at=week * 7)
+
+    assert history.record("A", documents[-1], taken_at=35) is None
+    assert [v["kind"] for v in history.versions("A")] == [
+        FULL,
+        DELTA,
+        DELTA,
+        FULL,
+        DELTA,
+    ]
+    assert [history.get("A", v) for v in range(1, 6)] == documents
+    assert history.as_of("A", 15) == documents[2]
+    assert history.as_of("A", -1) is None
+    assert history.latest("A") == documents[-1]
+
+
+def test_changed_since_lists_changed_field_paths():
+    history = ProfileHistory(":memory:")
+    history.record("A", {"headline": "A", "geo": {"city": "Berlin"}}, taken_at=1)
+    history.record("A", {"headline": "A", "geo": {"city": "Paris"}}, taken_at=2)
+    history.record("A", {"headline": "B", "geo": {"city": "Paris"}}, taken_at=3)
+
+    assert history.changed_since("A", 1) == ["geo.city", "headline"]
+    assert history.changed_since("A", 2) == ["headline"]
+    assert history.changed_since("A", 3) == []
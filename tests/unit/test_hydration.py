@@ -0,0 +1,61 @@
+from linkedin_api import Linkedin
+from linkedin_api.hydration import split_profile_identifier
+
+URN_ID = "ACoAABMCK14BZYQEFee5Ir7zBXRulzkHn_aCgio"
+
+
+def test_split_profile_identifier():
+    assert split_profile_identifier("billy-g") == ("public_id", "billy-g")
+    assert split_profile_identifier(URN_ID) == ("urn_id", URN_ID)
+    assert split_profile_identifier(f"urn:li:fsd_profile:{URN_ID}") == (
+        "urn_id",
+        URN_ID,
+    )
+
+
+def mock_api(monkeypatch, calls):
+    api = Linkedin("test", "test", authenticate=False)
+
+    def record(name, value):
+        def method(*args, **kwargs):
+            calls.append((name, args, kwargs))
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        return method
+
+    monkeypatch.setattr(api, "_resolve_public_id_to_urn", record("resolve", URN_ID))
+    monkeypatch.setattr(api, "get_profile_v2", record("profile", {"firstName": "B"}))
+    monkeypatch.setattr(api, "get_profile_experiences", record("experiences", [{}]))
+    monkeypatch.setattr(api, "get_profile_skills", record("skills", KeyError("x")))
+    monkeypatch.setattr(api, "get_profile_contact_info", record("contact", {"a": 1}))
+    return api
+
+
+def test_hydrate_profiles_chains_stages_and_captures_errors(monkeypatch):
+    calls = []
+    api = mock_api(monkeypatch, calls)
+
+    (record,) = list(api.hydrate_profiles(["billy-g"]))
+
+    assert record["input"] == "billy-g"
+    assert record["urn_id"] == URN_ID
+    assert record["profile"] == {"firstName": "B"}
+    assert record["experiences"] == [{}]
+    assert record["contact_info"] == {"a": 1}
+    assert record["skills"] is None
+    assert isinstance(record["errors"]["skills"], KeyError)
+    assert calls[0][0] == "resolve"
+
+
+def test_hydrate_profiles_uses_cache_and_selected_sections(monkeypatch):
+    calls = []
+    api = mock_api(monkeypatch, calls)
+
+    list(api.hydrate_profiles(["billy-g"], sections=["profile"]))
+    (record,) = list(api.hydrate_profiles([URN_ID], sections=["profile"]))
+
+    assert record["profile"] == {"firstName": "B"}
+    assert "experiences" not in record
+    assert [name for name, _, _ in calls] == ["resolve", "profile"]
@@ -0,0 +1,216 @@
+from linkedin_api import Linkedin
+from linkedin_api.inbox import InboxStore, InboxSync
+
+MAILBOX = "ACoAAMailbox"
+
+
+def conversation(n, activity, read=True, unread_count=0):
+    return {
+        "conversation_urn": f"urn:li:msg_conversation:({MAILBOX},{n})",
+        "thread_id": str(n),
+        "read": read,
+        "unread_count": unread_count,
+        "last_activity_at": activity,
+        "participants": [],
+        "last_message": {"text": f"message {n}"},
+    }
+
+
+def make_sync(monkeypatch, inbox, page_size=2):
+    """Serve ``inbox`` (most recent first) through a fake get_conversations_v3."""
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+
+    def get_conversations_v3(mailbox_urn, count, next_cursor, categories):
+        start = int(next_cursor or 0)
+        calls.append(start)
+        page = inbox[start : start + page_size]
+        more = start + page_size < len(inbox)
+        return {
+            "conversations": page,
+            "next_cursor": str(start + page_size) if more else None,
+        }
+
+    monkeypatch.setattr(api, "get_conversations_v3", get_conversations_v3)
+    return InboxSync(api, MAILBOX, store=InboxStore(":memory:")), calls
+
+
+def test_first_sync_pulls_whole_inbox(monkeypatch):
+    inbox = [conversation(n, 100 - n) for n in range(5)]
+    sync, calls = make_sync(monkeypatch, inbox)
+
+    delta = sync.sync()
+
+    assert delta["pages"] == 3
+    assert len(delta["new"]) == 5
+    assert len(sync.store.get_conversations(MAILBOX)) == 5
+    assert sync.store.get_watermark(MAILBOX, "PRIMARY_INBOX") == 100
+
+
+def test_later_sync_stops_at_seen_activity_and_reports_deltas(monkeypatch):
+    inbox = [conversation(n, 100 - n) for n in range(6)]
+    sync, calls = make_sync(monkeypatch, inbox)
+    sync.sync()
+    calls.clear()
+
+    inbox[:] = [
+        conversation(9, 200),
+        conversation(3, 150),
+        conversation(0, 100, read=False, unread_count=1),
+    ] + [c for c in inbox if c["thread_id"] not in ("0", "3")]
+    delta = sync.sync()
+
+    assert calls == [0, 2]
+    assert [c["thread_id"] for c in delta["new"]] == ["9"]
+    assert [c["thread_id"] for c in delta["updated"]] == ["3"]
+    assert [c["thread_id"] for c in delta["read_changed"]] == ["0"]
+    assert sync.store.get_watermark(MAILBOX, "PRIMARY_INBOX") == 200
+    unread = sync.store.get_conversations(MAILBOX, unread_only=True)
+    assert [c["thread_id"] for c in unread] == ["0"]
+
+
+def test_interrupted_sync_does_not_advance_watermark(monkeypatch):
+    inbox = [conversation(n, 100 - n) for n in range(5)]
+    sync, calls = make_sync(monkeypatch, inbox)
+
+    delta = sync.sync(max_pages=1)
+
+    assert delta["pages"] == 1
+    assert sync.store.get_watermark(MAILBOX, "PRIMARY_INBOX") is None
+    assert len(sync.sync()["new"]) == 3
+
+
+def test_interrupted_sync_resumes_where_it_stopped(monkeypatch):
+    inbox = [conversation(n, 1000 - n) for n in range(100)]
+    sync, calls = make_sync(monkeypatch, inbox, page_size=10)
+
+    for _ in range(3):
+        sync.sync(count=10, max_pages=3)
+    assert sync.store.get_watermark(MAILBOX, "PRIMARY_INBOX") is None
+    assert calls == list(range(0, 90, 10))
+
+    # New activity during the catch-up is picked up once it completes
+    inbox.insert(0, conversation(100, 2000))
+    calls.clear()
+    delta = sync.sync(count=10, max_pages=3)
+    assert calls[0] == 90
+    assert sync.store.get_watermark(MAILBOX, "PRIMARY_INBOX") == 1000
+    assert len(sync.store.get_conversations(MAILBOX)) == 100
+
+    calls.clear()
+    delta = sync.sync(count=10, max_pages=3)
+    assert calls == [0]
+    assert [c["thread_id"] for c in delta["new"]] == ["100"]
+    assert sync.store.get_watermark(MAILBOX, "PRIMARY_INBOX") == 2000
+
+
+def thread_response(elements, sync_token, clear=False, deleted=()):
+    return {
+        "data": {
+            "messengerMessagesBySyncToken": {
+                "metadata": {
+                    "newSyncToken": sync_token,
+                    "deletedUrns": list(deleted),
+                    "shouldClearCache": clear,
+                },
+                "elements": elements,
+            }
+        }
+    }
+
+
+def message_element(n, sender=MAILBOX):
+    return {
+        "entityUrn": f"urn:li:msg_message:({MAILBOX},{n})",
+        "backendConversationUrn": "urn:li:messagingThread:2-thread",
+        "sender": {"hostIdentityUrn": f"urn:li:fsd_profile:{sender}"},
+        "body": {"text": f"message {n}"},
+        "deliveredAt": n,
+        "originToken": None,
+    }
+
+
+def test_thread_sync_passes_sync_token_and_returns_new_messages(monkeypatch):
+    sync, _ = make_sync(monkeypatch, [])
+    responses = [
+        thread_response([message_element(2), message_element(1)], "t1", clear=True),
+        thread_response([message_element(3, sender="ACoAAOther")], "t2"),
+    ]
+    tokens = []
+
+    def get_thread_v2(mailbox_urn, messaging_thread_urn, sync_token=None):
+        tokens.append(sync_token)
+        return responses.pop(0)
+
+    monkeypatch.setattr(sync.api, "get_thread_v2", get_thread_v2)
+
+    first = sync.sync_thread("2-thread")
+    second = sync.sync_thread("2-thread")
+
+    assert tokens == [None, "t1"]
+    assert [m["text"] for m in first["messages"]] == ["message 1", "message 2"]
+    assert second["messages"] == [
+        {
+            "message_urn": f"urn:li:msg_message:({MAILBOX},3)",
+            "thread_id": "2-thread",
+            "sender_urn_id": "ACoAAOther",
+            "is_from_me": False,
+            "text": "message 3",
+            "delivered_at": 3,
+            "origin_token": None,
+        }
+    ]
+    assert len(sync.store.get_messages("2-thread")) == 3
+
+
+def test_thread_sync_applies_deletions(monkeypatch):
+    sync, _ = make_sync(monkeypatch, [])
+    deleted = f"urn:li:msg_message:({MAILBOX},1)"
+    responses = [
+        thread_response([message_element(1), message_element(2)], "t1", clear=True),
+        thread_response([], "t2", deleted=[deleted]),
+    ]
+    monkeypatch.setattr(
+        sync.api, "get_thread_v2", lambda *args, **kwargs: responses.pop(0)
+    )
+
+    sync.sync_thread("2-thread")
+    delta = sync.sync_thread("2-thread")
+
+    assert delta == {"messages": [], "deleted": [deleted]}
+    assert [m["text"] for m in sync.store.get_messages("2-thread")] == ["message 2"]
+
+
+def test_search_messages_indexes_synced_messages(monkeypatch):
+    store = InboxStore(":memory:")
+    participant = {"urn_id": "ACoAAJane", "firstName": "Jane", "lastName": "Doe"}
+    participant["headline"] = "Head of Procurement"
+    store.save_conversations(
+        MAILBOX,
+        [dict(conversation(1, 100), thread_id="2-a", participants=[participant])],
+    )
+    messages = [
+        {
+            "message_urn": f"urn:{n}",
+            "sender_urn_id": "ACoAAJane",
+            "is_from_me": False,
+            "text": text,
+            "delivered_at": n,
+            "origin_token": None,
+        }
+        for n, text in enumerate(["Here is the invoice", "Contract draft attached"])
+    ]
+    store.apply_thread_changes(MAILBOX, "2-a", messages, [], "t1", replace=True)
+
+    assert [m["message_urn"] for m in store.search_messages("invoice")] == ["urn:0"]
+    assert store.search_messages("invoice")[0]["snippet"] == "Here is the [invoice]"
+    assert len(store.search_messages("participants: procurement")) == 2
+
+    edited = dict(messages[0], text="Here is the receipt")
+    store.apply_thread_changes(MAILBOX, "2-a", [edited], ["urn:1"], "t2")
+    assert store.search_messages("invoice") == []
+    assert store.search_messages("contract") == []
+    assert [m["message_urn"] for m in store.search_messages("receipt")] == ["urn:0"]
+
+    store.rebuild_search_index()
+    assert len(store.search_messages("jane")) == 1
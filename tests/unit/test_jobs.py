@@ -0,0 +1,233 @@
+from linkedin_api import Linkedin
+from linkedin_api.jobs import JobGridCrawler, JobWatcher, JobWatchStore
+from linkedin_api.search_sharding import SEARCH_RESULT_CAP
+
+
+def posting(n):
+    return {
+        "$type": "com.linkedin.voyager.dash.jobs.JobPosting",
+        "entityUrn": f"urn:li:fsd_jobPosting:{n}",
+        "title": f"Job {n}",
+    }
+
+
+class Clock(object):
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_watcher_narrows_window_and_reports_only_new_postings(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+    listings = [[posting(1), posting(2)], [posting(2), posting(3)]]
+
+    def search_jobs(listed_at, **query):
+        calls.append((listed_at, query))
+        return listings.pop(0)
+
+    monkeypatch.setattr(api, "search_jobs", search_jobs)
+    clock = Clock()
+    watcher = JobWatcher(api, store=JobWatchStore(":memory:"), slack=60, timer=clock)
+
+    first = watcher.poll(keywords="python", location_name="Berlin")
+    clock.now += 600
+    second = watcher.poll(keywords="python", location_name="Berlin")
+
+    assert [j["title"] for j in first] == ["Job 1", "Job 2"]
+    assert [j["title"] for j in second] == ["Job 3"]
+    assert calls[0] == (24 * 60 * 60, {"keywords": "python", "location_name": "Berlin"})
+    assert calls[1][0] == 660
+
+
+def test_watcher_keeps_queries_apart_and_caps_window(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    windows = []
+
+    def search_jobs(listed_at, **query):
+        windows.append(listed_at)
+        return [posting(1)]
+
+    monkeypatch.setattr(api, "search_jobs", search_jobs)
+    clock = Clock()
+    watcher = JobWatcher(
+        api, store=JobWatchStore(":memory:"), max_window=3600, timer=clock
+    )
+
+    results = dict(
+        (q["keywords"], jobs)
+        for q, jobs in watcher.poll_many([{"keywords": "a"}, {"keywords": "b"}])
+    )
+    clock.now += 10 * 24 * 60 * 60
+    later = watcher.poll(keywords="a")
+
+    assert [len(jobs) for jobs in results.values()] == [1, 1]
+    assert windows[-1] == 3600
+    # the old sighting is older than the window and has been dropped
+    assert len(later) == 1
+
+
+def test_watcher_keeps_window_after_empty_result(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    windows = []
+    listings = [[posting(1)], [], [posting(1), posting(2)]]
+
+    def search_jobs(listed_at, **query):
+        windows.append(listed_at)
+        return listings.pop(0)
+
+    monkeypatch.setattr(api, "search_jobs", search_jobs)
+    clock = Clock()
+    watcher = JobWatcher(api, store=JobWatchStore(":memory:"), slack=0, timer=clock)
+
+    watcher.poll(keywords="a")
+    clock.now += 600
+    assert watcher.poll(keywords="a") == []
+    clock.now += 600
+    third = watcher.poll(keywords="a")
+
+    # the failed-looking poll did not move the window past its gap
+    assert windows[1:] == [600, 1200]
+    assert [j["title"] for j in third] == ["Job 2"]
+
+
+def test_search_jobs_stops_after_a_short_page(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    uris = []
+
+    class Response(object):
+        def json(self):
+            return {"included": [posting(n) for n in range(3)]}
+
+    def _fetch(uri, **kwargs):
+        uris.append(uri)
+        return Response()
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+
+    jobs = api.search_jobs(keywords="python")
+
+    assert len(jobs) == 3
+    assert len(uris) == 1
+
+
+def test_grid_plans_cartesian_product():
+    cells = JobGridCrawler.plan(
+        keywords=["python", "go"],
+        location_names=["Berlin"],
+        filters={"remote": ["1", "2"]},
+        listed_at=3600,
+    )
+
+    assert len(cells) == 4
+    assert cells[0] == {
+        "keywords": "python",
+        "location_name": "Berlin",
+        "remote": ["1"],
+        "listed_at": 3600,
+    }
+
+
+def test_grid_shards_capped_cells_and_dedupes(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    queries = []
+
+    def search_jobs(**query):
+        queries.append(query)
+        if "experience" not in query:
+            return [posting(n) for n in range(SEARCH_RESULT_CAP)]
+        # every experience level also returns posting 0, already seen
+        level = int(query["experience"][0])
+        return [posting(0), posting(SEARCH_RESULT_CAP + level)]
+
+    monkeypatch.setattr(api, "search_jobs", search_jobs)
+    monkeypatch.setattr(
+        api, "get_jobs", lambda ids, **kwargs: {i: {"title": f"Job {i}"} for i in ids}
+    )
+    monkeypatch.setattr(api, "get_job_skills", lambda job_id: {})
+
+    records = list(
+        JobGridCrawler(api, concurrency=2).crawl(keywords=["python"], hydrate=True)
+    )
+
+    assert len(queries) == 1 + 6
+    assert len(records) == len({r["job_id"] for r in records}) == SEARCH_RESULT_CAP + 6
+    assert records[-1]["job"]["title"] == f"Job {records[-1]['job_id']}"
+    assert records[-1]["query"]["experience"] in [[str(i)] for i in range(1, 7)]
+
+
+def test_hydrate_jobs_batches_details_and_caches(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    batches = []
+    skills_calls = []
+
+    def get_jobs(ids, **kwargs):
+        batches.append(list(ids))
+        return {
+            i: {
+                "title": f"Job {i}",
+                "formattedLocation": "Berlin",
+                "companyDetails": {
+                    "com.linkedin.voyager.deco.jobs.web.shared.WebJobPostingCompany": {
+                        "companyResolutionResult": {"name": "Acme"}
+                    }
+                },
+            }
+            for i in ids
+            if i != "4"
+        }
+
+    def get_job_skills(job_id):
+        skills_calls.append(job_id)
+        return {"skillMatchStatuses": [{"localizedSkillDisplayName": "Python"}]}
+
+    monkeypatch.setattr(api, "get_jobs", get_jobs)
+    monkeypatch.setattr(api, "get_job_skills", get_job_skills)
+    api.job_hydrator.batch_size = 2
+
+    first = {r["job_id"]: r for r in api.hydrate_jobs(["1", "2", "3", "4"])}
+    again = list(api.hydrate_jobs(["1", "4"]))
+
+    assert sorted(map(sorted, batches)) == [["1", "2"], ["3", "4"], ["4"]]
+    assert first["1"]["company_name"] == "Acme"
+    assert first["1"]["skills"] == ["Python"]
+    assert first["4"]["title"] is None
+    # "1" came from the cache; "4" had no details and was fetched again
+    assert sorted(r["job_id"] for r in again) == ["1", "4"]
+    assert sorted(skills_calls) == ["1", "2", "3", "4", "4"]
+
+
+def test_hydrate_jobs_falls_back_to_single_gets_when_batches_are_rejected(
+    monkeypatch,
+):
+    api = Linkedin("test", "test", authenticate=False)
+    batch_requests = []
+    single_gets = []
+
+    class Rejected(object):
+        status_code = 400
+
+    def _fetch(uri, **kwargs):
+        batch_requests.append(uri)
+        return Rejected()
+
+    def get_job(job_id):
+        single_gets.append(job_id)
+        return {"title": f"Job {job_id}"}
+
+    monkeypatch.setattr(api, "_fetch", _fetch)
+    monkeypatch.setattr(api, "get_job", get_job)
+    monkeypatch.setattr(api, "get_job_skills", lambda job_id: {})
+    api.job_hydrator.batch_size = 2
+
+    first = {r["job_id"]: r for r in api.hydrate_jobs(["1", "2", "3", "4"])}
+    api.job_hydrator.cache.clear()
+    list(api.hydrate_jobs(["1", "2", "5"]))
+
+    # one rejected batch per batch task in flight, none after that
+    assert 1 <= len(batch_requests) <= 2
+    assert not api._job_batches_supported
+    assert first["3"]["title"] == "Job 3"
+    assert sorted(single_gets) == ["1", "1", "2", "2", "3", "4", "5"]
@@ -0,0 +1,44 @@
+import json
+from urllib.parse import unquote
+
+from linkedin_api import Linkedin
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        if self._data is None:
+            raise ValueError("No JSON body")
+        return self._data
+
+
+def test_mark_conversations_as_read_batches_and_reports_per_entity(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    urns = [f"urn:li:msg_conversation:(urn:li:fsd_profile:me,2-{n})" for n in range(5)]
+    posts = []
+
+    def _post(uri, data=None, **kwargs):
+        batch = list(json.loads(data)["entities"])
+        posts.append((unquote(uri), batch))
+        if len(posts) == 1:
+            return FakeResponse(200, {"results": {}, "errors": {batch[1]: {}}})
+        if len(posts) == 2:
+            return FakeResponse(200)
+        return FakeResponse(500)
+
+    monkeypatch.setattr(api, "_post", _post)
+
+    results = api.mark_conversations_as_read_v2(urns + urns[:1], batch_size=2)
+
+    assert [batch for _, batch in posts] == [urns[0:2], urns[2:4], urns[4:]]
+    assert posts[0][0].endswith(f"ids=List({urns[0]},{urns[1]})")
+    assert results == {
+        urns[0]: False,
+        urns[1]: True,
+        urns[2]: False,
+        urns[3]: False,
+        urns[4]: True,
+    }
@@ -0,0 +1,59 @@
+from linkedin_api import Linkedin
+from linkedin_api.organizations import compact_organization
+
+
+def _company(urn_id, name):
+    return {
+        "entityUrn": f"urn:li:fs_normalized_company:{urn_id}",
+        "universalName": name,
+        "name": name.title(),
+        "companyIndustries": [{"localizedName": "Software Development"}],
+        "followingInfo": {
+            "following": False,
+            "followerCount": 10,
+            "dashFollowingStateUrn": f"urn:li:fsd_followingState:urn:li:fsd_company:{urn_id}",
+        },
+        "confirmedLocations": [{"city": "Berlin"}] * 100,
+    }
+
+
+def test_compact_organization_keeps_a_small_projection():
+    entry = compact_organization(_company("1", "acme"))
+
+    assert entry["urn_id"] == "1"
+    assert entry["industries"] == ["Software Development"]
+    assert "confirmedLocations" not in entry
+
+
+def test_organization_cache_serves_names_and_ids_locally(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    fetched = []
+
+    def get_companies(ids):
+        fetched.append(list(ids))
+        return {i: _company("1", "acme") if i in ("1", "acme") else {} for i in ids}
+
+    monkeypatch.setattr(api, "get_companies", get_companies)
+
+    assert api.organizations.get_company("acme")["name"] == "Acme"
+    assert api.organizations.get_companies(["1", "ACME", "2"])["1"]["name"] == "Acme"
+    assert api.organizations.get_company("2") == {}
+    assert fetched == [["acme"], ["2"], ["2"]]
+
+
+def test_follow_company_updates_cached_follow_state(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    api.organizations.put(_company("1", "acme"))
+    state_urn = "urn:li:fsd_followingState:urn:li:fsd_company:1"
+
+    class Response(object):
+        status_code = 200
+
+    monkeypatch.setattr(api, "_post", lambda *args, **kwargs: Response())
+
+    assert api.follow_company(state_urn) is False
+    assert api.organizations.get_company("1")["following"] is True
+    assert api.organizations.get_company("1")["follower_count"] == 11
+
+    api.unfollow_entity("urn:li:company:1")
+    assert api.organizations.get_company("acme")["following"] is False
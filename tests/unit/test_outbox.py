@@ -0,0 +1,79 @@
+import pytest
+
+from linkedin_api import Linkedin
+from linkedin_api.outbox import FAILED, PENDING, SENT, Outbox, OutboxSender
+
+CONVERSATION = "urn:li:msg_conversation:(urn:li:fsd_profile:me,2-abc)"
+
+
+def test_enqueue_is_idempotent_per_origin_token():
+    outbox = Outbox(":memory:")
+
+    token = outbox.enqueue("hello", conversation_urn=CONVERSATION, origin_token="t")
+    outbox.enqueue("hello again", conversation_urn=CONVERSATION, origin_token="t")
+
+    assert token == "t"
+    assert outbox.counts() == {PENDING: 1}
+    assert outbox.get("t")["body"] == "hello"
+    with pytest.raises(ValueError):
+        outbox.enqueue("nobody")
+
+
+def test_drain_reuses_origin_token_across_retries(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    outbox = Outbox(":memory:")
+    failing = outbox.enqueue("hi", conversation_urn=CONVERSATION)
+    new = outbox.enqueue("hello", recipients=["ACoAAOther"])
+    sent = []
+    outcomes = {failing: [True, True]}
+
+    def send_message_v2(body, mailbox_urn, conversation_urn, origin_token):
+        sent.append(origin_token)
+        return outcomes[origin_token].pop(0)
+
+    def send_message(body, recipients, origin_token):
+        sent.append(origin_token)
+        return False
+
+    monkeypatch.setattr(api, "send_message_v2", send_message_v2)
+    monkeypatch.setattr(api, "send_message", send_message)
+    sender = OutboxSender(api, "me", outbox=outbox, max_attempts=2)
+
+    first = {m["origin_token"]: m for m in sender.drain()}
+    second = list(sender.drain())
+
+    assert first[new]["status"] == SENT
+    assert first[failing]["status"] == PENDING
+    assert [m["status"] for m in second] == [FAILED]
+    assert sent.count(failing) == 2
+    assert outbox.get(failing)["attempts"] == 2
+    assert list(sender.drain()) == []
+
+
+def test_interrupted_send_is_resent_with_same_token(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    outbox = Outbox(":memory:")
+    token = outbox.enqueue("hi", conversation_urn=CONVERSATION)
+    outbox.mark_sending(token)  # crashed before recording the result
+    tokens = []
+    monkeypatch.setattr(
+        api, "send_message_v2", lambda *args, **kwargs: tokens.append(kwargs) or False
+    )
+
+    results = list(OutboxSender(api, "me", outbox=outbox).drain())
+
+    assert [r["status"] for r in results] == [SENT]
+    assert tokens[0]["origin_token"] == token
+
+
+def test_send_interrupted_on_last_attempt_is_marked_failed(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    outbox = Outbox(":memory:")
+    token = outbox.enqueue("hi", conversation_urn=CONVERSATION)
+    for _ in range(3):
+        outbox.mark_sending(token)  # the last attempt crashed
+    monkeypatch.setattr(api, "send_message_v2", lambda *args, **kwargs: False)
+
+    assert list(OutboxSender(api, "me", outbox=outbox, max_attempts=3).drain()) == []
+    assert outbox.get(token)["status"] == FAILED
+    assert outbox.counts() == {FAILED: 1}
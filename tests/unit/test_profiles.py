@@ -0,0 +1,79 @@
+from linkedin_api.profiles import (
+    CHANGED,
+    NEW,
+    ProfileRefresher,
+    ProfileStore,
+    changed_fields,
+    content_hash,
+)
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.profiles = {
+            "A": {"urn_id": "A", "headline": "Engineer", "versionTag": "1"},
+            "B": {"urn_id": "B", "headline": "Designer", "versionTag": "1"},
+        }
+        self.section_calls = []
+
+    def get_profiles_v2(self, urn_ids):
+        return {
+            i: dict(self.profiles[i], img_100_100=f"https://img/{i}?e=now")
+            for i in urn_ids
+        }
+
+    def get_profile_skills(self, urn_id):
+        self.section_calls.append(urn_id)
+        return [{"name": "Python"}]
+
+
+def test_refresh_skips_unchanged_version_tags_and_reports_real_changes():
+    api = FakeApi()
+    refresher = ProfileRefresher(api, ProfileStore(":memory:"), sections=["skills"])
+
+    first = list(refresher.refresh(["A", "B"]))
+    assert {e["urn_id"]: e["change"] for e in first} == {"A": NEW, "B": NEW}
+    assert first[0]["document"]["skills"] == [{"name": "Python"}]
+
+    api.section_calls.clear()
+    api.profiles["A"] = dict(api.profiles["A"], headline="Manager", versionTag="2")
+    api.profiles["B"] = dict(api.profiles["B"], versionTag="2")
+
+    events = list(refresher.refresh(["A", "B"]))
+
+    assert [(e["urn_id"], e["change"]) for e in events] == [("A", CHANGED)]
+    assert events[0]["changed_fields"] == ["headline"]
+    assert sorted(api.section_calls) == ["A", "B"]
+
+    api.section_calls.clear()
+    assert list(refresher.refresh(["A", "B"])) == []
+    assert api.section_calls == []
+    assert refresher.stats["skipped"] == 2
+
+
+def test_failed_sections_leave_the_stored_state_untouched():
+    api = FakeApi()
+
+    def get_profile_skills(urn_id):
+        raise RuntimeError("boom")
+
+    api.get_profile_skills = get_profile_skills
+    store = ProfileStore(":memory:")
+    refresher = ProfileRefresher(api, store, sections=["skills"])
+
+    assert list(refresher.refresh(["A"])) == []
+    assert refresher.stats["failed"] == 1
+    assert store.get("A") is None
+
+
+def test_any_picture_size_is_ignored_by_content_hash():
+    old = {
+        "urn_id": "A",
+        "headline": "Engineer",
+        "img_364_364": "https://media.licdn.com/a.jpg?e=1700000000&t=old",
+    }
+    new = dict(old, img_364_364="https://media.licdn.com/a.jpg?e=1800000000&t=new")
+
+    assert content_hash(old) == content_hash(new)
+    assert changed_fields(old, new) == []
+    assert changed_fields(old, dict(new, headline="CTO")) == ["headline"]
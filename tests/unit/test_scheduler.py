@@ -0,0 +1,72 @@
+import threading
+import time
+
+from linkedin_api import Linkedin
+from linkedin_api.scheduler import RateLimiter, Scheduler
+
+
+def test_rate_limiter_spaces_calls_across_threads():
+    limiter = RateLimiter(requests_per_minute=60 * 50)  # one call every 20ms
+    stamps = []
+    lock = threading.Lock()
+
+    def work():
+        limiter.acquire()
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=work) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stamps.sort()
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    assert min(gaps) >= 0.015
+
+
+def test_scheduler_captures_errors_per_item():
+    def fn(x):
+        if x == 3:
+            raise ValueError(x)
+        return x * 10
+
+    results = dict(Scheduler(concurrency=3).map(fn, range(6)))
+
+    assert isinstance(results.pop(3), ValueError)
+    assert results == {0: 0, 1: 10, 2: 20, 4: 40, 5: 50}
+
+
+def test_scheduler_ordered_and_bounded():
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def fn(x):
+        with lock:
+            active.append(x)
+            peak.append(len(active))
+        time.sleep(0.01 * (5 - x % 5))
+        with lock:
+            active.remove(x)
+        return x
+
+    pairs = list(Scheduler(concurrency=2).map(fn, iter(range(10)), ordered=True))
+
+    assert [i for i, _ in pairs] == list(range(10))
+    assert max(peak) <= 2
+
+
+def test_linkedin_map_dispatches_inputs(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    monkeypatch.setattr(api, "get_company", lambda public_id: {"name": public_id})
+    monkeypatch.setattr(
+        api, "get_profile_v2", lambda public_id=None, urn_id=None: urn_id
+    )
+
+    companies = dict(api.map("get_company", ["a", "b"], concurrency=2))
+    profiles = list(api.map("get_profile_v2", [{"urn_id": "x"}, (None, "y")]))
+
+    assert companies == {"a": {"name": "a"}, "b": {"name": "b"}}
+    assert sorted(p for _, p in profiles) == ["x", "y"]
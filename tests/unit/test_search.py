@@ -0,0 +1,71 @@
+from linkedin_api import Linkedin
+
+
+def search_page(people):
+    """Build a search results page from ``(urn_id, member_distance)`` pairs."""
+    items = [
+        {
+            "_type": "com.linkedin.voyager.dash.search.SearchItem",
+            "item": {
+                "entityResult": {
+                    "_type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+                    "entityUrn": f"urn:li:fsd_entityResultViewModel:(urn:li:fsd_profile:{urn_id},SEARCH_SRP,DEFAULT)",
+                    "entityCustomTrackingInfo": {"memberDistance": distance},
+                }
+            },
+        }
+        for urn_id, distance in people
+    ]
+    return {
+        "elements": [
+            {
+                "_type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+                "items": items,
+            }
+        ]
+    }
+
+
+def make_api(monkeypatch, pages):
+    api = Linkedin("test", "test", authenticate=False)
+    starts = []
+
+    def _fetch_search_page(params, start):
+        starts.append(start)
+        return search_page(pages.get(start, []))
+
+    monkeypatch.setattr(api, "_fetch_search_page", _fetch_search_page)
+    return api, starts
+
+
+PAGES = {
+    0: [("p1", "OUT_OF_NETWORK"), ("p2", "DISTANCE_2"), ("p3", "OUT_OF_NETWORK")],
+    3: [("p4", "OUT_OF_NETWORK"), ("p5", "DISTANCE_3"), ("p6", "DISTANCE_2")],
+    6: [("p7", "DISTANCE_2")],
+}
+
+
+def test_search_people_limit_counts_filtered_results(monkeypatch):
+    api, starts = make_api(monkeypatch, PAGES)
+
+    results = api.search_people(keywords="x", limit=2)
+
+    assert [r["urn_id"] for r in results] == ["p2", "p5"]
+    assert starts == [0, 3]
+
+
+def test_search_people_filters_out_of_network_with_network_depths(monkeypatch):
+    api, _ = make_api(monkeypatch, PAGES)
+
+    results = api.search_people(keywords="x", network_depths=["F", "S"])
+
+    assert [r["urn_id"] for r in results] == ["p2", "p5", "p6", "p7"]
+
+
+def test_search_truncates_to_limit(monkeypatch):
+    api, starts = make_api(monkeypatch, PAGES)
+
+    results = api.search_people(keywords="x", include_private_profiles=True, limit=4)
+
+    assert [r["urn_id"] for r in results] == ["p1", "p2", "p3", "p4"]
+    assert starts == [0, 3]
@@ -0,0 +1,93 @@
+from linkedin_api import Linkedin
+from linkedin_api.search_sharding import SEARCH_RESULT_CAP, ShardedPeopleSearch
+
+# 3,000 people: region r<i> holds people whose number % 3 == i, and people
+# whose number % 10 == 0 are also listed in region r0 (an overlap)
+PEOPLE = range(3000)
+
+
+def matches(n, query):
+    regions = query.get("regions")
+    if regions and not any(
+        n % 3 == int(r[1:]) or (r == "r0" and n % 10 == 0) for r in regions
+    ):
+        return False
+    depths = query.get("network_depths")
+    return not depths or ("F" if n < 1500 else "S") in depths
+
+
+def make_api(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    probes = []
+
+    def search_people_total(**query):
+        probes.append(query)
+        return sum(1 for n in PEOPLE if matches(n, query))
+
+    def search_people(**query):
+        hits = [n for n in PEOPLE if matches(n, query)]
+        return [{"urn_id": f"p{n}"} for n in hits[:SEARCH_RESULT_CAP]]
+
+    monkeypatch.setattr(api, "search_people_total", search_people_total)
+    monkeypatch.setattr(api, "search_people", search_people)
+    return api, probes
+
+
+def test_plan_splits_until_shards_fit_under_cap(monkeypatch):
+    api, probes = make_api(monkeypatch)
+    sharder = ShardedPeopleSearch(api, facet_values={"regions": ["r0", "r1", "r2"]})
+
+    plan = sharder.plan(keywords="engineer")
+
+    # network depth O is empty and needs no region split
+    assert {tuple(s.query["network_depths"]) for s in plan.shards} == {("F",), ("S",)}
+    assert len(plan.shards) == 6
+    assert all(s.complete for s in plan.shards)
+    assert plan.total == 3000
+    assert plan.coverage == 1.0
+    assert all(q["keywords"] == "engineer" for q in probes)
+
+
+def test_run_dedupes_overlapping_shards(monkeypatch):
+    api, _ = make_api(monkeypatch)
+    sharder = ShardedPeopleSearch(api, facet_values={"regions": ["r0", "r1", "r2"]})
+    plan = sharder.plan()
+
+    people = list(sharder.run(plan))
+
+    assert len(people) == len({p["urn_id"] for p in people}) == 3000
+    assert plan.fetched == 3000
+    assert plan.duplicates == 200
+
+
+def test_plan_reports_shards_left_over_cap(monkeypatch):
+    api, _ = make_api(monkeypatch)
+
+    plan = ShardedPeopleSearch(api).plan(network_depths=["F"])
+
+    assert [s.total for s in plan.incomplete] == [1500]
+    assert plan.coverage == SEARCH_RESULT_CAP / 1500
+
+
+def test_search_people_total_reads_paging_total(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    urls = []
+
+    class Response(object):
+        def json(self):
+            return {
+                "data": {
+                    "searchDashClustersByAll": {
+                        "_type": "com.linkedin.restli.common.CollectionResponse",
+                        "paging": {"start": 0, "count": 10, "total": 4321},
+                        "elements": [],
+                    }
+                }
+            }
+
+    monkeypatch.setattr(api, "_fetch", lambda url: urls.append(url) or Response())
+
+    assert (
+        api.search_people_total(regions=["r1"], include_private_profiles=True) == 4321
+    )
+    assert "(key:geoUrn,value:List(r1))" in urls[0]
@@ -0,0 +1,69 @@
+from linkedin_api import Linkedin
+from linkedin_api.seen import PEOPLE, BloomFilter, SeenIndex
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"id-{i}")
+
+    assert all(f"id-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_seen_index_persists_per_entity_type(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    index = SeenIndex(path)
+    index.add("people", ["a", "b"])
+    index.close()
+
+    index = SeenIndex(path)
+
+    assert index.seen("people", ["a", "b", "c"]) == {"a", "b"}
+    assert ("jobs", "a") not in index
+    assert index.unseen(
+        "people", [{"id": "a"}, {"id": "c"}], key=lambda x: x["id"]
+    ) == [{"id": "c"}]
+
+
+def search_page(ids):
+    items = [
+        {
+            "_type": "com.linkedin.voyager.dash.search.SearchItem",
+            "item": {
+                "entityResult": {
+                    "_type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+                    "entityUrn": f"urn:li:fsd_entityResultViewModel:(urn:li:fsd_profile:{i},SEARCH_SRP,DEFAULT)",
+                }
+            },
+        }
+        for i in ids
+    ]
+    return {
+        "elements": [
+            {
+                "_type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+                "items": items,
+            }
+        ]
+    }
+
+
+def test_search_people_skips_seen_and_stops_on_known_page(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    index = SeenIndex(":memory:")
+    index.add(PEOPLE, ["p1", "p3", "p4", "p5"])
+    pages = {0: ["p1", "p2", "p3"], 3: ["p4", "p5"], 5: ["p6"]}
+    starts = []
+
+    def _fetch_search_page(params, start):
+        starts.append(start)
+        return search_page(pages.get(start, []))
+
+    monkeypatch.setattr(api, "_fetch_search_page", _fetch_search_page)
+
+    results = api.search_people(keywords="x", include_private_profiles=True, seen=index)
+
+    assert [r["urn_id"] for r in results] == ["p2"]
+    assert starts == [0, 3]
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from linkedin_api import Linkedin
+from linkedin_api.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", fn)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    while flight.in_flight() == 0:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+    assert flight.in_flight() == 0
+
+
+def test_error_is_raised_and_key_is_released():
+    flight = SingleFlight()
+
+    def boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", boom)
+
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+class MockResponse(object):
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def test_fetch_coalesces_identical_requests(monkeypatch):
+    api = Linkedin("test", "test", authenticate=False)
+    calls = []
+    release = threading.Event()
+
+    def get(session, url, **kwargs):
+        calls.append(url)
+        release.wait(5)
+        return MockResponse({"elements": [{"name": "LinkedIn"}]})
+
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                api._fetch(
+                    "/organization/companies",
+                    evade=lambda: None,
+                    params={"q": "universalName", "universalName": "linkedin"},
+                    coalesce=True,
+                ).json()
+            )
+        )
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    while api._inflight.in_flight() == 0:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
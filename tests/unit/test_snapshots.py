@@ -0,0 +1,80 @@
+import time
+
+from linkedin_api.snapshots import (
+    SnapshotStore,
+    decode_ids,
+    encode_ids,
+    snapshot_connections,
+)
+
+
+def test_encode_ids_round_trips_sorted_unique_ids():
+    ids = [5, 1, 900000, 1, 42]
+
+    assert decode_ids(encode_ids(ids)) == [1, 5, 42, 900000]
+    assert decode_ids(encode_ids([])) == []
+
+
+def test_diff_reports_added_and_removed_members():
+    store = SnapshotStore(":memory:")
+    old = store.save("me", ["a", "b", "c"], taken_at=1)
+    new = store.save("me", ["c", "d", "b", "e"], taken_at=2)
+
+    assert store.members(old) == ["a", "b", "c"]
+    assert store.diff(old, new) == {"added": ["d", "e"], "removed": ["a"]}
+    assert store.diff_latest("me") == store.diff(old, new)
+    assert [s["size"] for s in store.snapshots("me")] == [3, 4]
+
+
+def test_large_snapshots_are_compact_and_fast_to_diff():
+    store = SnapshotStore(":memory:")
+    members = [f"ACoAA{i:010d}" for i in range(30000)]
+    old = store.save("me", members)
+    new = store.save("me", members[100:] + ["ACoAAnew"])
+
+    started = time.perf_counter()
+    changes = store.diff(old, new)
+    elapsed = time.perf_counter() - started
+
+    assert changes["added"] == ["ACoAAnew"]
+    assert changes["removed"] == members[:100]
+    assert elapsed < 0.5
+    blob = store.fetchone("SELECT members FROM snapshots WHERE id = ?", (old,))
+    assert len(blob["members"]) < 2000
+
+
+def test_snapshot_connections_diffs_with_previous_snapshot():
+    class FakeApi(object):
+        connections = [["a", "b"], ["b", "c"]]
+
+        def get_profile_connections(self, urn_id, **kwargs):
+            return [{"urn_id": i} for i in self.connections.pop(0)]
+
+    api = FakeApi()
+    store = SnapshotStore(":memory:")
+
+    first = snapshot_connections(api, store, "me")
+    second = snapshot_connections(api, store, "me")
+
+    assert first["added"] == ["a", "b"] and first["removed"] == []
+    assert second["added"] == ["c"] and second["removed"] == ["a"]
+
+
+def test_snapshot_connections_skips_empty_enumeration():
+    class FakeApi(object):
+        connections = [[], ["a", "b"], [], ["b"]]
+
+        def get_profile_connections(self, urn_id, **kwargs):
+            return [{"urn_id": i} for i in self.connections.pop(0)]
+
+    api = FakeApi()
+    store = SnapshotStore(":memory:")
+
+    # an empty first snapshot is kept: there is nothing to contradict
+    assert snapshot_connections(api, store, "me")["added"] == []
+    assert snapshot_connections(api, store, "me")["added"] == ["a", "b"]
+    assert snapshot_connections(api, store, "me") is None
+    last = snapshot_connections(api, store, "me")
+
+    assert len(store.snapshots("me")) == 3
+    assert last["added"] == [] and last["removed"] == ["a"]